@@ -0,0 +1,122 @@
+import heapq
+import os
+import threading
+import time
+
+# ---------------------------
+# Persistent Quiz Leaderboard
+# ---------------------------
+# Every finished quiz is appended to quizResults.csv as "timestamp,difficulty,score".
+# The file is never rewritten; it is read once, on a background thread started
+# with load_async() (the quiz starts it when the first quiz begins), into:
+#   - a count of results per score for each difficulty. Scores run 0..100, so
+#     a rank is a sum over at most 101 buckets however many results there are
+#   - a bounded min-heap of the best TOP_K results per difficulty
+# Results recorded while the file is being read are kept aside and merged in
+# when the load finishes, so nothing is counted twice or lost. If the file
+# can't be read, rank() and top() raise that error instead of waiting forever.
+
+RESULTS_FILE = os.path.join(os.path.dirname(__file__), "quizResults.csv")
+TOP_K = 10
+
+
+class Leaderboard:
+    def __init__(self, path=RESULTS_FILE, top_k=TOP_K):
+        self.path = path
+        self.top_k = top_k
+        self.counts = {}      # difficulty -> {score: number of results}
+        self.best = {}        # difficulty -> min-heap of (score, timestamp), at most top_k long
+        self.lock = threading.Lock()
+        self.loaded = threading.Event()
+        self.started = False
+        self.read_upto = None     # file size when the load began; later results go to pending
+        self.pending = []
+        self.error = None         # set if the store could not be read; loaded is still set
+
+    @property
+    def ready(self):
+        return self.loaded.is_set()
+
+    def load_async(self):
+        """Start reading the store on a background thread (once)."""
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+        threading.Thread(target=self._load, name="leaderboard-load", daemon=True).start()
+
+    def _load(self):
+        counts, best = {}, {}
+        try:
+            self._read(counts, best)
+        except Exception as e:
+            # an unreadable store must not leave the results screen waiting forever
+            self.error = e
+            counts, best = {}, {}
+        with self.lock:
+            for difficulty, score, when in self.pending:
+                self._add(counts, best, difficulty, score, when)
+            self.counts, self.best, self.pending = counts, best, []
+            self.loaded.set()
+
+    def _read(self, counts, best):
+        with self.lock:
+            self.read_upto = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if self.read_upto:
+            pos = 0
+            with open(self.path, "rb") as f:
+                for line in f:
+                    pos += len(line)
+                    if pos > self.read_upto:
+                        break
+                    parts = line.split(b",")
+                    if len(parts) != 3:
+                        continue
+                    try:
+                        when, score = int(parts[0]), int(parts[2])
+                    except ValueError:
+                        continue
+                    self._add(counts, best, parts[1].decode("utf-8", "replace"), score, when)
+
+    def _ensure_loaded(self):
+        """Wait for the load; raises the error that stopped it, if any."""
+        self.load_async()
+        self.loaded.wait()
+        if self.error is not None:
+            raise self.error
+
+    def _add(self, counts, best, difficulty, score, when):
+        column = counts.setdefault(difficulty, {})
+        column[score] = column.get(score, 0) + 1
+        heap = best.setdefault(difficulty, [])
+        # newer results win ties, so the timestamp is part of the heap key
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, (score, when))
+        elif (score, when) > heap[0]:
+            heapq.heapreplace(heap, (score, when))
+
+    def record(self, difficulty, score, when=None):
+        """Append one finished quiz to the store and the in-memory counts; never waits for a load."""
+        when = int(time.time()) if when is None else when
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(f"{when},{difficulty},{score}\n")
+            if self.loaded.is_set():
+                self._add(self.counts, self.best, difficulty, score, when)
+            elif self.read_upto is not None:
+                self.pending.append((difficulty, score, when))
+            # otherwise the load has not begun and will read it from the file
+
+    def rank(self, difficulty, score):
+        """Return (rank, total) for a score; equal scores share the better rank."""
+        self._ensure_loaded()
+        with self.lock:
+            column = self.counts.get(difficulty, {})
+            better = sum(n for s, n in column.items() if s > score)
+            return better + 1, sum(column.values())
+
+    def top(self, difficulty):
+        """Best results for a difficulty, highest first, as (score, timestamp)."""
+        self._ensure_loaded()
+        with self.lock:
+            return sorted(self.best.get(difficulty, []), reverse=True)
@@ -1,7 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import random
-import time
+import os
+import sys
+
+from quizrules import MAX_QUESTIONS, QuizSession, grade
+
+# shared helpers (portfolioui.py) live in the portfolio folder one level up
+PORTFOLIO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO_DIR not in sys.path:
+    sys.path.insert(0, PORTFOLIO_DIR)
+from portfolioui import Toast, ensure_theme, get_font
+
+# ttk, messagebox, tkinter.font and the leaderboard are imported where first
+# needed so the menu can paint as early as possible
 
 # ---------------------------
 # Math Quiz Application
@@ -28,8 +38,6 @@ FONT_SUB = ("Segoe UI", 12)
 FONT_QUESTION = ("Segoe UI Variable", 28, "bold")
 FONT_BUTTON = ("Segoe UI", 12, "bold")
 
-MAX_QUESTIONS = 10
-
 # ---------------------------
 # Utility: Rounded Rectangle
 # ---------------------------
@@ -55,32 +63,43 @@ def _round_rect(canvas, x1, y1, x2, y2, r=24, **kwargs):
 # Main Application Class
 # ---------------------------
 class MathQuizApp:
-    def __init__(self, root):
+    def __init__(self, root, client=None):
         self.root = root
         self.root.title("Math Quiz")
         self.root.geometry(f"{WINDOW_W}x{WINDOW_H}")
         self.root.configure(bg=PALETTE["bg"])
         self.root.resizable(False, False)
 
-        # quiz state
-        self.difficulty = None
-        self.current_q = 0
-        self.attempt = 1
-        self.score = 0
-        self.num1 = 0
-        self.num2 = 0
-        self.operation = "+"
+        # quiz state (a local QuizSession, or a remote one when a quiz server client is given)
+        self.client = client
+        self.session = QuizSession(None)
         self.max_q = MAX_QUESTIONS
+        self.leaderboard = None
 
-        # styles
-        self.style = ttk.Style(self.root)
-        self.style.theme_use("clam")
-        self.style.configure("TProgressbar", troughcolor=PALETTE["soft"], background=PALETTE["accent2"], thickness=14)
-        self.style.configure("Round.TButton", borderwidth=0, focusthickness=0)
+        # ttk styles are only needed by the quiz screen, see _ensure_styles
+        self.style = None
+        # inline feedback that doesn't block answering (see portfolioui.Toast)
+        self.toast = Toast(self.root)
 
         # build menu screen by default
         self._build_menu()
 
+    # -----------------------
+    # Lazy styles / fonts
+    # -----------------------
+    def _ensure_styles(self):
+        if self.style is not None:
+            return
+        from tkinter import ttk
+        ensure_theme(self.root)
+        self.style = ttk.Style(self.root)
+        # own style names: configuring the base "TProgressbar" would restyle every app in the launcher
+        self.style.configure("Quiz.Horizontal.TProgressbar", troughcolor=PALETTE["soft"], background=PALETTE["accent2"], thickness=14)
+        self.style.configure("Round.TButton", borderwidth=0, focusthickness=0)
+
+    def _font(self, spec):
+        return get_font(self.root, spec)
+
     # -----------------------
     # Screen: Menu
     # -----------------------
@@ -90,12 +109,12 @@ class MathQuizApp:
         canvas.pack(fill="both", expand=True)
 
         # Title
-        canvas.create_text(WINDOW_W//2, 80, text="Math Quiz — Sharpen Your Skills", font=("Segoe UI Semibold", 32),
+        canvas.create_text(WINDOW_W//2, 80, text="Math Quiz — Sharpen Your Skills", font=self._font(("Segoe UI Semibold", 32)),
                            fill=PALETTE["white"])
 
         # Subtext
         canvas.create_text(WINDOW_W//2, 120, text="Pick a difficulty to begin (10 questions).",
-                           font=FONT_SUB, fill=PALETTE["muted"])
+                           font=self._font(FONT_SUB), fill=PALETTE["muted"])
 
         # Center card
         cx, cy = WINDOW_W//2, 330
@@ -107,17 +126,18 @@ class MathQuizApp:
         _round_rect(canvas, card_x1, card_y1, card_x2, card_y2, r=28, fill=PALETTE["card"], outline="")
 
         # Buttons row
-        btn_w = 200
-        spacing = 25
-        start_x = cx - (btn_w*3 + spacing*2)/2 + btn_w/2
+        btn_w = 145
+        spacing = 18
+        start_x = cx - (btn_w*4 + spacing*3)/2 + btn_w/2
 
         self._create_glow_button(canvas, start_x, cy, "Easy", lambda: self._start_quiz("easy"), btn_w, 56, accent=PALETTE["accent"])
         self._create_glow_button(canvas, start_x + (btn_w + spacing), cy, "Moderate", lambda: self._start_quiz("moderate"), btn_w, 56, accent=PALETTE["accent2"])
         self._create_glow_button(canvas, start_x + 2*(btn_w + spacing), cy, "Advanced", lambda: self._start_quiz("advanced"), btn_w, 56, accent=PALETTE["danger"])
+        self._create_glow_button(canvas, start_x + 3*(btn_w + spacing), cy, "Adaptive", lambda: self._start_quiz("adaptive"), btn_w, 56, accent=PALETTE["muted"])
 
         # footer small note
         canvas.create_text(WINDOW_W//2, WINDOW_H - 30, text="Professional Build • Clean Layout • Educational Focus",
-                           font=FONT_SUB, fill=PALETTE["muted"])
+                           font=self._font(FONT_SUB), fill=PALETTE["muted"])
 
     # -----------------------
     # Helper: glow button on canvas (rounded)
@@ -133,7 +153,7 @@ class MathQuizApp:
         # button rect
         rect = _round_rect(canvas, left, top, right, bottom, r=14, fill=PALETTE["soft"], outline="")
         # text
-        txt = canvas.create_text(cx, cy, text=text, font=FONT_BUTTON, fill=PALETTE["white"])
+        txt = canvas.create_text(cx, cy, text=text, font=self._font(FONT_BUTTON), fill=PALETTE["white"])
         # bind area (use an invisible rect for events)
         area = canvas.create_rectangle(left, top, right, bottom, outline="", fill="")
         canvas.tag_bind(area, "<Enter>", lambda e: self._on_button_hover(canvas, rect, glow, txt, enter=True, accent=accent))
@@ -160,26 +180,35 @@ class MathQuizApp:
     # Start quiz
     # -----------------------
     def _start_quiz(self, level):
-        self.difficulty = level
-        self.current_q = 0
-        self.attempt = 1
-        self.score = 0
+        # the session owns the question rules, scoring and adaptive estimates
+        self.session = self.client.start(level) if self.client else QuizSession(level)
+        self.max_q = self.session.max_q
+        # read past results in the background while the quiz is played
+        self._ensure_leaderboard().load_async()
         self._build_quiz_screen()
 
+    def _ensure_leaderboard(self):
+        if self.leaderboard is None:
+            from leaderboard import Leaderboard
+            self.leaderboard = Leaderboard()
+        return self.leaderboard
+
     # -----------------------
     # Build Quiz Screen
     # -----------------------
     def _build_quiz_screen(self):
+        from tkinter import ttk
+        self._ensure_styles()
         self._clear_root()
 
         # top progress area
         top_frame = tk.Frame(self.root, bg=PALETTE["bg"])
         top_frame.pack(fill="x", pady=(18,6))
 
-        title_lbl = tk.Label(top_frame, text="Math Quiz — Test Your Skills", bg=PALETTE["bg"], fg=PALETTE["white"], font=FONT_TITLE)
+        title_lbl = tk.Label(top_frame, text="Math Quiz — Test Your Skills", bg=PALETTE["bg"], fg=PALETTE["white"], font=self._font(FONT_TITLE))
         title_lbl.pack(side="left", padx=26)
 
-        self.score_lbl = tk.Label(top_frame, text=f"Score: {self.score}", bg=PALETTE["bg"], fg=PALETTE["muted"], font=FONT_SUB)
+        self.score_lbl = tk.Label(top_frame, text=f"Score: {self.session.score}", bg=PALETTE["bg"], fg=PALETTE["muted"], font=self._font(FONT_SUB))
         self.score_lbl.pack(side="right", padx=26)
 
         # center card
@@ -196,34 +225,35 @@ class MathQuizApp:
         q_area = tk.Frame(card_frame, bg=PALETTE["card"])
         q_area.place(relx=0.5, rely=0.18, anchor="n")
 
-        self.q_label = tk.Label(q_area, text="", font=FONT_QUESTION, bg=PALETTE["card"], fg=PALETTE["white"])
+        self.q_label = tk.Label(q_area, text="", font=self._font(FONT_QUESTION), bg=PALETTE["card"], fg=PALETTE["white"])
         self.q_label.pack()
 
         # entry
         entry_frame = tk.Frame(card_frame, bg=PALETTE["card"])
         entry_frame.place(relx=0.5, rely=0.48, anchor="n")
         self.answer_var = tk.StringVar()
-        self.answer_entry = tk.Entry(entry_frame, textvariable=self.answer_var, font=("Segoe UI", 20), width=8,
+        self.answer_entry = tk.Entry(entry_frame, textvariable=self.answer_var, font=self._font(("Segoe UI", 20)), width=8,
                                      justify="center", bd=0, highlightthickness=2, relief="flat", bg="#071018", fg=PALETTE["accent"], insertbackground="white")
         self.answer_entry.pack(ipady=10)
-        self.answer_entry.bind("<Return>", lambda e: self._submit_answer())
 
         # submit button (rounded)
         btn_canvas = tk.Canvas(card_frame, width=180, height=56, bg=PALETTE["card"], highlightthickness=0)
         btn_canvas.place(relx=0.5, rely=0.70, anchor="n")
         bx1, by1, bx2, by2 = 0, 0, 180, 56
         _round_rect(btn_canvas, bx1, by1, bx2, by2, r=14, fill=PALETTE["accent"], outline="")
-        btn_canvas.create_text(90, 28, text="Submit", font=FONT_BUTTON, fill="#0b1220")
-        btn_canvas.bind("<Button-1>", lambda e: self._submit_answer())
+        btn_canvas.create_text(90, 28, text="Submit", font=self._font(FONT_BUTTON), fill="#0b1220")
+        self.submit_btn = btn_canvas
+        # answering is switched on by _next_question once a question is showing
+        self._set_input(False)
 
         # progress / guidance area bottom of card
         bottom = tk.Frame(self.root, bg=PALETTE["bg"])
         bottom.pack(fill="x", pady=(6,18))
         # progress bar
-        self.progress = ttk.Progressbar(bottom, orient="horizontal", mode="determinate", maximum=self.max_q, length=600)
+        self.progress = ttk.Progressbar(bottom, orient="horizontal", mode="determinate", style="Quiz.Horizontal.TProgressbar", maximum=self.max_q, length=600)
         self.progress.pack(pady=6)
         # hint / attempt label
-        self.hint_lbl = tk.Label(bottom, text="You have 2 attempts per question", bg=PALETTE["bg"], fg=PALETTE["muted"], font=FONT_SUB)
+        self.hint_lbl = tk.Label(bottom, text="You have 2 attempts per question", bg=PALETTE["bg"], fg=PALETTE["muted"], font=self._font(FONT_SUB))
         self.hint_lbl.pack()
 
         # small control row
@@ -234,73 +264,67 @@ class MathQuizApp:
         # start first question
         self.root.after(120, self._next_question)    # small delay so UI renders first
 
-    # -----------------------
-    # Generate random ints based on difficulty
-    # -----------------------
-    def _rand_pair(self):
-        if self.difficulty == "easy":
-            return random.randint(1, 9), random.randint(1, 9)
-        elif self.difficulty == "moderate":
-            return random.randint(10, 99), random.randint(10, 99)
-        else:
-            return random.randint(1000, 9999), random.randint(1000, 9999)
-
-    def _rand_op(self):
-        return random.choice(["+", "-"])
-    
     # -----------------------
     # Move to next question
     # -----------------------
     def _next_question(self):
-        if self.current_q >= self.max_q:
+        text = self.session.next_question()
+        if text is None:
             self._show_results()
             return
-        self.current_q += 1
-        self.attempt = 1
         self.answer_var.set("")
+        self._set_input(True)
         self.answer_entry.focus_set()
 
-        self.num1, self.num2 = self._rand_pair()
-        self.operation = self._rand_op()
-
-        self.q_label.config(text=f"{self.num1}  {self.operation}  {self.num2}  =")
+        self.q_label.config(text=text)
         # animate small progress bump
-        self._animate_progress(self.current_q)
+        self._animate_progress(self.session.current_q)
         self._update_status_labels()
 
     # -----------------------
     # Submit answer logic
     # -----------------------
     def _submit_answer(self):
+        if self.session.resolved:
+            return      # already judged, the next question is on its way
         text = self.answer_var.get().strip()
         if text == "":
-            messagebox.showwarning("Input required", "Please enter an answer before submitting.")
+            self.toast.warning("Please enter an answer before submitting.")
             return
         # validate integer (allow negative)
         try:
             user = int(text)
         except ValueError:
-            messagebox.showwarning("Invalid", "Please enter an integer (e.g. -5, 12).")
+            self.toast.warning("Please enter an integer (e.g. -5, 12).")
             return
 
-        correct = self.num1 + self.num2 if self.operation == "+" else self.num1 - self.num2
-        if user == correct:
-            earned = 10 if self.attempt == 1 else 5
-            self.score += earned
+        status, earned, correct = self.session.submit(user)
+        if status == "correct":
+            self._set_input(False)
             self._show_correct_popup(earned)
             self._update_status_labels()
             # short delay then next
             self.root.after(650, self._next_question)
         else:
-            if self.attempt == 1:
-                self.attempt += 1
+            if status == "retry":
                 self.hint_lbl.config(text="Incorrect — one more attempt!", fg=PALETTE["danger"])
                 # keep on same question
             else:
-                # reveal and move on
-                messagebox.showinfo("Answer", f"Sorry — the correct answer was {correct}.")
+                # reveal and move on; no more answers until the next question is up
+                self._set_input(False)
+                self.toast.error(f"Sorry — the correct answer was {correct}.", duration=2500)
                 self.root.after(200, self._next_question)
 
+    def _set_input(self, enabled):
+        """Turn the answer entry, Enter key and Submit button on or off."""
+        self.answer_entry.config(state="normal" if enabled else "disabled")
+        if enabled:
+            self.answer_entry.bind("<Return>", lambda e: self._submit_answer())
+            self.submit_btn.bind("<Button-1>", lambda e: self._submit_answer())
+        else:
+            self.answer_entry.unbind("<Return>")
+            self.submit_btn.unbind("<Button-1>")
+
     # -----------------------
     # Progress Animation
     # -----------------------
@@ -335,8 +359,8 @@ class MathQuizApp:
         _round_rect(c, 0, 0, w, h, r=18, fill=PALETTE["card"], outline="")
 
         # content
-        c.create_text(w//2, 44, text="Correct!", font=("Segoe UI Semibold", 18), fill=PALETTE["accent2"])
-        c.create_text(w//2, 84, text=f"+{earned} points", font=("Segoe UI", 14), fill=PALETTE["white"])
+        c.create_text(w//2, 44, text="Correct!", font=self._font(("Segoe UI Semibold", 18)), fill=PALETTE["accent2"])
+        c.create_text(w//2, 84, text=f"+{earned} points", font=self._font(("Segoe UI", 14)), fill=PALETTE["white"])
 
         # small check icon drawn (circle + tick)
         cx = w - 48
@@ -367,8 +391,12 @@ class MathQuizApp:
     # Update Score / Hint / Clue Labels
     # -----------------------
     def _update_status_labels(self):
-        self.score_lbl.config(text=f"Score: {self.score}")
-        self.hint_lbl.config(text=f"Question {self.current_q}/{self.max_q} — Attempts left: {2 - (self.attempt - 1)}",fg=PALETTE["muted"])
+        session = self.session
+        self.score_lbl.config(text=f"Score: {session.score}")
+        text = f"Question {session.current_q}/{self.max_q} — Attempts left: {2 - (session.attempt - 1)}"
+        if session.level:
+            text += f" — Level {session.level}"
+        self.hint_lbl.config(text=text, fg=PALETTE["muted"])
 
     # -----------------------
     # Final results screen
@@ -376,37 +404,67 @@ class MathQuizApp:
     def _show_results(self):
         self._clear_root()
         # big card
-        frame = tk.Frame(self.root, bg=PALETTE["card"], width=760, height=420)
+        frame = tk.Frame(self.root, bg=PALETTE["card"], width=760, height=480)
         frame.place(relx=0.5, rely=0.5, anchor="center")
         frame.pack_propagate(False)
 
-        tk.Label(frame, text="Quiz Complete", font=("Segoe UI Semibold", 26), bg=PALETTE["card"], fg=PALETTE["accent2"]).pack(pady=(28,6))
-        tk.Label(frame, text=f"Final Score: {self.score} / {self.max_q * 10}", font=("Segoe UI", 18), bg=PALETTE["card"], fg=PALETTE["white"]).pack(pady=6)
+        tk.Label(frame, text="Quiz Complete", font=self._font(("Segoe UI Semibold", 26)), bg=PALETTE["card"], fg=PALETTE["accent2"]).pack(pady=(28,6))
+        tk.Label(frame, text=f"Final Score: {self.session.score} / {self.max_q * 10}", font=self._font(("Segoe UI", 18)), bg=PALETTE["card"], fg=PALETTE["white"]).pack(pady=6)
 
-        rank = self._grade(self.score)
-        tk.Label(frame, text=f"Grade: {rank}", font=("Segoe UI", 16), bg=PALETTE["card"], fg=PALETTE["muted"]).pack(pady=6)
+        rank = self._grade(self.session.score)
+        tk.Label(frame, text=f"Grade: {rank}", font=self._font(("Segoe UI", 16)), bg=PALETTE["card"], fg=PALETTE["muted"]).pack(pady=6)
 
         # trophy-like badge for A+
-        if self.score >= 90:
-            badge = tk.Label(frame, text="🏆 Math Champion", font=("Segoe UI Semibold", 16), bg=PALETTE["card"], fg=PALETTE["accent"])
+        if self.session.score >= 90:
+            badge = tk.Label(frame, text="🏆 Math Champion", font=self._font(("Segoe UI Semibold", 16)), bg=PALETTE["card"], fg=PALETTE["accent"])
             badge.pack(pady=8)
 
+        # persist the result and show where it ranks for this difficulty
+        leaderboard = self._ensure_leaderboard()
+        difficulty, score = self.session.difficulty, self.session.score
+        try:
+            leaderboard.record(difficulty, score)
+        except OSError as e:
+            self.toast.error(f"Couldn't save your result: {e}")
+        leaderboard.load_async()
+        rank_lbl = tk.Label(frame, text="Rank: loading past results…", font=self._font(FONT_SUB),
+                            bg=PALETTE["card"], fg=PALETTE["white"])
+        rank_lbl.pack(pady=(10, 2))
+        best_lbl = tk.Label(frame, text="", font=self._font(FONT_SUB), bg=PALETTE["card"], fg=PALETTE["muted"])
+        best_lbl.pack()
+
+        def show_rank():
+            if not rank_lbl.winfo_exists():
+                return
+            if not leaderboard.ready:
+                # a very large results file is still being read, don't block the UI for it
+                self.root.after(100, show_rank)
+                return
+            if leaderboard.error is not None:
+                rank_lbl.config(text="Rank: unavailable (past results couldn't be read)")
+                return
+            place, total = leaderboard.rank(difficulty, score)
+            rank_lbl.config(text=f"Rank: #{place} of {total} ({difficulty.title()})")
+            best = "  •  ".join(str(s) for s, _ in leaderboard.top(difficulty)[:5])
+            best_lbl.config(text=f"Top scores: {best}")
+        show_rank()
+
         btn_frame = tk.Frame(frame, bg=PALETTE["card"])
         btn_frame.pack(pady=16)
-        tk.Button(btn_frame, text="Play Again", font=FONT_BUTTON, bg=PALETTE["accent"], fg="#051019", bd=0, command=self._build_menu).grid(row=0, column=0, padx=12)
-        tk.Button(btn_frame, text="Exit", font=FONT_BUTTON, bg=PALETTE["danger"], fg="#fff", bd=0, command=self.root.destroy).grid(row=0, column=1, padx=12)
+        tk.Button(btn_frame, text="Play Again", font=self._font(FONT_BUTTON), bg=PALETTE["accent"], fg="#051019", bd=0, command=self._build_menu).grid(row=0, column=0, padx=12)
+        tk.Button(btn_frame, text="Exit", font=self._font(FONT_BUTTON), bg=PALETTE["danger"], fg="#fff", bd=0, command=self.root.destroy).grid(row=0, column=1, padx=12)
+
+        # _clear_root took the toast with it; keep the last question's revealed answer readable
+        self.toast.redraw()
 
     def _grade(self, s):
-        if s >= 90: return "A+"
-        if s >= 75: return "A"
-        if s >= 60: return "B"
-        if s >= 40: return "C"
-        return "F"
+        return grade(s)
 
     # -----------------------
     # Confirm Quit
     # -----------------------
     def _confirm_quit(self):
+        from tkinter import messagebox
         if messagebox.askyesno("Quit", "Are you sure you want to exit the quiz?"):
             self.root.destroy()
 
@@ -421,7 +479,20 @@ class MathQuizApp:
 # Run The Application
 # ---------------------------
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Math Quiz")
+    parser.add_argument("--server", metavar="HOST:PORT", help="play against a running quizserver.py")
+    args = parser.parse_args()
+
+    client = None
+    if args.server:
+        from quizclient import QuizClient
+        host, _, port = args.server.rpartition(":")
+        client = QuizClient(host or "127.0.0.1", int(port))
+
     root = tk.Tk()
     # Avoid duplication by passing a single root object into the app
-    app = MathQuizApp(root)
-    root.mainloop()
\ No newline at end of file
+    app = MathQuizApp(root, client)
+    root.mainloop()
+    if client:
+        client.close()
\ No newline at end of file
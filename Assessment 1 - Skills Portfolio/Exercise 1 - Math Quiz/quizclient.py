@@ -0,0 +1,76 @@
+import socket
+
+# ---------------------------
+# Thin Quiz Server Client
+# ---------------------------
+# Lets MathQuizApp run against quizserver.py: RemoteQuizSession exposes the same
+# attributes and methods as quizrules.QuizSession, so the app does not care which
+# one it is talking to. Replies on a local socket take well under a millisecond,
+# so plain blocking calls are fine on the Tk thread.
+
+
+class QuizClient:
+    def __init__(self, host="127.0.0.1", port=8765, timeout=5.0):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.reader = self.sock.makefile("r", encoding="utf-8", newline="\n")
+
+    def request(self, line):
+        self.sock.sendall(line.encode("utf-8") + b"\n")
+        reply = self.reader.readline()
+        if not reply:
+            raise ConnectionError("quiz server closed the connection")
+        reply = reply.rstrip("\n")
+        if reply.startswith("ERR "):
+            raise ValueError(reply[4:])
+        return reply
+
+    def start(self, difficulty):
+        reply = self.request(f"START {difficulty}")
+        return RemoteQuizSession(self, difficulty, int(reply.split()[1]))
+
+    def close(self):
+        try:
+            self.sock.sendall(b"QUIT\n")
+        except OSError:
+            pass
+        self.reader.close()
+        self.sock.close()
+
+
+class RemoteQuizSession:
+    """Mirror of QuizSession whose state lives on the quiz server."""
+
+    def __init__(self, client, difficulty, max_q):
+        self.client = client
+        self.difficulty = difficulty
+        self.max_q = max_q
+        self.current_q = 0
+        self.attempt = 1
+        self.score = 0
+        self.level = None
+        self.question = ""
+        self.grade = None
+        self.resolved = True
+
+    @property
+    def finished(self):
+        return self.grade is not None
+
+    def next_question(self):
+        reply = self.client.request("NEXT")
+        if reply.startswith("DONE "):
+            _, score, grade = reply.split()
+            self.score, self.grade = int(score), grade
+            return None
+        _, current_q, attempt, score, level, text = reply.split(" ", 5)
+        self.current_q, self.attempt, self.score = int(current_q), int(attempt), int(score)
+        self.level = None if level == "-" else int(level)
+        self.question = text
+        self.resolved = False
+        return text
+
+    def submit(self, value):
+        _, status, earned, correct, attempt, score = self.client.request(f"ANSWER {value}").split()
+        self.attempt, self.score = int(attempt), int(score)
+        self.resolved = status != "retry"
+        return status, int(earned), None if correct == "-" else int(correct)
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+try:
+    import resource          # Unix only, used to raise the open-file limit
+except ImportError:
+    resource = None
+
+from quizserver import DEFAULT_HOST, DEFAULT_PORT, DIFFICULTIES, QuizServer
+
+# ---------------------------
+# Quiz Server Load Test
+# ---------------------------
+# Simulates many learners playing full quizzes at once against quizserver.py.
+#
+#   python quizloadtest.py --sessions 5000              (starts its own server in-process)
+#   python quizloadtest.py --sessions 5000 --external   (targets an already running server)
+
+
+def solve(text):
+    """Work out the answer to a question line such as '12  +  3  ×  4  ='."""
+    tokens = text.replace("=", "").split()
+    # first pass: × and ÷ bind tighter, collapse them into single terms
+    terms = [int(tokens[0])]
+    signs = []
+    for op, num in zip(tokens[1::2], tokens[2::2]):
+        num = int(num)
+        if op == "×":
+            terms[-1] *= num
+        elif op == "÷":
+            terms[-1] //= num
+        else:
+            signs.append(op)
+            terms.append(num)
+    total = terms[0]
+    for sign, term in zip(signs, terms[1:]):
+        total = total + term if sign == "+" else total - term
+    return total
+
+
+async def play(host, port, accuracy, latencies, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(line):
+        start = time.perf_counter()
+        writer.write(line.encode("utf-8") + b"\n")
+        await writer.drain()
+        reply = (await reader.readline()).decode("utf-8").rstrip("\n")
+        latencies.append(time.perf_counter() - start)
+        if not reply or reply.startswith("ERR"):
+            raise RuntimeError(f"bad reply to {line!r}: {reply!r}")
+        return reply
+
+    try:
+        await request(f"START {rng.choice(DIFFICULTIES)}")
+        while True:
+            reply = await request("NEXT")
+            if reply.startswith("DONE"):
+                return int(reply.split()[1])
+            answer = solve(reply.split(" ", 5)[5])
+            for _ in range(2):
+                guess = answer if rng.random() < accuracy else answer + 1
+                if not (await request(f"ANSWER {guess}")).startswith("R retry"):
+                    break
+    finally:
+        writer.write(b"QUIT\n")
+        writer.close()
+
+
+async def run(sessions, concurrency, host, port, accuracy, external, seed):
+    server = None
+    if not external:
+        server = await QuizServer(host, port).start()
+
+    rng = random.Random(seed)
+    latencies = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with gate:
+            return await play(host, port, accuracy, latencies, rng)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(sessions)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    if server:
+        server.close()
+        await server.wait_closed()
+
+    failures = [r for r in results if isinstance(r, BaseException)]
+    scores = [r for r in results if not isinstance(r, BaseException)]
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    print(f"Sessions      : {len(scores)} completed, {len(failures)} failed "
+          f"({concurrency} concurrent) in {elapsed:.2f}s")
+    print(f"Throughput    : {len(scores) / elapsed:,.0f} sessions/s, {len(latencies) / elapsed:,.0f} requests/s")
+    if latencies:
+        print(f"Latency (ms)  : p50 {pct(50):.2f}  p95 {pct(95):.2f}  p99 {pct(99):.2f}  max {latencies[-1] * 1000:.2f}")
+    if scores:
+        print(f"Average score : {statistics.mean(scores):.1f}")
+    if failures:
+        print(f"First failure : {failures[0]!r}")
+
+
+def raise_file_limit():
+    # every simulated learner holds a socket (two when the server is in-process)
+    if resource is None:
+        return 4096
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return min(hard, resource.getrlimit(resource.RLIMIT_NOFILE)[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local quiz server.")
+    parser.add_argument("--sessions", type=int, default=2000, help="total quizzes to play")
+    parser.add_argument("--concurrency", type=int, default=1000, help="quizzes in flight at once")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--accuracy", type=float, default=0.7, help="chance each simulated answer is right")
+    parser.add_argument("--external", action="store_true", help="use a server that is already running")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    limit = raise_file_limit()
+    concurrency = min(args.concurrency, max(1, (limit - 64) // 2))
+    asyncio.run(run(args.sessions, concurrency, args.host, args.port, args.accuracy, args.external, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import random
+import time
+
+# ---------------------------
+# Math Quiz Question Rules
+# ---------------------------
+# Shared by the Tk app (mathquiz.py) and the worksheet generator (worksheet.py)
+# so both always produce questions from the same difficulty rules.
+
+MAX_QUESTIONS = 10
+
+# Operand range per fixed difficulty
+DIFFICULTY_RANGES = {
+    "easy": (1, 9),
+    "moderate": (10, 99),
+    "advanced": (1000, 9999),
+}
+
+# ---------------------------
+# Adaptive Difficulty Levels
+# ---------------------------
+# Each level: (add/sub operand range, mul/div operand range, operators, operand count)
+ADAPTIVE_LEVELS = [
+    ((1, 9), (1, 5), ("+", "-"), 2),
+    ((5, 20), (2, 9), ("+", "-", "×"), 2),
+    ((10, 99), (2, 12), ("+", "-", "×", "÷"), 2),
+    ((10, 99), (2, 12), ("+", "-", "×", "÷"), 3),
+    ((100, 999), (3, 20), ("+", "-", "×", "÷"), 3),
+    ((1000, 9999), (6, 30), ("+", "-", "×", "÷"), 4),
+]
+
+# ---------------------------
+# Fixed Difficulty Rules
+# ---------------------------
+def rand_pair(difficulty, rng=random):
+    """Two operands for the given difficulty (anything unknown counts as advanced)."""
+    lo, hi = DIFFICULTY_RANGES.get(difficulty, DIFFICULTY_RANGES["advanced"])
+    return rng.randint(lo, hi), rng.randint(lo, hi)
+
+def rand_op(rng=random):
+    return rng.choice(["+", "-"])
+
+def make_question(difficulty, rng=random):
+    """Return (question text, correct answer) for a fixed difficulty."""
+    num1, num2 = rand_pair(difficulty, rng)
+    operation = rand_op(rng)
+    answer = num1 + num2 if operation == "+" else num1 - num2
+    return f"{num1}  {operation}  {num2}  =", answer
+
+def grade(score):
+    if score >= 90: return "A+"
+    if score >= 75: return "A"
+    if score >= 60: return "B"
+    if score >= 40: return "C"
+    return "F"
+
+
+# ---------------------------
+# Adaptive Difficulty Engine
+# ---------------------------
+class AdaptiveDifficulty:
+    """Picks the next question from running accuracy and answer-time estimates.
+
+    Only a handful of numbers are kept (exponential moving averages), so memory
+    stays constant and each question is generated in O(1).
+    """
+
+    def __init__(self, level=0, alpha=0.35, rng=None):
+        self.level = level
+        self.alpha = alpha
+        self.rng = rng or random.Random()
+        self.accuracy = 0.5          # running accuracy estimate (0..1)
+        self.latency = 6.0           # running answer time estimate (seconds)
+        self.since_change = 0        # questions answered since the last level change
+
+    def record(self, credit, seconds):
+        """Feed one answered question: credit 1.0 first try, 0.5 second try, 0 wrong."""
+        a = self.alpha
+        self.accuracy += a * (credit - self.accuracy)
+        self.latency += a * (seconds - self.latency)
+        self.since_change += 1
+        if self.since_change < 2:
+            return
+        # target answer time grows with the level, harder sums are allowed more time
+        target = 4.0 + 2.5 * self.level
+        if self.accuracy >= 0.8 and self.latency <= target and self.level < len(ADAPTIVE_LEVELS) - 1:
+            self.level += 1
+            self.since_change = 0
+        elif self.accuracy < 0.45 and self.level > 0:
+            self.level -= 1
+            self.since_change = 0
+
+    def next_question(self):
+        """Return (question text, correct answer) for the current level."""
+        (lo, hi), (mlo, mhi), ops, operands = ADAPTIVE_LEVELS[self.level]
+        rng = self.rng
+        mul_ops = [op for op in ops if op in ("×", "÷")]
+        add_ops = [op for op in ops if op in ("+", "-")]
+
+        parts = []
+        total = 0
+        sign = "+"
+        remaining = operands
+        while remaining > 0:
+            # a product / quotient term uses two operands and binds tighter than + and -
+            if mul_ops and remaining >= 2 and rng.random() < 0.5:
+                op = rng.choice(mul_ops)
+                x, y = rng.randint(mlo, mhi), rng.randint(mlo, mhi)
+                if op == "×":
+                    value = x * y
+                    parts.append(f"{x}  ×  {y}")
+                else:
+                    # build the dividend from the answer so division is always exact
+                    value = x
+                    parts.append(f"{x * y}  ÷  {y}")
+                remaining -= 2
+            else:
+                value = rng.randint(lo, hi)
+                parts.append(str(value))
+                remaining -= 1
+            total = total + value if sign == "+" else total - value
+            if remaining > 0:
+                sign = rng.choice(add_ops)
+                parts.append(sign)
+        return "  ".join(parts) + "  =", total
+
+
+# ---------------------------
+# Quiz Session (scoring rules)
+# ---------------------------
+class QuizSession:
+    """One learner's run through the quiz, independent of any UI.
+
+    Two attempts per question: 10 points on the first, 5 on the second. Used
+    directly by the Tk app and by the asyncio quiz server (one per connection).
+    """
+
+    def __init__(self, difficulty, max_q=MAX_QUESTIONS, rng=None):
+        self.difficulty = difficulty
+        self.max_q = max_q
+        self.rng = rng or random.Random()
+        self.adaptive = AdaptiveDifficulty(rng=self.rng) if difficulty == "adaptive" else None
+        self.current_q = 0
+        self.attempt = 1
+        self.score = 0
+        self.question = ""
+        self.answer = 0
+        self.asked_at = 0.0
+        self.resolved = True         # no open question until next_question()
+
+    @property
+    def level(self):
+        """Adaptive level (1-based) or None for the fixed difficulties."""
+        return self.adaptive.level + 1 if self.adaptive else None
+
+    @property
+    def finished(self):
+        return self.current_q >= self.max_q
+
+    @property
+    def grade(self):
+        return grade(self.score)
+
+    def next_question(self):
+        """Advance to the next question and return its text, or None when the quiz is over."""
+        if self.finished:
+            return None
+        self.current_q += 1
+        self.attempt = 1
+        self.resolved = False
+        if self.adaptive:
+            self.question, self.answer = self.adaptive.next_question()
+        else:
+            self.question, self.answer = make_question(self.difficulty, self.rng)
+        self.asked_at = time.perf_counter()
+        return self.question
+
+    def submit(self, value):
+        """Score an answer; returns (status, earned, correct answer).
+
+        status is "correct", "retry" (first attempt wrong) or "wrong" (out of attempts).
+        Once a question is correct or wrong it is resolved: further answers raise
+        ValueError until next_question().
+        """
+        if self.resolved:
+            raise ValueError("question already answered, ask for the next one")
+        if value == self.answer:
+            earned = 10 if self.attempt == 1 else 5
+            self.score += earned
+            self.resolved = True
+            self._record(1.0 if self.attempt == 1 else 0.5)
+            return "correct", earned, self.answer
+        if self.attempt == 1:
+            self.attempt += 1
+            return "retry", 0, None
+        self.resolved = True
+        self._record(0.0)
+        return "wrong", 0, self.answer
+
+    def _record(self, credit):
+        if self.adaptive:
+            self.adaptive.record(credit, time.perf_counter() - self.asked_at)
@@ -0,0 +1,111 @@
+import argparse
+import asyncio
+
+from quizrules import QuizSession
+
+# ---------------------------
+# Local Multi-User Quiz Server
+# ---------------------------
+# One asyncio process serves every learner in the lab; each connection gets its
+# own QuizSession, so the question rules and scoring match the desktop app.
+#
+# Line protocol (UTF-8, one request line -> one reply line):
+#   START <easy|moderate|advanced|adaptive>  ->  OK <max_q>
+#   NEXT                                     ->  Q <current_q> <attempt> <score> <level|-> <question text>
+#                                                DONE <score> <grade>        (after the last question)
+#   ANSWER <integer>                         ->  R <correct|retry|wrong> <earned> <answer|-> <attempt> <score>
+#   QUIT                                     ->  connection closed
+# Anything else (or a command out of order) gets  ERR <message>.
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DIFFICULTIES = ("easy", "moderate", "advanced", "adaptive")
+
+
+def handle_command(session, line):
+    """Apply one protocol line to a session; returns (session, reply line or None to close)."""
+    cmd, _, arg = line.strip().partition(" ")
+    cmd = cmd.upper()
+
+    if cmd == "START":
+        if arg not in DIFFICULTIES:
+            return session, f"ERR unknown difficulty {arg!r}"
+        session = QuizSession(arg)
+        return session, f"OK {session.max_q}"
+    if cmd == "QUIT":
+        return session, None
+    if session is None:
+        return session, "ERR send START first"
+
+    if cmd == "NEXT":
+        text = session.next_question()
+        if text is None:
+            return session, f"DONE {session.score} {session.grade}"
+        level = session.level or "-"
+        return session, f"Q {session.current_q} {session.attempt} {session.score} {level} {text}"
+    if cmd == "ANSWER":
+        if session.resolved:      # none asked yet, or this one is already judged
+            return session, "ERR send NEXT first"
+        try:
+            value = int(arg)
+        except ValueError:
+            return session, "ERR answer must be an integer"
+        status, earned, correct = session.submit(value)
+        shown = "-" if correct is None else correct
+        return session, f"R {status} {earned} {shown} {session.attempt} {session.score}"
+    return session, f"ERR unknown command {cmd!r}"
+
+
+class QuizServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.active = 0
+        self.served = 0
+        self.server = None
+
+    async def handle_client(self, reader, writer):
+        self.active += 1
+        session = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                session, reply = handle_command(session, line.decode("utf-8", "replace"))
+                if reply is None:
+                    break
+                writer.write(reply.encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active -= 1
+            self.served += 1
+            writer.close()
+
+    async def start(self):
+        # a large backlog so a whole lab connecting at once is not refused
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port, backlog=4096)
+        return self.server
+
+    async def serve_forever(self):
+        server = await self.start()
+        print(f"Quiz server listening on {self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local multi-user math quiz server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    try:
+        asyncio.run(QuizServer(args.host, args.port).serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
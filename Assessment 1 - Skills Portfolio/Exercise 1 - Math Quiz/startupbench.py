@@ -0,0 +1,67 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# ---------------------------
+# Math Quiz Startup Benchmark
+# ---------------------------
+# Launches mathquiz in fresh interpreters and reports the time to first paint:
+# from process spawn until the menu window has been mapped and drawn.
+#
+#   python startupbench.py --runs 10
+#
+# Needs a display (on a headless Linux box run it under xvfb-run).
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def child():
+    """Runs inside the spawned interpreter and prints its own timings."""
+    t0 = time.perf_counter()
+    import tkinter as tk
+    import mathquiz
+    t_import = time.perf_counter()
+
+    root = tk.Tk()
+    mathquiz.MathQuizApp(root)
+    t_init = time.perf_counter()
+
+    # update() handles the <Map> and <Expose> events, i.e. the first real paint
+    root.update()
+    t_paint = time.perf_counter()
+    root.destroy()
+    print(f"{t_import - t0:.6f} {t_init - t_import:.6f} {t_paint - t_init:.6f}", flush=True)
+
+
+def run(runs):
+    rows = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, __file__, "--child"], cwd=HERE,
+                             capture_output=True, text=True, check=True).stdout
+        total = time.perf_counter() - start
+        rows.append([total] + [float(x) for x in out.split()])
+
+    print(f"Math Quiz startup over {runs} runs (median / min, ms)")
+    labels = ["time to first paint (spawn->paint)", "  imports", "  app init (menu build)", "  first paint"]
+    for i, label in enumerate(labels):
+        column = [row[i] * 1000 for row in rows]
+        print(f"  {label:<36} {statistics.median(column):8.1f} / {min(column):8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Math Quiz time to first paint.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+    else:
+        run(args.runs)
+
+
+if __name__ == "__main__":
+    main()
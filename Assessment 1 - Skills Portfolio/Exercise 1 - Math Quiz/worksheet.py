@@ -0,0 +1,150 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from quizrules import ADAPTIVE_LEVELS, DIFFICULTY_RANGES, AdaptiveDifficulty, make_question
+
+# ---------------------------
+# Printable Worksheet Generator
+# ---------------------------
+# Writes drill sheets (questions + answer key) using the same rules as the quiz app.
+#
+#   python worksheet.py --difficulty moderate --count 40 --sheets 30 --seed 7
+#   python worksheet.py --difficulty level4 --count 20000 --format csv --workers 8
+#   python worksheet.py --benchmark
+
+DIFFICULTIES = list(DIFFICULTY_RANGES) + [f"level{i + 1}" for i in range(len(ADAPTIVE_LEVELS))]
+
+# give up on a sheet after this many duplicate questions in a row
+MAX_DUPLICATE_RUN = 1000
+
+
+# ---------------------------
+# Question generation
+# ---------------------------
+def sheet_seed(seed, index):
+    """Seed for one sheet, so every sheet is reproducible on its own."""
+    return seed * 1_000_003 + index
+
+def question_maker(difficulty, rng):
+    """Return a zero-argument function producing (text, answer)."""
+    if difficulty.startswith("level"):
+        engine = AdaptiveDifficulty(level=int(difficulty[5:]) - 1, rng=rng)
+        return engine.next_question
+    return lambda: make_question(difficulty, rng)
+
+def generate_sheet(difficulty, count, seed):
+    """Generate up to `count` distinct questions for one sheet.
+
+    Duplicates are dropped with a hash set. Small difficulties (easy only has
+    162 distinct questions) may return fewer than requested.
+    """
+    rng = random.Random(seed)
+    make = question_maker(difficulty, rng)
+    seen = set()
+    questions = []
+    duplicate_run = 0
+    while len(questions) < count and duplicate_run < MAX_DUPLICATE_RUN:
+        text, answer = make()
+        text = " ".join(text.split())          # single spaces for print
+        if text in seen:
+            duplicate_run += 1
+            continue
+        duplicate_run = 0
+        seen.add(text)
+        questions.append((text, answer))
+    return questions
+
+
+# ---------------------------
+# Output
+# ---------------------------
+def write_sheet(path, questions, fmt, title):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(["number", "question", "answer"])
+            writer.writerows((i, q, a) for i, (q, a) in enumerate(questions, 1))
+            return
+        f.write(f"{title}\n{'=' * len(title)}\n\n")
+        f.writelines(f"{i:>5}.  {q} ________\n" for i, (q, _) in enumerate(questions, 1))
+        f.write("\n\nAnswer Key\n----------\n")
+        f.writelines(f"{i:>5}.  {a}\n" for i, (_, a) in enumerate(questions, 1))
+
+def build_sheet(job):
+    """Worker entry point: generate and write one sheet, return (path, written)."""
+    index, difficulty, count, seed, fmt, out_dir = job
+    questions = generate_sheet(difficulty, count, sheet_seed(seed, index))
+    path = os.path.join(out_dir, f"sheet_{index + 1:03d}.{fmt}")
+    write_sheet(path, questions, fmt, f"Math Drill — {difficulty.title()} — Sheet {index + 1}")
+    return path, len(questions)
+
+
+def run(difficulty, count, sheets, seed, fmt, out_dir, workers):
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(i, difficulty, count, seed, fmt, out_dir) for i in range(sheets)]
+    if workers <= 1 or sheets == 1:
+        results = list(map(build_sheet, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(build_sheet, jobs))
+    for path, written in results:
+        if written < count:
+            print(f"warning: {path} has {written} questions, only that many distinct ones exist "
+                  f"for '{difficulty}'", file=sys.stderr)
+    return results
+
+
+# ---------------------------
+# Throughput benchmark
+# ---------------------------
+def _count_sheet(job):
+    # only the count travels back, so the benchmark measures generation not pickling
+    return len(generate_sheet(*job))
+
+def benchmark(difficulty="advanced", count=200_000, sheets=8, workers=None):
+    workers = workers or os.cpu_count() or 1
+    print(f"Benchmark: {sheets} sheets x {count} '{difficulty}' questions (generation only)")
+    jobs = [(difficulty, count, sheet_seed(1, i)) for i in range(sheets)]
+
+    start = time.perf_counter()
+    total = sum(map(_count_sheet, jobs))
+    serial = time.perf_counter() - start
+    print(f"  1 process : {total / serial:>12,.0f} questions/s ({serial:.2f}s)")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        total = sum(pool.map(_count_sheet, jobs))
+    parallel = time.perf_counter() - start
+    print(f"  {workers} processes: {total / parallel:>12,.0f} questions/s ({parallel:.2f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate printable math drill sheets with answer keys.")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default="easy")
+    parser.add_argument("--count", type=int, default=40, help="questions per sheet")
+    parser.add_argument("--sheets", type=int, default=1, help="number of sheets to write")
+    parser.add_argument("--seed", type=int, default=0, help="same seed gives the same sheets")
+    parser.add_argument("--format", choices=["txt", "csv"], default="txt")
+    parser.add_argument("--out", default="worksheets", help="output folder")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--benchmark", action="store_true", help="report generation throughput and exit")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(workers=args.workers)
+        return
+
+    start = time.perf_counter()
+    results = run(args.difficulty, args.count, args.sheets, args.seed, args.format, args.out, args.workers)
+    elapsed = time.perf_counter() - start
+    total = sum(n for _, n in results)
+    print(f"Wrote {len(results)} sheet(s), {total:,} questions to {args.out} in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,95 @@
 import tkinter as tk
 from tkinter import messagebox
-import random, time, threading, winsound
-import os
 
-class JokeApp:
+from jokeaudio import AudioCue
+from jokepicker import JokePicker
+from jokeprefetch import CorpusSource, JokePrefetcher
+from jokesearch import JokeSearchIndex
+from jokestore import open_corpus
+from portfolioui import get_font
+from resourceloader import resource_path
+
+# texts longer than this many frames are typed several characters per frame
+MAX_TYPING_FRAMES = 120
+
+class Typewriter:
+    """Typewriter effect driven by the Tk event loop (no threads).
+
+    Each widget has at most one running animation: starting a new one cancels
+    the previous, so fast clicks never race on the same label.
+    """
+
     def __init__(self, root):
+        self.root = root
+        self.jobs = {}          # widget path -> pending after() id
+
+    def type(self, widget, text, delay, chars_per_frame=None):
+        self.cancel(widget)
+        if chars_per_frame is None:
+            chars_per_frame = max(1, -(-len(text) // MAX_TYPING_FRAMES))
+        ms = max(1, int(delay * 1000))
+        key = str(widget)
+
+        def step(shown):
+            shown = min(len(text), shown + chars_per_frame)
+            try:
+                widget.config(text=text[:shown])
+            except tk.TclError:
+                # widget was destroyed mid-animation
+                self.jobs.pop(key, None)
+                return
+            if shown < len(text):
+                self.jobs[key] = self.root.after(ms, step, shown)
+            else:
+                self.jobs.pop(key, None)
+
+        widget.config(text="")
+        self.jobs[key] = self.root.after(ms, step, 0)
+
+    def cancel(self, widget):
+        job = self.jobs.pop(str(widget), None)
+        if job is not None:
+            self.root.after_cancel(job)
+
+class JokeApp:
+    def __init__(self, root, source=None):
         self.root = root
         root.title("Alexa Tell Me A Joke")
-        root.geometry("720x420")
+        root.geometry("720x500")
         root.configure(bg="#101623")
 
         self.current_joke = ("", "")
+        self.typewriter = Typewriter(root)
+        self.audio = AudioCue()
+        # parsed (or indexed, for very large files) on the first click, then only when the file changes
+        self.corpus = open_corpus(resource_path("randomJokes.txt", __file__))
+        # no repeats until every joke has been told (or favour liked jokes)
+        self.picker = JokePicker(self.corpus)
+        self.weighted = tk.BooleanVar(value=False)
+        # a background worker keeps the next few jokes ready (file, folder or local HTTP source)
+        self.prefetch = JokePrefetcher(source or CorpusSource(self.picker))
+        # word index over the joke file, loaded from / saved to disk on first search
+        self.search_index = JokeSearchIndex(self.corpus.path)
+        self.search_hits = []
+        self.search_query = ""
+        self.load_job = None      # pending load_joke retry while the worker catches up
+        root.bind("<Destroy>", self._on_destroy, add="+")
 
         # Titles
         tk.Label(root, text="Alexa 🤖", fg="white", bg="#101623",
-                 font=("Arial", 20, "bold")).pack(pady=45)
+                 font=self._font(("Arial", 20, "bold"))).pack(pady=45)
         tk.Label(root, text="Joke Assistant", fg="#C8B6FF", bg="#101623",
-                 font=("Arial", 18, "bold")).pack()
+                 font=self._font(("Arial", 18, "bold"))).pack()
 
         # Joke setup
         self.setup_lbl = tk.Label(root, text="Click 'New Joke' to start!",
                                   fg="white", bg="#101623", wraplength=600,
-                                  font=("Arial", 15))
+                                  font=self._font(("Arial", 15)))
         self.setup_lbl.pack(pady=18)
 
         # Punchline
         self.punch_lbl = tk.Label(root, text="", fg="#9FE2F7", bg="#101623",
-                                  wraplength=600, font=("Arial", 14, "italic"))
+                                  wraplength=600, font=self._font(("Arial", 14, "italic")))
         self.punch_lbl.pack()
 
         # Buttons
@@ -34,48 +97,122 @@ class JokeApp:
         btns.pack(pady=20)
 
         tk.Button(btns, text="New Joke", width=12, command=self.load_joke,
-                  bg="#2D394D", fg="white", font=("Arial", 12, "bold")).grid(row=0, column=0, padx=10)
+                  bg="#2D394D", fg="white", font=self._font(("Arial", 12, "bold"))).grid(row=0, column=0, padx=10)
         tk.Button(btns, text="Show Punchline", width=15, command=self.show_punch,
-                  bg="#415A77", fg="white", font=("Arial", 12, "bold")).grid(row=0, column=1, padx=10)
-        tk.Button(btns, text="Quit", width=10, command=root.quit,
-                  bg="#A4161A", fg="white", font=("Arial", 12, "bold")).grid(row=0, column=2, padx=10)
+                  bg="#415A77", fg="white", font=self._font(("Arial", 12, "bold"))).grid(row=0, column=1, padx=10)
+        tk.Button(btns, text="Quit", width=10, command=root.destroy,
+                  bg="#A4161A", fg="white", font=self._font(("Arial", 12, "bold"))).grid(row=0, column=2, padx=10)
 
-    def load_joke(self):
-        try:
-            file_path = os.path.join(os.path.dirname(__file__), "randomJokes.txt")
-            with open(file_path, "r", encoding="utf-8") as f:
+        # Search ("tell me a joke about ...")
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(btns, textvariable=self.search_var, width=28, font=self._font(("Arial", 12)))
+        search_entry.grid(row=1, column=0, columnspan=2, pady=(12, 0), sticky="ew", padx=10)
+        search_entry.bind("<Return>", lambda e: self.search_joke())
+        tk.Button(btns, text="Joke About…", width=10, command=self.search_joke,
+                  bg="#415A77", fg="white", font=self._font(("Arial", 12, "bold"))).grid(row=1, column=2, padx=10, pady=(12, 0))
+
+        # Ratings
+        rate = tk.Frame(root, bg="#101623")
+        rate.pack()
+        tk.Button(rate, text="👍 Like", width=8, command=lambda: self.rate_joke(1),
+                  bg="#2D394D", fg="white", font=self._font(("Arial", 10))).grid(row=0, column=0, padx=6)
+        tk.Button(rate, text="👎 Dislike", width=8, command=lambda: self.rate_joke(-1),
+                  bg="#2D394D", fg="white", font=self._font(("Arial", 10))).grid(row=0, column=1, padx=6)
+        tk.Checkbutton(rate, text="Favour liked jokes", variable=self.weighted, command=self.set_mode,
+                       fg="#C8B6FF", bg="#101623", selectcolor="#2D394D", activebackground="#101623",
+                       activeforeground="white", font=self._font(("Arial", 10))).grid(row=0, column=2, padx=6)
 
-                lines = [x.strip() for x in f if "?" in x]
-            setup, punch = random.choice(lines).split("?", 1)
-            self.current_joke = (setup + "?", punch.strip())
+    def load_joke(self, retries=40):
+        if self.load_job is not None:
+            self.root.after_cancel(self.load_job)
+            self.load_job = None
+        joke = self.prefetch.get_nowait()
+        if joke is None:
+            self.typewriter.cancel(self.setup_lbl)
+            self.typewriter.cancel(self.punch_lbl)
             self.punch_lbl.config(text="")
-            self.type_text(self.setup_lbl, self.current_joke[0], 0.02)
+            if self.prefetch.error is not None or not retries:
+                reason = self.prefetch.error or "no joke arrived in time, please try again"
+                self.setup_lbl.config(text="Click 'New Joke' to try again.")
+                messagebox.showerror("Error", f"Couldn't read jokes:\n{reason}")
+            else:
+                # worker has not caught up yet: check again shortly without blocking the UI
+                self.setup_lbl.config(text="Thinking of a joke…")
+                self.load_job = self.root.after(50, self.load_joke, retries - 1)
+            return
+        self.current_joke = joke
+        self.typewriter.cancel(self.punch_lbl)
+        self.punch_lbl.config(text="")
+        self.type_text(self.setup_lbl, self.current_joke[0], 0.02)
+
+    def search_joke(self):
+        query = self.search_var.get().strip()
+        if not query:
+            self.load_joke()
+            return
+        try:
+            if query != self.search_query:
+                self.search_query = query
+                self.search_hits = self.search_index.search(query)
+            if not self.search_hits:
+                self.setup_lbl.config(text=f"I don't know any jokes about \"{query}\" yet.")
+                self.punch_lbl.config(text="")
+                self.current_joke = ("", "")
+                return
+            # repeated searches walk through the matches
+            i = self.search_hits.pop(0)
+            self.search_hits.append(i)
+            self.current_joke = self.picker.joke(i)
         except Exception as e:
-            messagebox.showerror("Error", f"Couldn't read jokes:\n{e}")
+            messagebox.showerror("Error", f"Couldn't search jokes:\n{e}")
+            return
+        self.typewriter.cancel(self.punch_lbl)
+        self.punch_lbl.config(text="")
+        self.type_text(self.setup_lbl, self.current_joke[0], 0.02)
+
+    def set_mode(self):
+        self.picker.set_mode("weighted" if self.weighted.get() else "shuffle")
+        self.prefetch.clear()
+
+    def rate_joke(self, delta):
+        if not self.current_joke[0]:
+            self.punch_lbl.config(text="Load a joke first!")
+            return
+        self.picker.rate(self.current_joke, delta)
+        self.punch_lbl.config(text="Thanks! Rating saved." if delta > 0 else "Noted, you'll see it less.")
 
     def show_punch(self):
         if not self.current_joke[1]:
             self.punch_lbl.config(text="Load a joke first!")
             return
-        threading.Thread(target=self.play_sound).start()
+        self.play_sound()
         self.type_text(self.punch_lbl, self.current_joke[1], 0.03)
 
-    def type_text(self, widget, text, delay):
-        widget.config(text="")
-        def run():
-            out = ""
-            for ch in text:
-                out += ch
-                widget.config(text=out)
-                time.sleep(delay)
-        threading.Thread(target=run).start()
+    def _font(self, spec):
+        return get_font(self.root, spec)
+
+    def type_text(self, widget, text, delay, chars_per_frame=None):
+        self.typewriter.type(widget, text, delay, chars_per_frame)
 
     def play_sound(self):
-        try:
-            winsound.Beep(850, 120)
-        except:
-            pass
+        self.audio.beep(850, 120)
+
+    def _on_destroy(self, event):
+        # <Destroy> on a window also fires for each of its children
+        if event.widget is not self.root:
+            return
+        if self.load_job is not None:
+            self.root.after_cancel(self.load_job)
+            self.load_job = None
+        self.prefetch.stop()
 
 if __name__ == "__main__":
-    JokeApp(tk.Tk())
+    import argparse
+    from jokeprefetch import make_source
+    parser = argparse.ArgumentParser(description="Alexa Tell Me A Joke")
+    parser.add_argument("--jokes", help="joke file, folder of joke files, or http:// joke service")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    JokeApp(root, make_source(args.jokes) if args.jokes else None)
     tk.mainloop()
\ No newline at end of file
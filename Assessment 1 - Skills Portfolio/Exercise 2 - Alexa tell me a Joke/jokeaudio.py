@@ -0,0 +1,154 @@
+import math
+import os
+import queue
+import shutil
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import wave
+
+# shared helpers (resourceloader.py) live in the portfolio folder one level up
+PORTFOLIO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO_DIR not in sys.path:
+    sys.path.insert(0, PORTFOLIO_DIR)
+from resourceloader import CACHE_DIR
+
+# ---------------------------
+# Audio cues for JokeApp
+# ---------------------------
+# The platform backend is chosen (and imported) on the first beep:
+#   Windows - winsound.Beep
+#   Linux   - a generated WAV played with ALSA's aplay (paplay as a fallback)
+#   macOS   - a generated WAV played with afplay
+#   other   - silent
+# All sounds play from one reusable worker thread. Requests go through a small
+# bounded queue and extra clicks are dropped when it is full, so rapid clicking
+# can never pile up threads or a backlog of beeps.
+#
+# Generated tones are kept in the portfolio's .cache/ folder (not the shared
+# temp folder). Each is written to a private temporary file and renamed into
+# place, and a cached file is only reused if it has the expected size.
+
+QUEUE_SIZE = 2
+SAMPLE_RATE = 22050
+
+
+def tone_size(freq, ms):
+    """Size in bytes of the WAV file write_tone() produces."""
+    return 44 + 2 * int(SAMPLE_RATE * ms / 1000)
+
+
+def write_tone(path, freq, ms, volume=0.4):
+    """Write a mono 16-bit sine tone WAV file."""
+    frames = int(SAMPLE_RATE * ms / 1000)
+    amp = int(32767 * volume)
+    data = b"".join(struct.pack("<h", int(amp * math.sin(2 * math.pi * freq * i / SAMPLE_RATE)))
+                    for i in range(frames))
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(data)
+
+
+class WinsoundBackend:
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+
+    def play(self, freq, ms):
+        self.winsound.Beep(freq, ms)
+
+
+class WavPlayerBackend:
+    """Plays cached tone files through a command line player."""
+
+    def __init__(self, command):
+        self.command = command
+        self.files = {}
+
+    def play(self, freq, ms):
+        path = self.files.get((freq, ms))
+        if path is None:
+            path = self.tone_file(freq, ms)
+            self.files[(freq, ms)] = path
+        subprocess.run(self.command + [path], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+
+
+    @staticmethod
+    def tone_file(freq, ms):
+        """Cached tone path, (re)written if missing or not the expected size."""
+        path = os.path.join(CACHE_DIR, f"tone_{freq}_{ms}.wav")
+        try:
+            st = os.lstat(path)         # lstat: a symlink is never reused, it gets replaced
+            if stat.S_ISREG(st.st_mode) and st.st_size == tone_size(freq, ms):
+                return path
+        except OSError:
+            pass
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            write_tone(tmp, freq, ms)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        return path
+
+
+class SilentBackend:
+    def play(self, freq, ms):
+        pass
+
+
+def default_backend():
+    if sys.platform == "win32":
+        try:
+            return WinsoundBackend()
+        except ImportError:
+            return SilentBackend()
+    if sys.platform == "darwin" and shutil.which("afplay"):
+        return WavPlayerBackend(["afplay"])
+    if shutil.which("aplay"):
+        return WavPlayerBackend(["aplay", "-q"])
+    if shutil.which("paplay"):
+        return WavPlayerBackend(["paplay"])
+    return SilentBackend()
+
+
+class AudioCue:
+    def __init__(self, backend=None, maxsize=QUEUE_SIZE):
+        self.backend = backend
+        self.requests = queue.Queue(maxsize=maxsize)
+        self.worker = None
+        self.lock = threading.Lock()
+
+    def beep(self, freq=850, ms=120):
+        """Queue a beep without blocking; dropped if the queue is already full."""
+        self._ensure_worker()
+        try:
+            self.requests.put_nowait((freq, ms))
+        except queue.Full:
+            pass
+
+    def _ensure_worker(self):
+        with self.lock:
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._run, name="audio-cue", daemon=True)
+                self.worker.start()
+
+    def _run(self):
+        if self.backend is None:
+            self.backend = default_backend()
+        while True:
+            freq, ms = self.requests.get()
+            try:
+                self.backend.play(freq, ms)
+            except Exception:
+                # a missing or busy sound device should never affect the app
+                pass
@@ -0,0 +1,271 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from array import array
+
+# ---------------------------
+# Joke selection engine
+# ---------------------------
+# Two ways to choose the next joke from a corpus (see jokestore.py):
+#   shuffle  - every joke comes up once per cycle, in a fresh random order each cycle
+#   weighted - liked jokes come up more often, disliked ones less (one bucket per rating)
+# Ratings are kept locally in jokeRatings.json, keyed by the joke's setup text.
+#
+# The app's prefetch thread and the Tk thread share one picker and its corpus,
+# so every access goes through the picker and holds picker.lock. Building the
+# weighted buckets reads every joke once, so it takes the lock one chunk at a
+# time; after that a rating only moves the rated joke to another bucket.
+
+RATINGS_FILE = os.path.join(os.path.dirname(__file__), "jokeRatings.json")
+RATING_LIMIT = 4          # ratings count up to +-4: each +1 doubles a joke's chance, each -1 halves it
+BUILD_CHUNK = 20_000      # jokes read per hold of picker.lock while building the buckets
+
+
+class ShuffleQueue:
+    """Non-repeating order over 0..n-1 using a lazy Fisher-Yates shuffle.
+
+    Each draw performs one shuffle step, so there is no O(n) reshuffle pause
+    between cycles and every index appears exactly once per cycle.
+    """
+
+    def __init__(self, n, rng=None):
+        self.rng = rng or random.Random()
+        self.order = array("Q", range(n))
+        self.pos = 0
+        self.last = None
+
+    def __len__(self):
+        return len(self.order)
+
+    def next(self):
+        order, n = self.order, len(self.order)
+        if n == 0:
+            raise IndexError("empty queue")
+        if self.pos >= n:
+            self.pos = 0
+        i = self.pos
+        j = self.rng.randrange(i, n)
+        order[i], order[j] = order[j], order[i]
+        # never repeat the last joke of one cycle as the first of the next
+        if i == 0 and n > 1 and order[0] == self.last:
+            k = self.rng.randrange(1, n)
+            order[0], order[k] = order[k], order[0]
+        self.pos += 1
+        self.last = order[i]
+        return order[i]
+
+
+class RatingBuckets:
+    """Weighted sampling where joke i has weight 2 ** level[i], level in -4..4.
+
+    With only nine distinct weights the jokes are kept in one bucket per level:
+    a sample picks a bucket in proportion to its total weight, then a joke in
+    it uniformly. Changing one joke's level moves it between buckets in O(1).
+    """
+
+    def __init__(self, levels, rng=None):
+        self.rng = rng or random.Random()
+        self.level = array("b", levels)
+        self.pos = array("Q", bytes(8 * len(self.level)))       # index within its bucket
+        self.buckets = [array("Q") for _ in range(2 * RATING_LIMIT + 1)]
+        if not self.level:
+            raise ValueError("no jokes to weight")
+        for i, level in enumerate(self.level):
+            bucket = self.buckets[level + RATING_LIMIT]
+            self.pos[i] = len(bucket)
+            bucket.append(i)
+
+    def __len__(self):
+        return len(self.level)
+
+    def set_level(self, i, level):
+        old = self.level[i]
+        if old == level:
+            return
+        # swap-remove from the old bucket
+        bucket = self.buckets[old + RATING_LIMIT]
+        last = bucket.pop()
+        if last != i:
+            bucket[self.pos[i]] = last
+            self.pos[last] = self.pos[i]
+        bucket = self.buckets[level + RATING_LIMIT]
+        self.pos[i] = len(bucket)
+        bucket.append(i)
+        self.level[i] = level
+
+    def sample(self):
+        weights = [len(b) * 2.0 ** (k - RATING_LIMIT) for k, b in enumerate(self.buckets)]
+        r = self.rng.random() * sum(weights)
+        for bucket, weight in zip(self.buckets, weights):
+            if r < weight:
+                return bucket[self.rng.randrange(len(bucket))]
+            r -= weight
+        # rounding left r at the very top: use the heaviest non-empty bucket
+        bucket = next(b for b in reversed(self.buckets) if b)
+        return bucket[self.rng.randrange(len(bucket))]
+
+
+class RatingsStore:
+    """Likes minus dislikes per joke, saved as JSON next to the app."""
+
+    def __init__(self, path=RATINGS_FILE):
+        self.path = path
+        self.ratings = {}
+        self.version = 0          # bumped on every change so pickers know to rebuild
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.ratings = json.load(f)
+        except (OSError, ValueError):
+            self.ratings = {}
+
+    def rate(self, setup, delta):
+        self.ratings[setup] = self.ratings.get(setup, 0) + delta
+        self.version += 1
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.ratings, f)
+
+    def level(self, setup):
+        # clamped so nothing disappears completely
+        return max(-RATING_LIMIT, min(RATING_LIMIT, self.ratings.get(setup, 0)))
+
+    def weight(self, setup):
+        # +1 doubles the chance, each -1 halves it
+        return 2.0 ** self.level(setup)
+
+
+class JokePicker:
+    """Picks joke indexes from a corpus in "shuffle" or "weighted" mode."""
+
+    def __init__(self, corpus, ratings=None, mode="shuffle", rng=None):
+        self.corpus = corpus
+        self.ratings = ratings if ratings is not None else RatingsStore()
+        self.mode = mode
+        self.rng = rng or random.Random()
+        self.queue = None
+        self.buckets = None       # RatingBuckets for weighted mode
+        self.hashes = None        # hash of each joke's setup, to find a rated joke without re-reading
+        self.buckets_version = None
+        self.generation = 0       # bumped whenever the corpus changes on disk
+        self.lock = threading.RLock()
+
+    def next_joke(self):
+        """Return (setup, punchline) for the next joke."""
+        while True:
+            if self.mode == "weighted":
+                self._build_buckets()
+            with self.lock:
+                self._refresh()
+                if len(self.corpus) == 0:
+                    raise ValueError(f"No jokes found in {self.corpus.path}")
+                if self.mode == "weighted" and not self._buckets_current():
+                    continue        # file or ratings changed during the build
+                return self.corpus.joke(self._next_index())
+
+    def joke(self, i):
+        """Return (setup, punchline) for joke number i of the current file."""
+        with self.lock:
+            self._refresh()
+            return self.corpus.joke(i)
+
+    def set_mode(self, mode):
+        with self.lock:
+            self.mode = mode
+
+    def _refresh(self):
+        if self.corpus.refresh():
+            # corpus changed on disk: both structures are rebuilt lazily
+            self.queue = self.buckets = self.hashes = None
+            self.generation += 1
+
+    def _buckets_current(self):
+        return self.buckets is not None and self.buckets_version == self.ratings.version
+
+    def _build_buckets(self):
+        """(Re)build the weighted buckets if needed, holding the lock one chunk at a time."""
+        with self.lock:
+            self._refresh()
+            if self._buckets_current():
+                return
+            generation, version, n = self.generation, self.ratings.version, len(self.corpus)
+        levels, hashes = array("b"), array("q")
+        for start in range(0, n, BUILD_CHUNK):
+            with self.lock:
+                self._refresh()
+                if self.generation != generation:
+                    return      # file changed: next_joke notices and starts again
+                for i in range(start, min(n, start + BUILD_CHUNK)):
+                    setup = self.corpus.joke(i)[0]
+                    levels.append(self.ratings.level(setup))
+                    hashes.append(hash(setup))
+        buckets = RatingBuckets(levels, self.rng) if n else None
+        with self.lock:
+            if self.generation == generation and self.ratings.version == version:
+                self.buckets, self.hashes, self.buckets_version = buckets, hashes, version
+
+    def _next_index(self):
+        if self.mode == "weighted":
+            return self.buckets.sample()
+        if self.queue is None:
+            self.queue = ShuffleQueue(len(self.corpus), self.rng)
+        return self.queue.next()
+
+    def rate(self, joke, delta):
+        setup = joke[0]
+        with self.lock:
+            current = self._buckets_current()
+            self.ratings.rate(setup, delta)
+            if not current:
+                return      # built with this rating included when weighted mode next needs it
+            # move every joke with this setup to its new bucket; the setup hashes avoid reading the corpus
+            level, h, hashes, i = self.ratings.level(setup), hash(setup), self.hashes, -1
+            while True:
+                try:
+                    i = hashes.index(h, i + 1)
+                except ValueError:
+                    break
+                if self.corpus.joke(i)[0] == setup:
+                    self.buckets.set_level(i, level)
+            self.buckets_version = self.ratings.version
+
+
+# ---------------------------
+# Benchmark
+# ---------------------------
+def benchmark(n=1_000_000, draws=1_000_000):
+    rng = random.Random(1)
+    print(f"Joke picker benchmark: {n:,} jokes, {draws:,} draws")
+
+    start = time.perf_counter()
+    queue = ShuffleQueue(n, rng)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(draws):
+        queue.next()
+    draw = time.perf_counter() - start
+    print(f"  shuffle : build {build * 1000:8.1f} ms   {draws / draw:>12,.0f} draws/s")
+
+    levels = [rng.randint(-RATING_LIMIT, RATING_LIMIT) for _ in range(n)]
+    start = time.perf_counter()
+    buckets = RatingBuckets(levels, rng)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(draws):
+        buckets.sample()
+    draw = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(draws):
+        buckets.set_level(rng.randrange(n), rng.randint(-RATING_LIMIT, RATING_LIMIT))
+    rate = time.perf_counter() - start
+    print(f"  weighted: build {build * 1000:8.1f} ms   {draws / draw:>12,.0f} draws/s   "
+          f"{draws / rate:>12,.0f} re-ratings/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the joke selection engine.")
+    parser.add_argument("--jokes", type=int, default=1_000_000)
+    parser.add_argument("--draws", type=int, default=1_000_000)
+    args = parser.parse_args()
+    benchmark(args.jokes, args.draws)
@@ -0,0 +1,182 @@
+import bisect
+import glob
+import json
+import os
+import random
+import threading
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jokestore import open_corpus, split_joke
+from resourceloader import resource_path
+
+# ---------------------------
+# Joke prefetch pipeline
+# ---------------------------
+# A background worker keeps the next few jokes parsed and waiting in a bounded
+# deque, so "New Joke" only pops from memory and never does I/O on the Tk thread.
+# clear() also discards a joke that was being fetched when it was called, and
+# stop() ends the worker when the app's window closes.
+#
+# Sources (all provide next_joke() -> (setup, punchline)):
+#   CorpusSource    - a JokePicker over one joke file
+#   DirectorySource - every *.txt joke file in a folder
+#   HttpSource      - a local HTTP joke service, e.g. "python jokeprefetch.py [FILE]"
+
+PREFETCH_DEPTH = 5
+
+
+class CorpusSource:
+    def __init__(self, picker):
+        self.picker = picker
+
+    def next_joke(self):
+        return self.picker.next_joke()
+
+
+class DirectorySource:
+    """Random jokes across all joke files in a folder, weighted by file size in jokes."""
+
+    def __init__(self, folder, pattern="*.txt", rng=None):
+        self.folder = folder
+        self.pattern = pattern
+        self.rng = rng or random.Random()
+        self.corpora = {}
+
+    def next_joke(self):
+        paths = sorted(glob.glob(os.path.join(self.folder, self.pattern)))
+        cumulative, total, live = [], 0, []
+        for path in paths:
+            corpus = self.corpora.get(path)
+            if corpus is None:
+                corpus = self.corpora[path] = open_corpus(path)
+            corpus.refresh()
+            if len(corpus):
+                total += len(corpus)
+                cumulative.append(total)
+                live.append(corpus)
+        if not total:
+            raise ValueError(f"No jokes found in {self.folder}")
+        pick = self.rng.randrange(total)
+        i = bisect.bisect_right(cumulative, pick)
+        return live[i].joke(pick - (cumulative[i - 1] if i else 0))
+
+
+class HttpSource:
+    """GET <url> returning {"setup": ..., "punchline": ...} or a plain "setup?punchline" line."""
+
+    def __init__(self, url, timeout=3.0):
+        self.url = url
+        self.timeout = timeout
+
+    def next_joke(self):
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as resp:
+            body = resp.read().decode("utf-8")
+        if resp.headers.get_content_type() == "application/json":
+            data = json.loads(body)
+            return data["setup"], data["punchline"]
+        return split_joke(body)
+
+
+def make_source(spec, picker=None):
+    """Build a source from a file path, a folder or an http:// URL."""
+    if spec.startswith(("http://", "https://")):
+        return HttpSource(spec)
+    if os.path.isdir(spec):
+        return DirectorySource(spec)
+    if picker is None:
+        from jokepicker import JokePicker
+        picker = JokePicker(open_corpus(spec))
+    return CorpusSource(picker)
+
+
+class JokePrefetcher:
+    def __init__(self, source, depth=PREFETCH_DEPTH):
+        self.source = source
+        self.ready = deque()
+        self.depth = depth
+        self.error = None
+        self.generation = 0       # bumped by clear(), so an in-flight joke from before it is dropped
+        self.stopped = False
+        self.cond = threading.Condition()
+        self.worker = threading.Thread(target=self._fill, name="joke-prefetch", daemon=True)
+        self.worker.start()
+
+    def get_nowait(self):
+        """Pop the next ready joke, or None if the worker has not caught up yet."""
+        with self.cond:
+            joke = self.ready.popleft() if self.ready else None
+            self.cond.notify()
+            return joke
+
+    def clear(self):
+        """Drop prefetched jokes, e.g. after the selection mode changed."""
+        with self.cond:
+            self.ready.clear()
+            self.generation += 1
+            self.cond.notify()
+
+    def stop(self):
+        """Ask the worker to exit; it finishes at most the fetch in progress."""
+        with self.cond:
+            self.stopped = True
+            self.ready.clear()
+            self.cond.notify_all()
+
+    def _fill(self):
+        while True:
+            with self.cond:
+                while len(self.ready) >= self.depth and not self.stopped:
+                    self.cond.wait()
+                if self.stopped:
+                    return
+                generation = self.generation
+            try:
+                joke = self.source.next_joke()
+            except Exception as e:
+                # keep the error for the UI and back off before retrying
+                self.error = e
+                with self.cond:
+                    if not self.stopped:
+                        self.cond.wait(timeout=2.0)
+                continue
+            self.error = None
+            with self.cond:
+                if generation == self.generation and not self.stopped:
+                    self.ready.append(joke)
+
+
+# ---------------------------
+# Local HTTP stand-in
+# ---------------------------
+def serve(path, host="127.0.0.1", port=8766):
+    """Serve random jokes from a file as JSON at http://host:port/joke."""
+    corpus = open_corpus(path)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                setup, punch = corpus.random_joke()
+            body = json.dumps({"setup": setup, "punchline": punch}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    print(f"Serving jokes from {path} at http://{host}:{port}/joke")
+    ThreadingHTTPServer((host, port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Local HTTP joke service for testing the prefetch pipeline.")
+    parser.add_argument("file", nargs="?", default=resource_path("randomJokes.txt", __file__))
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+    serve(args.file, port=args.port)
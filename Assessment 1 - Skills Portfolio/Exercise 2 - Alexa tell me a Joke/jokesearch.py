@@ -0,0 +1,230 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import time
+from array import array
+
+# ---------------------------
+# Joke search index
+# ---------------------------
+# An inverted index from words in the setup and punchline to joke numbers (the
+# same numbering as jokestore.JokeCorpus). It is saved next to the joke file as
+# "<file>.search.idx" so later launches skip the build, and when jokes are only
+# appended to the file just the new lines are indexed.
+#
+# File layout:
+#   b"JOKESRC1" | uint32 header length | JSON header | postings...
+#   each posting: uint16 term length, term (UTF-8), uint32 data length,
+#                 joke numbers as varint-encoded gaps (ascending)
+
+MAGIC = b"JOKESRC1"
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+STOPWORDS = frozenset("""
+a about an and any are as at be but by can do does for from get got had has have he her him his
+how i if in into is it its me my of on or our say she so some tell than that the their them
+then there they this to us was we what when where which who why will with you your joke jokes
+""".split())
+# bytes hashed just before the indexed end to check the old part of the file is unchanged
+TAIL_CHECK = 4096
+
+
+def tokenize(text):
+    """Lower-case words without stopwords; a trailing plural 's' is dropped."""
+    out = []
+    for word in TOKEN_RE.findall(text.lower()):
+        word = word.strip("'")
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        if word and word not in STOPWORDS:
+            out.append(word)
+    return out
+
+
+def encode_postings(ids):
+    out = bytearray()
+    prev = 0
+    for i in ids:
+        gap = i - prev
+        prev = i
+        while gap >= 0x80:
+            out.append((gap & 0x7F) | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return bytes(out)
+
+
+def decode_postings(data):
+    ids = array("I")
+    value = shift = prev = 0
+    for b in data:
+        value |= (b & 0x7F) << shift
+        if b & 0x80:
+            shift += 7
+            continue
+        prev += value
+        ids.append(prev)
+        value = shift = 0
+    return ids
+
+
+class JokeSearchIndex:
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + ".search.idx"
+        self.postings = {}        # term -> array of joke numbers (decoded) or bytes (as loaded)
+        self.count = 0            # jokes indexed
+        self.indexed_bytes = 0    # how much of the joke file has been indexed
+        self.signature = None     # (mtime_ns, size) of the joke file when last indexed
+        self.tail_hash = ""
+
+    # ----- keeping the index current -----
+    def refresh(self):
+        """Bring the index up to date with the joke file; returns True if it changed."""
+        st = os.stat(self.path)
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self.signature:
+            return False
+        if self.signature is None and self._load() and self.signature == signature:
+            return True
+        if self.signature is not None and st.st_size > self.indexed_bytes and self._prefix_unchanged():
+            self._index_from(self.indexed_bytes, self.count)
+        else:
+            self.postings, self.count = {}, 0
+            self._index_from(0, 0)
+        self.signature = signature
+        self._save()
+        return True
+
+    def _tail_hash(self, end):
+        with open(self.path, "rb") as f:
+            f.seek(max(0, end - TAIL_CHECK))
+            return hashlib.sha1(f.read(min(end, TAIL_CHECK))).hexdigest()
+
+    def _prefix_unchanged(self):
+        """True if the file only had lines appended since it was indexed."""
+        if self._tail_hash(self.indexed_bytes) != self.tail_hash:
+            return False
+        with open(self.path, "rb") as f:
+            f.seek(max(0, self.indexed_bytes - 1))
+            around = f.read(2)
+        # an unterminated last line that was extended is a changed joke, not an append
+        return self.indexed_bytes == 0 or around[:1] == b"\n" or around[1:2] in (b"\n", b"\r")
+
+    def _add(self, joke_no, text):
+        for term in set(tokenize(text)):
+            ids = self.postings.get(term)
+            if ids is None:
+                ids = self.postings[term] = array("I")
+            elif isinstance(ids, bytes):
+                ids = self.postings[term] = decode_postings(ids)
+            ids.append(joke_no)
+
+    def _index_from(self, offset, joke_no):
+        # joke numbers follow the corpus: every line containing "?" is one joke
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                offset += len(raw)
+                if b"?" in raw:
+                    self._add(joke_no, raw.decode("utf-8", "replace"))
+                    joke_no += 1
+        self.indexed_bytes, self.count = offset, joke_no
+        self.tail_hash = self._tail_hash(offset)
+
+    # ----- persistence -----
+    def _save(self):
+        header = json.dumps({
+            "mtime_ns": self.signature[0], "size": self.signature[1], "count": self.count,
+            "indexed_bytes": self.indexed_bytes, "tail_hash": self.tail_hash,
+        }).encode("utf-8")
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for term, ids in self.postings.items():
+                data = ids if isinstance(ids, bytes) else encode_postings(ids)
+                term_bytes = term.encode("utf-8")
+                f.write(struct.pack("<H", len(term_bytes)) + term_bytes + struct.pack("<I", len(data)) + data)
+        os.replace(tmp_path, self.index_path)
+
+    def _load(self):
+        """Read a saved index; posting lists stay encoded until a query needs them."""
+        try:
+            with open(self.index_path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            return False
+        if not blob.startswith(MAGIC):
+            return False
+        pos = len(MAGIC)
+        (hlen,) = struct.unpack_from("<I", blob, pos)
+        pos += 4
+        meta = json.loads(blob[pos:pos + hlen])
+        pos += hlen
+        postings = {}
+        while pos < len(blob):
+            (tlen,) = struct.unpack_from("<H", blob, pos)
+            term = blob[pos + 2:pos + 2 + tlen].decode("utf-8")
+            pos += 2 + tlen
+            (dlen,) = struct.unpack_from("<I", blob, pos)
+            postings[term] = blob[pos + 4:pos + 4 + dlen]
+            pos += 4 + dlen
+        self.postings = postings
+        self.count = meta["count"]
+        self.indexed_bytes = meta["indexed_bytes"]
+        self.tail_hash = meta["tail_hash"]
+        self.signature = (meta["mtime_ns"], meta["size"])
+        return True
+
+    # ----- queries -----
+    def _ids(self, term):
+        ids = self.postings.get(term)
+        if isinstance(ids, bytes):
+            ids = self.postings[term] = decode_postings(ids)
+        return ids
+
+    def search(self, query, limit=50):
+        """Joke numbers matching all words of the query, or the most words if none match all."""
+        self.refresh()
+        terms = set(tokenize(query))
+        lists = sorted((self._ids(t) or array("I") for t in terms), key=len)
+        if not lists:
+            return []
+        # intersect starting from the rarest word
+        hits = set(lists[0])
+        for ids in lists[1:]:
+            if not hits:
+                break
+            hits.intersection_update(ids)
+        if hits:
+            return sorted(hits)[:limit]
+        # no joke has every word: rank by how many words each joke matches
+        scores = {}
+        for ids in lists:
+            for i in ids:
+                scores[i] = scores.get(i, 0) + 1
+        return sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+
+
+if __name__ == "__main__":
+    from jokestore import open_corpus
+    from resourceloader import resource_path
+
+    parser = argparse.ArgumentParser(description="Search a joke file.")
+    parser.add_argument("query")
+    parser.add_argument("--file", default=resource_path("randomJokes.txt", __file__))
+    args = parser.parse_args()
+
+    index = JokeSearchIndex(args.file)
+    start = time.perf_counter()
+    index.refresh()
+    print(f"index ready in {(time.perf_counter() - start) * 1000:.1f} ms ({index.count} jokes)")
+    corpus = open_corpus(args.file)
+    corpus.refresh()
+    start = time.perf_counter()
+    hits = index.search(args.query)
+    print(f"{len(hits)} match(es) in {(time.perf_counter() - start) * 1000:.2f} ms")
+    for i in hits[:10]:
+        print("  " + "  ".join(corpus.joke(i)))
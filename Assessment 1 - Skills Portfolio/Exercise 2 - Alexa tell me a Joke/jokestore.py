@@ -0,0 +1,204 @@
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+
+# shared helpers (resourceloader.py) live in the portfolio folder one level up
+PORTFOLIO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO_DIR not in sys.path:
+    sys.path.insert(0, PORTFOLIO_DIR)
+from resourceloader import load_parsed
+
+# ---------------------------
+# In-memory joke corpus
+# ---------------------------
+# The joke file is parsed once into a single text buffer plus three offset
+# arrays (setup start, punchline start, end). Picking a joke is then two
+# slices of the buffer, and the file is only parsed again when its mtime or
+# size changes (the parsed arrays are also cached on disk by resourceloader,
+# so a relaunch with an unchanged file skips parsing entirely).
+#
+# For corpora too big to hold in memory, MappedJokeCorpus keeps only a sidecar
+# line-offset index on disk and reads a single line through mmap per pick.
+# open_corpus() chooses between the two based on the file size.
+
+# files above this size use the memory-mapped store
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+def parse_joke_file(path):
+    """Return (buffer, setup starts, punchline starts, ends) for every line containing '?'."""
+    parts = []
+    starts, splits, ends = array("Q"), array("Q"), array("Q")
+    pos = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if "?" not in line:
+                continue
+            line = line.strip()
+            q = line.find("?")
+            parts.append(line)
+            starts.append(pos)
+            splits.append(pos + q + 1)
+            pos += len(line)
+            ends.append(pos)
+    return "".join(parts), starts, splits, ends
+
+
+class JokeCorpus:
+    def __init__(self, path):
+        self.path = path
+        self.buffer = ""
+        self.starts = array("Q")
+        self.splits = array("Q")      # index just after the "?" ending the setup
+        self.ends = array("Q")
+        self.signature = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def refresh(self):
+        """Re-parse the file if it changed since the last load; returns True if it did."""
+        st = os.stat(self.path)
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self.signature:
+            return False
+        self._parse()
+        self.signature = signature
+        return True
+
+    def _parse(self):
+        self.buffer, self.starts, self.splits, self.ends = load_parsed(self.path, parse_joke_file)
+
+    def joke(self, i):
+        """Return (setup, punchline) for joke number i."""
+        buf = self.buffer
+        return buf[self.starts[i]:self.splits[i]], buf[self.splits[i]:self.ends[i]].strip()
+
+    def random_joke(self, rng=random):
+        self.refresh()
+        if not self.starts:
+            raise ValueError(f"No jokes found in {self.path}")
+        return self.joke(rng.randrange(len(self.starts)))
+
+
+def split_joke(line):
+    """Split one joke line into (setup ending in '?', punchline)."""
+    setup, punch = line.strip().split("?", 1)
+    return setup + "?", punch.strip()
+
+
+# ---------------------------
+# Memory-mapped joke corpus
+# ---------------------------
+class MappedJokeCorpus:
+    """Random access to a huge joke file with constant memory.
+
+    On first use a sidecar "<file>.idx" is written: a header holding the source
+    mtime/size and joke count, followed by one little-endian uint64 byte offset
+    per joke line. Both files are then memory-mapped, so a pick reads one index
+    entry and one line; only that line is decoded and split.
+    """
+
+    MAGIC = b"JOKEIDX1"
+    HEADER = struct.Struct("<8sQQQ")     # magic, source mtime_ns, source size, count
+    OFFSET = struct.Struct("<Q")
+
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self.signature = None
+        self.count = 0
+        self.data = None
+        self.index = None
+
+    def __len__(self):
+        return self.count
+
+    def refresh(self):
+        st = os.stat(self.path)
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self.signature:
+            return False
+        self.close()
+        if not self._index_matches(signature):
+            self._build_index(signature)
+        self._open(signature)
+        return True
+
+    def _index_matches(self, signature):
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, mtime_ns, size, _ = self.HEADER.unpack(f.read(self.HEADER.size))
+        except (OSError, struct.error):
+            return False
+        return magic == self.MAGIC and (mtime_ns, size) == signature
+
+    def _build_index(self, signature):
+        # stream the file once, flushing offsets in blocks so memory stays flat
+        tmp_path = self.index_path + ".tmp"
+        count = 0
+        with open(self.path, "rb") as src, open(tmp_path, "wb") as out:
+            out.write(self.HEADER.pack(self.MAGIC, *signature, 0))
+            block = array("Q")
+            pos = 0
+            for line in src:
+                if b"?" in line:
+                    block.append(pos)
+                    if len(block) >= 65536:
+                        count += self._write_block(out, block)
+                        block = array("Q")
+                pos += len(line)
+            count += self._write_block(out, block)
+            out.seek(0)
+            out.write(self.HEADER.pack(self.MAGIC, *signature, count))
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def _write_block(out, block):
+        if sys.byteorder == "big":
+            block.byteswap()
+        out.write(block.tobytes())
+        return len(block)
+
+    def _open(self, signature):
+        with open(self.index_path, "rb") as f:
+            self.count = self.HEADER.unpack(f.read(self.HEADER.size))[3]
+        if self.count:
+            with open(self.path, "rb") as f:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with open(self.index_path, "rb") as f:
+                self.index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.signature = signature
+
+    def line(self, i):
+        start = self.OFFSET.unpack_from(self.index, self.HEADER.size + i * self.OFFSET.size)[0]
+        end = self.data.find(b"\n", start)
+        return self.data[start:end if end >= 0 else len(self.data)].decode("utf-8")
+
+    def joke(self, i):
+        return split_joke(self.line(i))
+
+    def random_joke(self, rng=random):
+        self.refresh()
+        if not self.count:
+            raise ValueError(f"No jokes found in {self.path}")
+        return self.joke(rng.randrange(self.count))
+
+    def close(self):
+        for m in (self.data, self.index):
+            if m is not None:
+                m.close()
+        self.data = self.index = None
+        self.signature = None
+
+
+def open_corpus(path, threshold=MMAP_THRESHOLD):
+    """In-memory store for normal files, memory-mapped store for very large ones."""
+    try:
+        large = os.path.getsize(path) > threshold
+    except OSError:
+        large = False
+    return MappedJokeCorpus(path) if large else JokeCorpus(path)
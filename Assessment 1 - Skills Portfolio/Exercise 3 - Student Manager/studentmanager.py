@@ -1,59 +1,60 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import statistics
-import os 
+import os
+import sys
+
+# shared helpers (resourceloader.py) live in the portfolio folder one level up
+PORTFOLIO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO_DIR not in sys.path:
+    sys.path.insert(0, PORTFOLIO_DIR)
+from gradescheme import DEFAULT_SCHEME
+from resourceloader import load_parsed, resource_path
 
 # ------------------------------------------------------------
 # Utility Functions
 # ------------------------------------------------------------
 
 def calculate_grade(percent):
-    if percent >= 70:
-        return "A"
-    elif percent >= 60:
-        return "B"
-    elif percent >= 50:
-        return "C"
-    elif percent >= 40:
-        return "D"
-    return "F"
-
-import os
-
-def load_students(filename="studentMarks.txt"):
-    # Make sure file is loaded from same folder as studentmanager.py
-    filename = os.path.join(os.path.dirname(__file__), filename)
+    # boundaries live in gradescheme.py, shared with the extension app
+    return DEFAULT_SCHEME.grade(percent)
 
+def parse_students(filename):
     students = []
-    try:
-        with open(filename, "r") as file:
-            count = int(file.readline().strip())
+    with open(filename, "r") as file:
+        count = int(file.readline().strip())
 
-            for _ in range(count):
-                line = file.readline().strip()
-                if not line:
-                    continue
+        for _ in range(count):
+            line = file.readline().strip()
+            if not line:
+                continue
 
-                sid, name, c1, c2, c3, exam = line.split(",")
+            sid, name, c1, c2, c3, exam = line.split(",")
 
-                c1, c2, c3 = int(c1), int(c2), int(c3)
-                exam = int(exam)
-                coursework_total = c1 + c2 + c3
+            c1, c2, c3 = int(c1), int(c2), int(c3)
+            exam = int(exam)
+            coursework_total = c1 + c2 + c3
 
-                overall = (coursework_total + exam) / 160 * 100
-                grade = calculate_grade(overall)
+            overall = DEFAULT_SCHEME.overall(coursework_total, exam)
+            grade = calculate_grade(overall)
 
-                students.append({
-                    "id": int(sid),
-                    "name": name,
-                    "course": coursework_total,
-                    "exam": exam,
-                    "overall": overall,
-                    "grade": grade
-                })
+            students.append({
+                "id": int(sid),
+                "name": name,
+                "course": coursework_total,
+                "exam": exam,
+                "overall": overall,
+                "grade": grade
+            })
 
-        return students
+    return students
 
+def load_students(filename="studentMarks.txt"):
+    # Shared copy in "A1 - Resources" unless this folder has its own,
+    # parsed results are cached on disk until the file changes
+    filename = resource_path(filename, __file__)
+    try:
+        return load_parsed(filename, parse_students)
     except:
         messagebox.showerror("Error", f"Failed to load file: {filename}")
         return []
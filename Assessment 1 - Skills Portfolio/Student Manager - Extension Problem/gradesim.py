@@ -0,0 +1,175 @@
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from collections import Counter
+
+from studentmanagerextension import parse_students    # also puts the portfolio folder on sys.path
+from gradescheme import BOUNDARIES, DEFAULT_SCHEME, GRADES, GradingScheme
+from resourceloader import load_parsed, resource_path
+
+try:
+    import numpy as np
+except ImportError:     # pure-Python fallback, same results
+    np = None
+
+# ---------------------------
+# What-if grading simulator
+# ---------------------------
+# Compares grade outcomes under many candidate schemes (coursework/exam
+# weighting and grade boundaries) against the current rule in gradescheme.py.
+#
+# A student's overall mark depends only on their (coursework, exam) pair, of
+# which there are at most 61 x 101, so the cohort is first reduced to counts
+# per pair. Every scheme is then evaluated on those cells at once: one
+# cells x schemes matrix with numpy, or a loop per scheme without it. Cost no
+# longer grows with the number of students.
+#
+#   python gradesim.py                                 (grid of weightings x boundary shifts)
+#   python gradesim.py --schemes schemes.json --json out.json
+#   python gradesim.py --random 1000000 --detail cw50%+0 --changes cw50.csv
+#
+# schemes.json: [{"name": "exam heavy", "coursework": 25, "boundaries": {"A": 70, "B": 60, "C": 50, "D": 40}}]
+
+
+def grid_schemes(shares=range(20, 81, 5), shifts=range(-5, 6)):
+    """Coursework shares (percent) x uniform shifts of every grade boundary."""
+    return [GradingScheme.from_share(share, [(g, low + shift) for g, low in BOUNDARIES],
+                                     name=f"cw{share}%{shift:+d}")
+            for share in shares for shift in shifts]
+
+
+def load_schemes(path):
+    with open(path, "r", encoding="utf-8") as f:
+        specs = json.load(f)
+    schemes = []
+    for spec in specs:
+        boundaries = list(spec.get("boundaries", dict(BOUNDARIES)).items())
+        schemes.append(GradingScheme.from_share(spec["coursework"], boundaries, spec.get("name")))
+    return schemes
+
+
+def mark_cells(students):
+    """Counter of (course, exam) -> number of students."""
+    return Counter((s["course"], s["exam"]) for s in students)
+
+
+def grade_cells(cells, schemes):
+    """Grade index (0 = A .. 4 = F) per cell for every scheme: a list per scheme."""
+    for scheme in schemes:
+        if [g for g, _ in scheme.boundaries] != list(GRADES[:-1]):
+            raise ValueError(f"{scheme.name}: boundaries must be given for {', '.join(GRADES[:-1])} in order")
+    if np is not None:
+        course = np.array([c for c, _ in cells], dtype=float)[:, None]
+        exam = np.array([e for _, e in cells], dtype=float)[:, None]
+        cw = np.array([s.course_weight for s in schemes], dtype=float)
+        ew = np.array([s.exam_weight for s in schemes], dtype=float)
+        total = np.array([s.total for s in schemes], dtype=float)
+        lows = np.array([[low for _, low in s.boundaries] for s in schemes], dtype=float)
+        overall = (course * cw + exam * ew) / total * 100                  # cells x schemes
+        passed = (overall[:, :, None] >= lows[None, :, :]).sum(axis=2)     # boundaries reached
+        return list((len(GRADES) - 1 - passed).T)
+    index = {g: i for i, g in enumerate(GRADES)}
+    return [[index[s.grade(s.overall(c, e))] for c, e in cells] for s in schemes]
+
+
+def simulate(students, schemes, baseline=DEFAULT_SCHEME):
+    """Grade distribution per scheme and how many students change grade from the baseline."""
+    counter = mark_cells(students)
+    cells = list(counter)
+    counts = [counter[c] for c in cells]
+    base, *graded = grade_cells(cells, [baseline] + list(schemes))
+    base = list(base)
+    results = []
+    for scheme, grades in zip(schemes, graded):
+        distribution = [0] * len(GRADES)
+        changed = up = 0
+        for n, g, b in zip(counts, grades, base):
+            distribution[g] += n
+            if g != b:
+                changed += n
+                up += n if g < b else 0
+        results.append({"scheme": scheme.name, "distribution": dict(zip(GRADES, distribution)),
+                        "changed": changed, "improved": up, "worsened": changed - up})
+    baseline_distribution = [0] * len(GRADES)
+    for n, b in zip(counts, base):
+        baseline_distribution[b] += n
+    return dict(zip(GRADES, baseline_distribution)), results
+
+
+def student_changes(students, scheme, baseline=DEFAULT_SCHEME):
+    """(student, overall, grade) under the scheme for every student whose grade changes."""
+    changes = []
+    for s in students:
+        overall = scheme.overall(s["course"], s["exam"])
+        grade = scheme.grade(overall)
+        if grade != baseline.grade(baseline.overall(s["course"], s["exam"])):
+            changes.append((s, overall, grade))
+    return changes
+
+
+def random_cohort(n, seed=1):
+    rng = random.Random(seed)
+    students = []
+    for i in range(n):
+        course = rng.randint(0, 20) + rng.randint(0, 20) + rng.randint(0, 20)
+        exam = rng.randint(0, 100)
+        students.append({"id": i, "name": f"Student {i}", "course": course, "exam": exam})
+    return students
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare grade outcomes under alternative grading schemes.")
+    parser.add_argument("--file", default="studentMarks.txt", help="marks file (default: the student manager's)")
+    parser.add_argument("--random", type=int, metavar="N", help="use a random cohort of N students instead")
+    parser.add_argument("--schemes", help="JSON list of schemes (default: a grid of weightings and boundary shifts)")
+    parser.add_argument("--detail", metavar="NAME", help="list the students whose grade changes under this scheme")
+    parser.add_argument("--changes", help="write the --detail students to this CSV file instead of printing")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    if args.random:
+        students = random_cohort(args.random)
+    else:
+        students = load_parsed(resource_path(args.file, __file__), parse_students)
+    schemes = load_schemes(args.schemes) if args.schemes else grid_schemes()
+
+    start = time.perf_counter()
+    baseline, results = simulate(students, schemes)
+    elapsed = time.perf_counter() - start
+
+    header = "".join(f"{g:>8}" for g in GRADES)
+    print(f"{'scheme':<16}{header}{'changed':>10}{'up':>8}{'down':>8}")
+    print(f"{DEFAULT_SCHEME.name:<16}" + "".join(f"{baseline[g]:>8}" for g in GRADES))
+    for r in results:
+        shifts = "".join(f"{r['distribution'][g] - baseline[g]:>+8}" for g in GRADES)
+        print(f"{r['scheme']:<16}{shifts}{r['changed']:>10}{r['improved']:>8}{r['worsened']:>8}")
+    print(f"{len(students)} students x {len(schemes)} schemes in {elapsed * 1000:.0f} ms "
+          f"({'numpy' if np is not None else 'pure Python'})")
+
+    if args.detail:
+        scheme = next((s for s in schemes if s.name == args.detail), None)
+        if scheme is None:
+            sys.exit(f"No scheme named {args.detail!r}")
+        changes = student_changes(students, scheme)
+        rows = [(s["id"], s.get("name", ""), f"{DEFAULT_SCHEME.overall(s['course'], s['exam']):.2f}",
+                 DEFAULT_SCHEME.grade(DEFAULT_SCHEME.overall(s["course"], s["exam"])), f"{overall:.2f}", grade)
+                for s, overall, grade in changes]
+        if args.changes:
+            with open(args.changes, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["id", "name", "overall_now", "grade_now", "overall_new", "grade_new"])
+                writer.writerows(rows)
+            print(f"{len(rows)} changed students written to {args.changes}")
+        else:
+            for row in rows:
+                print("  {} {}: {}% {} -> {}% {}".format(*row))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"students": len(students), "baseline": baseline, "schemes": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
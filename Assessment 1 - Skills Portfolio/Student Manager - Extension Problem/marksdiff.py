@@ -0,0 +1,200 @@
+import argparse
+import heapq
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from studentmanagerextension import parse_record
+
+# ---------------------------
+# Diff / merge two studentMarks files
+# ---------------------------
+# Both files are streamed in ID order and merge-joined in one pass, so memory
+# stays bounded however large the files are. A file that is not already
+# sorted by ID is sorted externally: sorted chunks of --chunk-size records
+# are written to temporary files and combined with heapq.merge.
+#
+#   python marksdiff.py marker1.txt marker2.txt
+#   python marksdiff.py marker1.txt marker2.txt -o merged.txt --policy max
+#
+# Policies for students whose marks differ in the merged file:
+#   right  take the second file's record (default)   left  take the first file's
+#   max    higher of each mark                        min   lower of each mark
+
+FIELDS = ("name", "c1", "c2", "c3", "exam")
+MARKS = ("c1", "c2", "c3", "exam")
+POLICIES = ("right", "left", "max", "min")
+CHUNK_SIZE = 200_000
+
+
+def format_record(s):
+    return f"{s['id']},{s['name']},{s['c1']},{s['c2']},{s['c3']},{s['exam']}\n"
+
+
+def read_records(path):
+    """Student records of a marks file in file order; the count header line is skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        if first.strip() and not first.strip().isdigit():
+            f.seek(0)
+        for line in f:
+            student = parse_record(line)
+            if student:
+                yield student
+
+
+def is_sorted(path):
+    previous = None
+    for s in read_records(path):
+        if previous is not None and s["id"] < previous:
+            return False
+        previous = s["id"]
+    return True
+
+
+def _write_chunk(records, tmpdir):
+    records.sort(key=lambda s: s["id"])
+    fd, path = tempfile.mkstemp(suffix=".chunk", dir=tmpdir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.writelines(format_record(s) for s in records)
+    return path
+
+
+def sorted_records(path, tmpdir, chunk_size=CHUNK_SIZE):
+    """Records of a marks file in ID order, sorting externally if the file isn't already."""
+    if is_sorted(path):
+        yield from read_records(path)
+        return
+    chunks = []
+    records = iter(read_records(path))
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            break
+        chunks.append(_write_chunk(chunk, tmpdir))
+    try:
+        yield from heapq.merge(*(read_records(c) for c in chunks), key=lambda s: s["id"])
+    finally:
+        for c in chunks:
+            os.remove(c)
+
+
+def unique(records, duplicates):
+    """Drop repeated IDs (keeping the first) and count them in duplicates[0]."""
+    previous = None
+    for s in records:
+        if s["id"] == previous:
+            duplicates[0] += 1
+            continue
+        previous = s["id"]
+        yield s
+
+
+def merge_join(left, right):
+    """Yield (left, right) pairs matched by ID from two ID-ordered streams; a missing side is None."""
+    left, right = iter(left), iter(right)
+    a, b = next(left, None), next(right, None)
+    while a is not None or b is not None:
+        if b is None or (a is not None and a["id"] < b["id"]):
+            yield a, None
+            a = next(left, None)
+        elif a is None or b["id"] < a["id"]:
+            yield None, b
+            b = next(right, None)
+        else:
+            yield a, b
+            a, b = next(left, None), next(right, None)
+
+
+def deltas(a, b):
+    """field -> (old, new) for every field that differs."""
+    return {f: (a[f], b[f]) for f in FIELDS if a[f] != b[f]}
+
+
+def resolve(a, b, policy):
+    if policy == "left":
+        return a
+    if policy == "right":
+        return b
+    pick = max if policy == "max" else min
+    merged = {"id": b["id"], "name": b["name"]}
+    merged.update({f: pick(a[f], b[f]) for f in MARKS})
+    return merged
+
+
+def describe(change):
+    parts = []
+    for f, (old, new) in change.items():
+        parts.append(f"{f} '{old}' -> '{new}'" if f == "name" else f"{f} {old} -> {new} ({new - old:+d})")
+    return ", ".join(parts)
+
+
+def diff(left_path, right_path, merged_path=None, policy="right", chunk_size=CHUNK_SIZE, out=sys.stdout):
+    """Report added/removed/changed students and optionally write the merged file; returns the counts."""
+    counts = {"same": 0, "added": 0, "removed": 0, "changed": 0}
+    duplicates = [0]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        left = unique(sorted_records(left_path, tmpdir, chunk_size), duplicates)
+        right = unique(sorted_records(right_path, tmpdir, chunk_size), duplicates)
+        # the merged file starts with a count, so the body is streamed to a temp file first
+        body = open(os.path.join(tmpdir, "merged.body"), "w", encoding="utf-8") if merged_path else None
+        written = 0
+        try:
+            for a, b in merge_join(left, right):
+                if a is None:
+                    counts["added"] += 1
+                    out.write(f"+ {b['id']} {b['name']}\n")
+                    keep = b
+                elif b is None:
+                    counts["removed"] += 1
+                    out.write(f"- {a['id']} {a['name']}\n")
+                    keep = a
+                else:
+                    change = deltas(a, b)
+                    if change:
+                        counts["changed"] += 1
+                        overall = b["overall"] - a["overall"]
+                        out.write(f"~ {a['id']} {b['name']}: {describe(change)}; overall {overall:+.2f}\n")
+                        keep = resolve(a, b, policy)
+                    else:
+                        counts["same"] += 1
+                        keep = a
+                if body:
+                    body.write(format_record(keep))
+                    written += 1
+        finally:
+            if body:
+                body.close()
+        if merged_path:
+            with open(merged_path, "w", encoding="utf-8") as f, \
+                    open(os.path.join(tmpdir, "merged.body"), "r", encoding="utf-8") as src:
+                f.write(f"{written}\n")
+                shutil.copyfileobj(src, f)
+    counts["duplicate ids"] = duplicates[0]
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two studentMarks files and optionally merge them.")
+    parser.add_argument("left", help="first (older) marks file")
+    parser.add_argument("right", help="second (newer) marks file")
+    parser.add_argument("-o", "--output", help="write the merged marks file here")
+    parser.add_argument("--policy", choices=POLICIES, default="right", help="how to merge changed students")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="records per external-sort chunk")
+    parser.add_argument("--quiet", action="store_true", help="print only the summary")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    out = open(os.devnull, "w") if args.quiet else sys.stdout
+    counts = diff(args.left, args.right, args.output, args.policy, args.chunk_size, out)
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{v} {k}" for k, v in counts.items()) + f"  ({elapsed:.2f}s)")
+    if args.output:
+        print(f"Merged file written to {args.output} (policy: {args.policy})")
+
+
+if __name__ == "__main__":
+    main()
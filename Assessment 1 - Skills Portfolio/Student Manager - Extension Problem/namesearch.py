@@ -0,0 +1,136 @@
+import re
+
+# ---------------------------
+# Fuzzy student name search
+# ---------------------------
+# Every word of every name goes into a BK-tree keyed by edit distance. A
+# lookup only walks the branches whose distance could still be within k of
+# the query (triangle inequality), so a typo such as "sheerer" finds
+# "shearer" without computing the distance to every name in the cohort.
+#
+# A query matches a student when each query word is within k edits of some
+# word of the name; results are ordered by the total number of edits.
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def words(text):
+    return WORD_RE.findall(text.lower())
+
+
+def max_edits(word):
+    """Typos allowed for a query word: none for very short words, two for long ones."""
+    return 0 if len(word) <= 2 else 1 if len(word) <= 7 else 2
+
+
+def pattern(a):
+    """Per-character bit masks of a, reusable across many edit_distance calls."""
+    masks = {}
+    for i, c in enumerate(a):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks, len(a)
+
+
+def edit_distance(a, b, compiled=None):
+    """Levenshtein distance using Myers' bit-parallel algorithm: one pass over b."""
+    masks, m = compiled or pattern(a)
+    if not m:
+        return len(b)
+    all_bits = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = all_bits, 0, m
+    for c in b:
+        eq = masks.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & all_bits)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & all_bits
+        mh = (mh << 1) & all_bits
+        pv = mh | (~(xv | ph) & all_bits)
+        mv = ph & xv
+    return score
+
+
+class BKTree:
+    def __init__(self):
+        self.root = None        # [word, {distance: child node}]
+
+    def add(self, word):
+        if self.root is None:
+            self.root = [word, {}]
+            return
+        node = self.root
+        while True:
+            d = edit_distance(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}]
+                return
+            node = child
+
+    def search(self, word, k):
+        """(distance, word) for every stored word within k edits."""
+        found = []
+        compiled = pattern(word)
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            d = edit_distance(word, node[0], compiled)
+            if d <= k:
+                found.append((d, node[0]))
+            for edge, child in node[1].items():
+                if d - k <= edge <= d + k:
+                    stack.append(child)
+        return found
+
+
+class NameIndex:
+    def __init__(self, students=()):
+        self.tree = BKTree()
+        self.ids = {}           # word -> set of student ids with that word in their name
+        self.by_id = {}
+        for s in students:
+            self.add(s)
+
+    def add(self, s):
+        self.by_id[s["id"]] = s
+        for w in set(words(s["name"])):
+            if w not in self.ids:
+                self.ids[w] = set()
+                self.tree.add(w)
+            self.ids[w].add(s["id"])
+
+    def remove(self, s):
+        """Forget a student; call before renaming so the old words are found."""
+        self.by_id.pop(s["id"], None)
+        # BK-trees can't delete, the word stays in the tree with no students
+        for w in set(words(s["name"])):
+            self.ids.get(w, set()).discard(s["id"])
+
+    def search(self, query, limit=10):
+        """Students whose name is within a few typos of the query, closest first."""
+        query_words = words(query)
+        if not query_words:
+            return []
+        scores = None
+        for qw in query_words:
+            best = {}
+            for d, w in self.tree.search(qw, max_edits(qw)):
+                for sid in self.ids[w]:
+                    if d < best.get(sid, d + 1):
+                        best[sid] = d
+            if scores is None:
+                scores = best
+            else:
+                scores = {sid: scores[sid] + d for sid, d in best.items() if sid in scores}
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda item: (item[1], self.by_id[item[0]]["name"]))
+        return [self.by_id[sid] for sid, _ in ranked[:limit]]
@@ -0,0 +1,259 @@
+import argparse
+import hashlib
+import html
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from studentmanagerextension import ordinal, parse_students    # also puts the portfolio folder on sys.path
+from resourceloader import load_parsed, resource_path
+from studentquery import StudentIndex
+
+# ---------------------------
+# Per-student transcript generator
+# ---------------------------
+# Writes one transcript per student with the same details as the app's
+# student card: coursework c1..c3, exam, overall, grade and class rank.
+#
+# Students are split into chunks that a process pool renders in parallel;
+# each worker writes its files one at a time as it goes. Files are written
+# under a temporary name and renamed when complete, so after an interruption
+# a re-run skips every transcript that already exists and carries on.
+#
+# Ranks depend on the whole class, so the output folder records a hash of the
+# marks the transcripts were made from (.<format>-data-version). When the marks
+# have changed since, every transcript of that format is rewritten. A student
+# whose transcript fails (e.g. wkhtmltopdf errors) is reported at the end and
+# retried by the next run.
+#
+#   python reportgen.py                          (text transcripts in ./transcripts)
+#   python reportgen.py --format html --workers 8
+#   python reportgen.py --format pdf             (needs wkhtmltopdf on the PATH)
+
+FORMATS = ("txt", "html", "pdf")
+MARK_FIELDS = ("id", "name", "c1", "c2", "c3", "exam")
+CHUNK_SIZE = 250
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Transcript {sid}</title>
+<style>
+body {{ font-family: "Segoe UI", sans-serif; margin: 40px; color: #162238; }}
+h1 {{ margin-bottom: 0; }} .id {{ color: #5b6b85; margin-top: 4px; }}
+table {{ border-collapse: collapse; margin-top: 20px; }}
+td {{ padding: 6px 18px 6px 0; border-bottom: 1px solid #d8dee9; }}
+.grade {{ font-size: 1.4em; font-weight: bold; color: {colour}; }}
+</style></head>
+<body>
+<h1>{name}</h1>
+<p class="id">Student ID {sid}</p>
+<table>
+<tr><td>Coursework 1</td><td>{c1} / 20</td></tr>
+<tr><td>Coursework 2</td><td>{c2} / 20</td></tr>
+<tr><td>Coursework 3</td><td>{c3} / 20</td></tr>
+<tr><td>Coursework total</td><td>{course} / 60</td></tr>
+<tr><td>Exam mark</td><td>{exam} / 100</td></tr>
+<tr><td><b>Overall</b></td><td><b>{overall:.2f}%</b></td></tr>
+<tr><td>Grade</td><td class="grade">{grade}</td></tr>
+<tr><td>Rank</td><td>{rank} of {total} ({percentile_text} percentile)</td></tr>
+</table>
+</body></html>
+"""
+
+
+# ---------------------------
+# Rendering
+# ---------------------------
+def render_text(s):
+    title = "Student Transcript"
+    lines = [title, "=" * len(title), "",
+             f"Name          : {s['name']}",
+             f"Student ID    : {s['id']}", "",
+             f"Coursework 1  : {s['c1']:>3} / 20",
+             f"Coursework 2  : {s['c2']:>3} / 20",
+             f"Coursework 3  : {s['c3']:>3} / 20",
+             f"Coursework    : {s['course']:>3} / 60",
+             f"Exam Mark     : {s['exam']:>3} / 100",
+             f"Overall       : {s['overall']:.2f}%",
+             f"Grade         : {s['grade']}",
+             f"Rank          : {s['rank']} of {s['total']} ({ordinal(s['percentile'])} percentile)", ""]
+    return "\n".join(lines)
+
+
+def render_html(s):
+    fields = dict(s, sid=s["id"], name=html.escape(s["name"]), percentile_text=ordinal(s["percentile"]),
+                  colour="#00a862" if s["grade"] in ("A", "B") else "#d64545")
+    return HTML_TEMPLATE.format(**fields)
+
+
+def write_report(s, fmt, out_dir, renderer=None):
+    """Render one transcript to <out_dir>/<id>.<fmt>, replacing it atomically."""
+    path = os.path.join(out_dir, f"{s['id']}.{fmt}")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        if fmt == "pdf":
+            source = f"{tmp}.html"      # wkhtmltopdf needs the .html extension to read it as HTML
+            with open(source, "w", encoding="utf-8") as f:
+                f.write(render_html(s))
+            try:
+                subprocess.run([renderer, "--quiet", source, tmp], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            finally:
+                os.remove(source)
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(render_text(s) if fmt == "txt" else render_html(s))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return os.path.getsize(path)
+
+
+def write_chunk(job):
+    """Worker entry point: write every transcript in a chunk, return (written, bytes, failures).
+
+    failures is a list of (student id, error message); one bad student doesn't stop the chunk.
+    """
+    students, fmt, out_dir, renderer = job
+    written = size = 0
+    failures = []
+    for s in students:
+        try:
+            size += write_report(s, fmt, out_dir, renderer)
+            written += 1
+        except (OSError, subprocess.CalledProcessError) as e:
+            failures.append((s["id"], str(e)))
+    return written, size, failures
+
+
+# ---------------------------
+# Batch run
+# ---------------------------
+def data_version(students):
+    """Hash of every student's marks; any change can move every rank."""
+    digest = hashlib.sha1()
+    for s in sorted(students, key=lambda s: s["id"]):
+        digest.update(repr(tuple(s[k] for k in MARK_FIELDS)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def remove_transcripts(out_dir, fmt):
+    """Delete every <id>.<fmt> transcript in out_dir; returns how many were removed."""
+    removed = 0
+    if os.path.isdir(out_dir):
+        for entry in os.scandir(out_dir):
+            if entry.name.endswith(f".{fmt}"):
+                os.remove(entry.path)
+                removed += 1
+    return removed
+
+
+def check_data_version(students, fmt, out_dir):
+    """Remove transcripts made from different marks, then record the current version."""
+    version_file = os.path.join(out_dir, f".{fmt}-data-version")
+    version = data_version(students)
+    try:
+        with open(version_file, "r", encoding="utf-8") as f:
+            previous = f.read().strip()
+    except OSError:
+        previous = None
+    if previous != version:
+        removed = remove_transcripts(out_dir, fmt)
+        if removed:
+            print(f"  marks have changed since the last run: rewriting {removed:,} existing transcript(s)")
+        with open(version_file, "w", encoding="utf-8") as f:
+            f.write(version + "\n")
+
+
+def pending_students(students, fmt, out_dir):
+    """Students with their rank attached, minus those whose transcript already exists."""
+    done = set()
+    for entry in os.scandir(out_dir):
+        if entry.name.endswith((".tmp", ".tmp.html")):
+            os.remove(entry.path)       # left behind by an interrupted run (.tmp.html: PDF mode's HTML source)
+        else:
+            done.add(entry.name)
+    index = StudentIndex(students)
+    pending = []
+    for s in students:
+        if f"{s['id']}.{fmt}" in done:
+            continue
+        rank, total, percentile = index.rank(s)
+        pending.append(dict(s, rank=rank, total=total, percentile=percentile))
+    return pending
+
+
+def run(students, fmt, out_dir, workers, chunk_size=CHUNK_SIZE, renderer=None):
+    """Write the missing transcripts; returns (written, skipped, bytes, failures)."""
+    os.makedirs(out_dir, exist_ok=True)
+    check_data_version(students, fmt, out_dir)
+    pending = pending_students(students, fmt, out_dir)
+    skipped = len(students) - len(pending)
+    jobs = [(pending[i:i + chunk_size], fmt, out_dir, renderer) for i in range(0, len(pending), chunk_size)]
+    written = size = done = 0
+    failures = []
+    start = shown = time.perf_counter()
+
+    def progress(count, nbytes, failed):
+        nonlocal written, size, done, shown
+        written += count
+        size += nbytes
+        failures.extend(failed)
+        done += count + len(failed)
+        now = time.perf_counter()
+        if now - shown >= 0.2 or done == len(pending):
+            shown = now
+            rate = done / max(now - start, 1e-9)
+            print(f"\r  {done:,} / {len(pending):,} transcripts  ({rate:,.0f}/s)", end="", flush=True)
+
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            progress(*write_chunk(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(write_chunk, job) for job in jobs]):
+                progress(*future.result())
+    if jobs:
+        print()
+    return written, skipped, size, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write an individual transcript for every student.")
+    parser.add_argument("--file", default="studentMarks.txt", help="marks file (default: the student manager's)")
+    parser.add_argument("--format", choices=FORMATS, default="txt")
+    parser.add_argument("--out", default="transcripts", help="output folder")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="students per work item")
+    parser.add_argument("--fresh", action="store_true", help="rewrite transcripts that already exist")
+    args = parser.parse_args(argv)
+
+    renderer = None
+    if args.format == "pdf":
+        renderer = shutil.which("wkhtmltopdf")
+        if not renderer:
+            sys.exit("PDF output needs wkhtmltopdf on the PATH (or use --format html).")
+    if args.fresh:
+        remove_transcripts(args.out, args.format)
+
+    students = load_parsed(resource_path(args.file, __file__), parse_students)
+    start = time.perf_counter()
+    written, skipped, size, failures = run(students, args.format, args.out, args.workers, args.chunk_size, renderer)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {written:,} transcript(s) ({size / 1024 / 1024:.1f} MB) to {args.out} in {elapsed:.2f}s"
+          f" - {written / max(elapsed, 1e-9):,.0f}/s, {skipped:,} already done")
+    if failures:
+        print(f"{len(failures):,} transcript(s) failed (re-run to retry them):")
+        for sid, message in failures[:10]:
+            print(f"  {sid}: {message}")
+        if len(failures) > 10:
+            print(f"  ... and {len(failures) - 10:,} more")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
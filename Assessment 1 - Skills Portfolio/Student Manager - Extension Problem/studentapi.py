@@ -0,0 +1,254 @@
+import argparse
+import hashlib
+import json
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import studentmanagerextension    # also puts the portfolio folder on sys.path
+from studentmanagerextension import parse_students
+from gradescheme import GRADES
+from resourceloader import file_signature, load_parsed, resource_path
+from studentquery import QueryError, StudentIndex, parse_query
+
+# ---------------------------
+# Read-only student query API
+# ---------------------------
+# A small local HTTP/JSON service over the student manager's data, so other
+# tools don't have to scrape and re-parse studentMarks.txt themselves. It
+# answers from the same indexes the app uses (studentquery.StudentIndex).
+#
+#   GET /students/<id>                 one student, with rank and percentile
+#   GET /students?name=<text>          ID / name / typo-tolerant name lookup
+#   GET /students?q=<filter>           filter query, e.g. q=exam<40 and course>45
+#   GET /students?offset=0&limit=100   every student, paged
+#   GET /stats                         class size, averages and grade counts
+#   GET /top?n=20   /bottom?n=50       best / lowest overall marks
+#
+# The marks file is re-read when it changes on disk (e.g. after an edit in the
+# app). Each load gets a data version derived from the file's size and mtime;
+# it is the ETag of every response, so clients can send If-None-Match and get
+# a 304. Rendered responses are cached until the version changes. While the
+# file is missing or unreadable every request gets a 503 with a JSON error.
+#
+#   python studentapi.py                 (http://127.0.0.1:8767)
+#   python studentapiloadtest.py         (requests/s and latency percentiles)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8767      # 8765 is the quiz server, 8766 the joke service
+MAX_LIMIT = 1000
+CACHE_SIZE = 2048
+CHECK_INTERVAL = 0.5     # seconds between checks of the marks file on disk
+
+
+class StudentRepository:
+    """The parsed students and their index, reloaded when the marks file changes."""
+
+    def __init__(self, filename="studentMarks.txt", check_interval=CHECK_INTERVAL):
+        self.filename = filename
+        self.check_interval = check_interval
+        self.lock = threading.Lock()
+        self.signature = None
+        self.state = (None, None)       # (data version, StudentIndex), swapped as one on reload
+        self.cache = OrderedDict()      # request path -> (status, body)
+        self.checked = 0.0
+        try:
+            self.current()
+        except OSError:
+            pass        # reported to clients as a 503 until the file can be read
+
+    def path(self):
+        return resource_path(self.filename, studentmanagerextension.__file__)
+
+    def current(self):
+        """(data version, StudentIndex), reloading first if the file has changed.
+
+        Raises OSError while the marks file is missing or unreadable.
+        """
+        now = time.monotonic()
+        if now - self.checked < self.check_interval:
+            return self.state
+        with self.lock:
+            path = self.path()
+            try:
+                signature = file_signature(path)
+                if signature != self.signature:
+                    students = load_parsed(path, parse_students)
+                    version = hashlib.sha1(f"{path}|{signature}".encode("utf-8")).hexdigest()[:16]
+                    self.state = (version, StudentIndex(students))
+                    self.signature = signature
+                    self.cache.clear()
+            except OSError:
+                # don't serve stale data; check again on the next request
+                self.state, self.signature, self.checked = (None, None), None, 0.0
+                self.cache.clear()
+                raise
+            self.checked = now
+            return self.state
+
+    def cached(self, version, key):
+        with self.lock:
+            if version != self.state[0] or key not in self.cache:
+                return None
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+    def store(self, version, key, response):
+        with self.lock:
+            if version != self.state[0]:
+                return
+            self.cache[key] = response
+            if len(self.cache) > CACHE_SIZE:
+                self.cache.popitem(last=False)
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def student_json(s, index=None):
+    data = {"id": s["id"], "name": s["name"], "c1": s["c1"], "c2": s["c2"], "c3": s["c3"],
+            "course": s["course"], "exam": s["exam"], "overall": round(s["overall"], 2), "grade": s["grade"]}
+    if index is not None:
+        rank, total, percentile = index.rank(s)
+        data.update(rank=rank, of=total, percentile=round(percentile, 1))
+    return data
+
+
+def int_param(params, name, default, low=0, high=MAX_LIMIT):
+    try:
+        value = int(params.get(name, [default])[0])
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer")
+    return min(max(value, low), high)
+
+
+def page(students, params):
+    offset = int_param(params, "offset", 0, high=len(students))
+    limit = int_param(params, "limit", 100, low=1)
+    return {"total": len(students), "offset": offset,
+            "students": [student_json(s) for s in students[offset:offset + limit]]}
+
+
+def route(index, path, params):
+    """Answer one GET request from the index; returns a JSON-able object or raises ApiError."""
+    parts = [p for p in path.split("/") if p]
+    if parts == []:
+        return {"endpoints": ["/students/<id>", "/students?name=", "/students?q=",
+                              "/students?offset=&limit=", "/stats", "/top?n=", "/bottom?n="]}
+    if parts[0] == "students" and len(parts) == 2:
+        if not parts[1].isdigit() or int(parts[1]) not in index.by_id:
+            raise ApiError(404, f"No student with ID {parts[1]}")
+        return student_json(index.by_id[int(parts[1])], index)
+    if parts == ["students"]:
+        if "name" in params:
+            matches, fuzzy = index.lookup(params["name"][0])
+            result = page(matches, params)
+            result["fuzzy"] = fuzzy
+            return result
+        if "q" in params:
+            try:
+                return page(index.query(parse_query(params["q"][0])), params)
+            except QueryError as e:
+                raise ApiError(400, str(e))
+        return page(list(index.by_id.values()), params)
+    if parts == ["stats"]:
+        overall = [s["overall"] for s in index.by_id.values()]
+        grades = {g: 0 for g in GRADES}
+        for s in index.by_id.values():
+            grades[s["grade"]] = grades.get(s["grade"], 0) + 1
+        return {"count": len(overall),
+                "mean": round(statistics.mean(overall), 2) if overall else None,
+                "median": round(statistics.median(overall), 2) if overall else None,
+                "min": round(min(overall), 2) if overall else None,
+                "max": round(max(overall), 2) if overall else None,
+                "grades": grades}
+    if parts in (["top"], ["bottom"]):
+        n = int_param(params, "n", 20, low=1)
+        chosen = index.top(n) if parts[0] == "top" else index.bottom(n)
+        return {"students": [student_json(s, index) for s in chosen]}
+    raise ApiError(404, f"Unknown endpoint {path}")
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive, every response has a Content-Length
+    disable_nagle_algorithm = True      # headers and body are separate writes; don't wait on delayed ACKs
+    repository = None
+    quiet = True
+
+    def do_GET(self):
+        try:
+            version, index = self.repository.current()
+        except OSError as e:
+            self.send_json(503, json.dumps({"error": f"Student records unavailable: {e}"}).encode("utf-8"))
+            return
+        etag = f'"{version}"'
+        if etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        response = self.repository.cached(version, self.path)
+        if response is None:
+            url = urlsplit(self.path)
+            try:
+                response = 200, json.dumps(route(index, url.path, parse_qs(url.query))).encode("utf-8")
+            except ApiError as e:
+                response = e.status, json.dumps({"error": str(e)}).encode("utf-8")
+            self.repository.store(version, self.path, response)
+
+        self.send_json(*response, etag)
+
+    def send_json(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128    # the default of 5 drops bursts of new connections
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, repository=None, quiet=True):
+    """A threaded server answering from `repository` (port 0 picks a free port)."""
+    handler = type("Handler", (ApiHandler,), {"repository": repository or StudentRepository(), "quiet": quiet})
+    return ApiServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the student records.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--file", default="studentMarks.txt", help="marks file to serve")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, StudentRepository(args.file), quiet=not args.verbose)
+    print(f"Serving student records on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
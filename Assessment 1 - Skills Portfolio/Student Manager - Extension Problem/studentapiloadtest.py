@@ -0,0 +1,121 @@
+import argparse
+import http.client
+import random
+import threading
+import time
+from urllib.parse import quote
+
+from studentapi import DEFAULT_HOST, DEFAULT_PORT, StudentRepository, make_server
+
+# ---------------------------
+# Student API Load Test
+# ---------------------------
+# Fires a mix of lookups, name searches, filters, stats and top-N requests at
+# studentapi.py from several keep-alive client threads and reports requests/s
+# and latency percentiles.
+#
+#   python studentapiloadtest.py                       (starts its own server in-process)
+#   python studentapiloadtest.py --external --port 8767
+#   python studentapiloadtest.py --conditional         (clients send If-None-Match)
+
+FILTERS = ("exam < 40", "grade A", "course > 45 and exam >= 50", "c1 grade B and c2 grade B")
+
+
+def request_mix(students, rng):
+    """A list of request paths in roughly the proportions other tools use."""
+    ids = [s["id"] for s in students] or [0]
+    names = [s["name"] for s in students] or ["x"]
+    paths = []
+    for _ in range(2000):
+        r = rng.random()
+        if r < 0.5:
+            paths.append(f"/students/{rng.choice(ids)}")
+        elif r < 0.7:
+            paths.append(f"/students?name={quote(rng.choice(names).split()[-1])}")
+        elif r < 0.85:
+            paths.append(f"/students?q={quote(rng.choice(FILTERS))}&limit=50")
+        elif r < 0.95:
+            paths.append(f"/top?n={rng.choice((10, 20, 50))}")
+        else:
+            paths.append("/stats")
+    return paths
+
+
+def client(host, port, paths, count, conditional, latencies, failures, rng):
+    conn = http.client.HTTPConnection(host, port)
+    etags = {}
+    for _ in range(count):
+        path = rng.choice(paths)
+        headers = {"If-None-Match": etags[path]} if conditional and path in etags else {}
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException) as e:
+            failures.append(repr(e))
+            conn.close()
+            conn = http.client.HTTPConnection(host, port)
+            continue
+        latencies.append(time.perf_counter() - start)
+        if response.status >= 500:
+            failures.append(f"{response.status} for {path}")
+        etags[path] = response.getheader("ETag", "")
+    conn.close()
+
+
+def run(requests, clients, host, port, external, conditional, seed):
+    repository = StudentRepository()
+    server = None
+    if not external:
+        server = make_server(host, port, repository)
+        port = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    rng = random.Random(seed)
+    paths = request_mix(list(repository.current()[1].by_id.values()), rng)
+    latencies, failures = [], []
+    threads = [threading.Thread(target=client, args=(host, port, paths, requests // clients, conditional,
+                                                     latencies, failures, random.Random(rng.random())))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    if server:
+        server.shutdown()
+        server.server_close()
+
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    print(f"Requests      : {len(latencies)} completed, {len(failures)} failed "
+          f"({clients} clients{', conditional' if conditional else ''}) in {elapsed:.2f}s")
+    print(f"Throughput    : {len(latencies) / elapsed:,.0f} requests/s")
+    if latencies:
+        print(f"Latency (ms)  : p50 {pct(50):.2f}  p95 {pct(95):.2f}  p99 {pct(99):.2f}  max {latencies[-1] * 1000:.2f}")
+    if failures:
+        print(f"First failure : {failures[0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local student API.")
+    parser.add_argument("--requests", type=int, default=20000, help="total requests to send")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent keep-alive connections")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=0, help=f"port (default: any free port, {DEFAULT_PORT} with --external)")
+    parser.add_argument("--external", action="store_true", help="use a server that is already running")
+    parser.add_argument("--conditional", action="store_true", help="send If-None-Match with the last ETag seen")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    port = args.port or (DEFAULT_PORT if args.external else 0)
+    run(args.requests, args.clients, args.host, port, args.external, args.conditional, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,95 +1,83 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import csv
 import statistics
 import os
+import sys
+import time
+
+# shared helpers (resourceloader.py) live in the portfolio folder one level up
+PORTFOLIO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO_DIR not in sys.path:
+    sys.path.insert(0, PORTFOLIO_DIR)
+from gradescheme import DEFAULT_SCHEME
+from portfolioui import Toast, get_font
+from resourceloader import load_parsed, local_path, resource_path
+from studentquery import QueryError, StudentIndex, parse_query
+
+# student cards drawn per page in list views
+PAGE_SIZE = 100
+# default sizes of the Top / Needs Support views (prizes and interventions)
+TOP_N = 20
+BOTTOM_N = 50
 
 # ---------------------------
 # Helper functions & file IO
 # ---------------------------
 
 def calculate_grade(percent):
-    # Simple grade boundaries
-    if percent >= 70:
-        return "A"
-    elif percent >= 60:
-        return "B"
-    elif percent >= 50:
-        return "C"
-    elif percent >= 40:
-        return "D"
-    return "F"
+    # Grade boundaries are shared with the other tools (gradescheme.py)
+    return DEFAULT_SCHEME.grade(percent)
 
 def data_file_path(filename="studentMarks.txt"):
-    return os.path.join(os.path.dirname(__file__), filename)
+    # Edits are saved to this app's own copy; until the first save the shared
+    # copy in "A1 - Resources" is read (see resourceloader.resource_path)
+    return local_path(filename, __file__)
+
+def parse_record(line):
+    """One "id,name,c1,c2,c3,exam" line as a student dict, or None if it is malformed."""
+    parts = line.strip().split(",")
+    if len(parts) < 6:
+        return None
+    sid, name, c1, c2, c3, exam = parts[:6]
+    try:
+        student = {"id": int(sid), "name": name, "c1": int(c1), "c2": int(c2), "c3": int(c3), "exam": int(exam)}
+    except ValueError:
+        # Skip malformed record
+        return None
+    recalc_student_fields(student)
+    return student
+
+def parse_students(filepath):
+    students = []
+    with open(filepath, "r", encoding="utf-8") as f:
+        first = f.readline()
+        if not first:
+            return []
+        try:
+            count = int(first.strip())
+        except:
+            # Fallback: treat first line as a record if count malformed
+            # (but your file is in the correct format, so this is defensive)
+            f.seek(0)
+            records = (parse_record(line) for line in f if line.strip())
+            return [s for s in records if s]
+
+        # Normal path: read exactly 'count' lines (but also safely iterate if file shorter/longer)
+        for _ in range(count):
+            line = f.readline()
+            if not line:
+                break
+            student = parse_record(line)
+            if student:
+                students.append(student)
+    return students
 
 def load_students(filename="studentMarks.txt"):
-    filepath = data_file_path(filename)
-    students = []
+    filepath = resource_path(filename, __file__)
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            first = f.readline()
-            if not first:
-                return []
-            try:
-                count = int(first.strip())
-            except:
-                # Fallback: treat first line as a record if count malformed
-                # (but your file is in the correct format, so this is defensive)
-                f.seek(0)
-                lines = [l.strip() for l in f if l.strip()]
-                for line in lines:
-                    parts = line.split(",")
-                    if len(parts) >= 6:
-                        sid, name, c1, c2, c3, exam = parts[:6]
-                        c1, c2, c3 = int(c1), int(c2), int(c3)
-                        exam = int(exam)
-                        coursework_total = c1 + c2 + c3
-                        overall = (coursework_total + exam) / 160 * 100
-                        students.append({
-                            "id": int(sid),
-                            "name": name,
-                            "c1": c1,
-                            "c2": c2,
-                            "c3": c3,
-                            "course": coursework_total,
-                            "exam": exam,
-                            "overall": overall,
-                            "grade": calculate_grade(overall)
-                        })
-                return students
-
-            # Normal path: read exactly 'count' lines (but also safely iterate if file shorter/longer)
-            for _ in range(count):
-                line = f.readline()
-                if not line:
-                    break
-                line = line.strip()
-                if not line:
-                    continue
-                parts = line.split(",")
-                if len(parts) < 6:
-                    continue
-                sid, name, c1, c2, c3, exam = parts[:6]
-                try:
-                    c1, c2, c3 = int(c1), int(c2), int(c3)
-                    exam = int(exam)
-                except:
-                    # Skip malformed record
-                    continue
-                coursework_total = c1 + c2 + c3
-                overall = (coursework_total + exam) / 160 * 100
-                students.append({
-                    "id": int(sid),
-                    "name": name,
-                    "c1": c1,
-                    "c2": c2,
-                    "c3": c3,
-                    "course": coursework_total,
-                    "exam": exam,
-                    "overall": overall,
-                    "grade": calculate_grade(overall)
-                })
-        return students
+        # parsed results are cached on disk until the file changes
+        return load_parsed(filepath, parse_students)
     except FileNotFoundError:
         messagebox.showerror("File Missing", f"Student file not found: {filepath}")
         return []
@@ -112,13 +100,33 @@ def save_students(students, filename="studentMarks.txt"):
     except Exception as e:
         messagebox.showerror("Save Error", f"Failed to save students to file:\n{e}")
 
+def match_list(matches, limit=6):
+    text = ", ".join(f"{m['id']}:{m['name']}" for m in matches[:limit])
+    return text + (f" and {len(matches) - limit} more" if len(matches) > limit else "")
+
+def ordinal(n):
+    """1 -> "1st", 2 -> "2nd", 11 -> "11th", 23 -> "23rd"."""
+    n = int(round(n))
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+def write_students_csv(path, students, index=None):
+    fields = ["id", "name", "c1", "c2", "c3", "course", "exam", "overall", "grade"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(fields + (["rank"] if index else []))
+        for s in students:
+            row = [s.get(k, "") for k in fields]
+            row[7] = f"{s['overall']:.2f}"
+            writer.writerow(row + ([index.rank(s)[0]] if index else []))
+
 def recalc_student_fields(s):
     s["c1"] = int(s.get("c1", 0))
     s["c2"] = int(s.get("c2", 0))
     s["c3"] = int(s.get("c3", 0))
     s["exam"] = int(s.get("exam", 0))
     s["course"] = s["c1"] + s["c2"] + s["c3"]
-    s["overall"] = (s["course"] + s["exam"]) / 160 * 100
+    s["overall"] = DEFAULT_SCHEME.overall(s["course"], s["exam"])
     s["grade"] = calculate_grade(s["overall"])
 
 # ---------------------------
@@ -134,10 +142,17 @@ class StudentManagerApp:
 
         # Load data
         self.students = load_students()
+        # sorted mark columns for filter queries, kept in step with every edit
+        self.index = StudentIndex(self.students)
 
         # UI
         self.create_sidebar()
         self.create_content_frame()
+        # non-blocking feedback after edits and lookups (portfolioui.Toast)
+        self.toast = Toast(self.root)
+
+    def _font(self, spec):
+        return get_font(self.root, spec)
 
     # Sidebar (menu)
     def create_sidebar(self):
@@ -145,23 +160,24 @@ class StudentManagerApp:
         self.sidebar.pack(side="left", fill="y")
 
         title = tk.Label(self.sidebar, text="Student Manager",
-                         fg="white", bg="#101a33", font=("Segoe UI", 16, "bold"),
+                         fg="white", bg="#101a33", font=self._font(("Segoe UI", 16, "bold")),
                          pady=18)
         title.pack()
 
         menu_items = [
             ("Show All Students", self.show_all_students),
             ("Find Student", self.find_student),
-            ("Top Performer", self.show_best_student),
-            ("Needs Support", self.show_lowest_student),
+            ("Top Performers", self.show_top_students),
+            ("Needs Support", self.show_bottom_students),
             ("Sort Records", self.sort_records),
+            ("Filter Records", self.filter_records),
             ("Add Student", self.add_student),
             ("Delete Student", self.delete_student),
             ("Update Student", self.update_student),
         ]
 
         for text, cmd in menu_items:
-            b = tk.Button(self.sidebar, text=text, font=("Segoe UI", 11),
+            b = tk.Button(self.sidebar, text=text, font=self._font(("Segoe UI", 11)),
                           bg="#172443", fg="white", relief="flat",
                           activebackground="#20335c", activeforeground="white",
                           command=cmd, height=2, width=20)
@@ -179,15 +195,37 @@ class StudentManagerApp:
     # ---------------------------
     # Display helpers
     # ---------------------------
-    def display_students_list(self, students_list):
+    def display_students_list(self, students_list, title_text="Student Records", note=None, page=0):
         self.clear_content()
+        self.build_students_list(self.content, students_list, title_text, note, page)
+
+    def build_students_list(self, parent, students_list, title_text="Student Records", note=None, page=0):
+        # draws into `parent` only, so views with their own controls can redraw just the list
+        for widget in parent.winfo_children():
+            widget.destroy()
 
-        title = tk.Label(self.content, text="Student Records",
-                         fg="white", bg="#0f1625", font=("Segoe UI", 18, "bold"),
+        title = tk.Label(parent, text=title_text,
+                         fg="white", bg="#0f1625", font=self._font(("Segoe UI", 18, "bold")),
                          pady=10)
         title.pack()
-
-        container = tk.Frame(self.content, bg="#0f1625")
+        if note:
+            tk.Label(parent, text=note, fg="#9fb3d1", bg="#0f1625", font=self._font(("Segoe UI", 11))).pack()
+
+        # only one page of cards is built at a time, large cohorts stay responsive
+        pages = max(1, -(-len(students_list) // PAGE_SIZE))
+        page = min(max(page, 0), pages - 1)
+        if pages > 1:
+            nav = tk.Frame(parent, bg="#0f1625")
+            nav.pack(pady=(4, 0))
+            show = lambda p: self.build_students_list(parent, students_list, title_text, note, p)
+            tk.Button(nav, text="◀ Prev", command=lambda: show(page - 1), state="normal" if page else "disabled",
+                      bg="#172443", fg="white", relief="flat").grid(row=0, column=0, padx=6)
+            tk.Label(nav, text=f"Page {page + 1} of {pages}", fg="#c9d5eb", bg="#0f1625",
+                     font=self._font(("Segoe UI", 11))).grid(row=0, column=1, padx=6)
+            tk.Button(nav, text="Next ▶", command=lambda: show(page + 1), state="normal" if page < pages - 1 else "disabled",
+                      bg="#172443", fg="white", relief="flat").grid(row=0, column=2, padx=6)
+
+        container = tk.Frame(parent, bg="#0f1625")
         canvas = tk.Canvas(container, bg="#0f1625", highlightthickness=0)
         scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
         scroll_frame = tk.Frame(canvas, bg="#0f1625")
@@ -201,33 +239,33 @@ class StudentManagerApp:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        for s in students_list:
+        for s in students_list[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]:
             card = tk.Frame(scroll_frame, bg="#162238", padx=15, pady=10)
             card.pack(fill="x", pady=8, padx=20)
 
             tk.Label(card, text=f"{s['name']} ({s['id']})",
-                     fg="white", bg="#162238", font=("Segoe UI", 14, "bold")).pack(anchor="w")
+                     fg="white", bg="#162238", font=self._font(("Segoe UI", 14, "bold"))).pack(anchor="w")
 
             tk.Label(card, text=f"Coursework: {s['course']} / 60",
-                     fg="#b5c6e0", bg="#162238", font=("Segoe UI", 11)).pack(anchor="w")
+                     fg="#b5c6e0", bg="#162238", font=self._font(("Segoe UI", 11))).pack(anchor="w")
 
             tk.Label(card, text=f"Exam Mark: {s['exam']} / 100",
-                     fg="#b5c6e0", bg="#162238", font=("Segoe UI", 11)).pack(anchor="w")
+                     fg="#b5c6e0", bg="#162238", font=self._font(("Segoe UI", 11))).pack(anchor="w")
 
             tk.Label(card, text=f"Overall: {s['overall']:.2f}%",
-                     fg="white", bg="#162238", font=("Segoe UI", 11, "bold")).pack(anchor="w")
+                     fg="white", bg="#162238", font=self._font(("Segoe UI", 11, "bold"))).pack(anchor="w")
 
             tk.Label(card, text=f"Grade: {s['grade']}",
                      fg="#00d27f" if s['grade'] in ("A", "B") else "#ff6b6b",
-                     bg="#162238", font=("Segoe UI", 12)).pack(anchor="w")
+                     bg="#162238", font=self._font(("Segoe UI", 12))).pack(anchor="w")
 
         # Summary
         if students_list:
             avg = statistics.mean([s["overall"] for s in students_list])
         else:
             avg = 0
-        summary = tk.Label(self.content, text=f"Class Size: {len(students_list)} | Average Overall: {avg:.2f}%",
-                           fg="#c9d5eb", bg="#0f1625", font=("Segoe UI", 12), pady=8)
+        summary = tk.Label(parent, text=f"Class Size: {len(students_list)} | Average Overall: {avg:.2f}%",
+                           fg="#c9d5eb", bg="#0f1625", font=self._font(("Segoe UI", 12)), pady=8)
         summary.pack()
 
     # ---------------------------
@@ -239,27 +277,32 @@ class StudentManagerApp:
     def find_student(self):
         self.clear_content()
         tk.Label(self.content, text="Find Student",
-                 fg="white", bg="#0f1625", font=("Segoe UI", 18, "bold")).pack(pady=10)
+                 fg="white", bg="#0f1625", font=self._font(("Segoe UI", 18, "bold"))).pack(pady=10)
 
         search_frame = tk.Frame(self.content, bg="#0f1625")
         search_frame.pack(pady=20)
 
         tk.Label(search_frame, text="Enter Name or ID:",
-                 fg="#ccd5e0", bg="#0f1625", font=("Segoe UI", 12)).grid(row=0, column=0, padx=10)
+                 fg="#ccd5e0", bg="#0f1625", font=self._font(("Segoe UI", 12))).grid(row=0, column=0, padx=10)
 
-        entry = tk.Entry(search_frame, width=30, font=("Segoe UI", 12))
+        entry = tk.Entry(search_frame, width=30, font=self._font(("Segoe UI", 12)))
         entry.grid(row=0, column=1)
 
         def search():
-            query = entry.get().strip().lower()
-            for s in self.students:
-                if query == str(s["id"]) or query in s["name"].lower():
-                    self.display_student_card(s)
-                    return
-            messagebox.showinfo("Not Found", "No matching student found.")
+            query = entry.get().strip()
+            matches, fuzzy = self.index.lookup(query)
+            if not matches:
+                self.toast.info("No matching student found.")
+            elif fuzzy and len(matches) > 1:
+                self.display_students_list(matches, "Did you mean…?",
+                                           note=f"No exact match for '{query}', closest names shown")
+            else:
+                self.display_student_card(matches[0])
+
+        entry.bind("<Return>", lambda e: search())
 
         tk.Button(search_frame, text="Search", command=search,
-                  bg="#1f3c6b", fg="white", font=("Segoe UI", 12), relief="flat").grid(row=0, column=2, padx=10)
+                  bg="#1f3c6b", fg="white", font=self._font(("Segoe UI", 12)), relief="flat").grid(row=0, column=2, padx=10)
 
     def display_student_card(self, s):
         self.clear_content()
@@ -267,46 +310,144 @@ class StudentManagerApp:
         card.pack(pady=30)
 
         tk.Label(card, text=f"{s['name']} ({s['id']})",
-                 fg="white", bg="#162238", font=("Segoe UI", 18, "bold")).pack()
+                 fg="white", bg="#162238", font=self._font(("Segoe UI", 18, "bold"))).pack()
 
         tk.Label(card, text=f"Coursework: {s['course']} / 60",
-                 fg="#b5c6e0", bg="#162238", font=("Segoe UI", 12)).pack(anchor="w")
+                 fg="#b5c6e0", bg="#162238", font=self._font(("Segoe UI", 12))).pack(anchor="w")
 
         tk.Label(card, text=f"Exam Mark: {s['exam']} / 100",
-                 fg="#b5c6e0", bg="#162238", font=("Segoe UI", 12)).pack(anchor="w")
+                 fg="#b5c6e0", bg="#162238", font=self._font(("Segoe UI", 12))).pack(anchor="w")
 
         tk.Label(card, text=f"Overall: {s['overall']:.2f}%",
-                 fg="white", bg="#162238", font=("Segoe UI", 13, "bold")).pack(anchor="w")
+                 fg="white", bg="#162238", font=self._font(("Segoe UI", 13, "bold"))).pack(anchor="w")
 
         tk.Label(card, text=f"Grade: {s['grade']}",
                  fg="#00d27f" if s['grade'] in ("A", "B") else "#ff6b6b",
-                 bg="#162238", font=("Segoe UI", 14)).pack(anchor="w")
+                 bg="#162238", font=self._font(("Segoe UI", 14))).pack(anchor="w")
 
-    def show_best_student(self):
-        if not self.students:
-            messagebox.showinfo("No Data", "No student records available.")
-            return
-        best = max(self.students, key=lambda x: x["overall"])
-        self.display_student_card(best)
+        # cohort standing from the rank index (O(log n))
+        rank, total, percentile = self.index.rank(s)
+        tk.Label(card, text=f"Rank: {rank} of {total}  •  {ordinal(percentile)} percentile",
+                 fg="#9fb3d1", bg="#162238", font=self._font(("Segoe UI", 12))).pack(anchor="w", pady=(6, 0))
+
+    # ---------------------------
+    # Top-N / bottom-N students
+    # ---------------------------
+    def show_top_students(self):
+        self.show_ranked_students(True, TOP_N)
+
+    def show_bottom_students(self):
+        self.show_ranked_students(False, BOTTOM_N)
 
-    def show_lowest_student(self):
+    def show_ranked_students(self, best, n):
         if not self.students:
-            messagebox.showinfo("No Data", "No student records available.")
+            self.toast.info("No student records available.")
+            return
+        self.clear_content()
+        label = "Top" if best else "Bottom"
+
+        controls = tk.Frame(self.content, bg="#0f1625")
+        controls.pack(pady=(12, 0))
+        tk.Label(controls, text=f"{label} N:", fg="#ccd5e0", bg="#0f1625",
+                 font=self._font(("Segoe UI", 12))).grid(row=0, column=0, padx=6)
+        count = tk.IntVar(value=n)
+        spin = tk.Spinbox(controls, from_=1, to=max(len(self.students), 1), textvariable=count,
+                          width=6, font=self._font(("Segoe UI", 12)))
+        spin.grid(row=0, column=1, padx=6)
+        list_frame = tk.Frame(self.content, bg="#0f1625")
+        list_frame.pack(fill="both", expand=True)
+        shown = []
+
+        def refresh():
+            try:
+                size = max(count.get(), 1)
+            except tk.TclError:
+                return
+            # read straight off the index's sorted overall column, no full sort
+            shown[:] = self.index.top(size) if best else self.index.bottom(size)
+            self.build_students_list(list_frame, shown, f"{label} {len(shown)} Students",
+                                     note=f"by overall mark, out of {len(self.index)} students")
+
+        spin.configure(command=refresh)
+        spin.bind("<Return>", lambda e: refresh())
+        tk.Button(controls, text="Show", command=refresh, bg="#1f3c6b", fg="white",
+                  font=self._font(("Segoe UI", 11)), relief="flat").grid(row=0, column=2, padx=6)
+        tk.Button(controls, text="Export CSV", command=lambda: self.export_students_csv(shown, label.lower()),
+                  bg="#1f6fb2", fg="white", font=self._font(("Segoe UI", 11)), relief="flat").grid(row=0, column=3, padx=6)
+        refresh()
+
+    def export_students_csv(self, students_list, name="students"):
+        path = filedialog.asksaveasfilename(parent=self.root, defaultextension=".csv",
+                                            initialfile=f"{name}_{len(students_list)}.csv",
+                                            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            write_students_csv(path, students_list, self.index)
+        except OSError as e:
+            self.toast.error(f"Failed to export students:\n{e}")
             return
-        low = min(self.students, key=lambda x: x["overall"])
-        self.display_student_card(low)
+        self.toast.success(f"{len(students_list)} students written to {path}")
 
     # ---------------------------
     # 5. Sort student records
     # ---------------------------
-    def sort_records(self):
-        # Dialog to choose ascending or descending
-        choice = messagebox.askquestion("Sort Order", "Sort by overall score ascending?\nChoose 'No' for descending.")
-        if choice == "yes":
-            sorted_list = sorted(self.students, key=lambda x: x["overall"], reverse=True)
-        else:
-            sorted_list = sorted(self.students, key=lambda x: x["overall"])
-        self.display_students_list(sorted_list)
+    def sort_records(self, descending=True):
+        # order comes from the index's sorted overall column; the toggle redraws only the list
+        self.clear_content()
+        controls = tk.Frame(self.content, bg="#0f1625")
+        controls.pack(pady=(12, 0))
+        list_frame = tk.Frame(self.content, bg="#0f1625")
+        list_frame.pack(fill="both", expand=True)
+        order = tk.BooleanVar(value=descending)
+
+        def refresh():
+            column = self.index.values["overall"]
+            ordered = [self.index.by_id[sid] for _, sid in (reversed(column) if order.get() else column)]
+            self.build_students_list(list_frame, ordered, "Sorted by Overall Score")
+
+        for col, (text, value) in enumerate((("Highest first", True), ("Lowest first", False))):
+            tk.Radiobutton(controls, text=text, variable=order, value=value, command=refresh, indicatoron=False,
+                           bg="#172443", fg="white", selectcolor="#1f6fb2", activebackground="#20335c",
+                           activeforeground="white", relief="flat", font=self._font(("Segoe UI", 11)), padx=10,
+                           pady=4).grid(row=0, column=col, padx=4)
+        refresh()
+
+    # ---------------------------
+    # Filter records by mark ranges / grades
+    # ---------------------------
+    def filter_records(self):
+        self.clear_content()
+        tk.Label(self.content, text="Filter Records", fg="white", bg="#0f1625",
+                 font=self._font(("Segoe UI", 18, "bold"))).pack(pady=10)
+
+        frame = tk.Frame(self.content, bg="#0f1625")
+        frame.pack(pady=10)
+        tk.Label(frame, text="Conditions:", fg="#ccd5e0", bg="#0f1625", font=self._font(("Segoe UI", 12))).grid(row=0, column=0, padx=6)
+        entry = tk.Entry(frame, width=40, font=self._font(("Segoe UI", 12)))
+        entry.grid(row=0, column=1, padx=6)
+
+        help_text = ("Fields: overall, exam, course, c1, c2, c3   Operators: <  <=  >  >=  =  !=\n"
+                     "Examples:  exam < 40 and course > 45     c1 grade B and c2 grade B     grade A")
+        tk.Label(self.content, text=help_text, fg="#9fb3d1", bg="#0f1625", font=self._font(("Segoe UI", 10)),
+                 justify="left").pack(pady=6)
+
+        def run():
+            text = entry.get().strip()
+            try:
+                conditions = parse_query(text)
+            except QueryError as e:
+                self.toast.error(f"Invalid filter: {e}")
+                return
+            start = time.perf_counter()
+            matches = self.index.query(conditions)
+            elapsed = (time.perf_counter() - start) * 1000
+            self.display_students_list(matches, f"Filter: {text}",
+                                       note=f"{len(matches)} of {len(self.index)} students matched in {elapsed:.2f} ms")
+
+        entry.bind("<Return>", lambda e: run())
+        tk.Button(frame, text="Run", command=run, bg="#1f3c6b", fg="white",
+                  font=self._font(("Segoe UI", 12)), relief="flat").grid(row=0, column=2, padx=6)
 
     # ---------------------------
     # 6. Add a student record
@@ -314,7 +455,7 @@ class StudentManagerApp:
     def add_student(self):
         self.clear_content()
         tk.Label(self.content, text="Add New Student", fg="white", bg="#0f1625",
-                 font=("Segoe UI", 18, "bold")).pack(pady=10)
+                 font=self._font(("Segoe UI", 18, "bold"))).pack(pady=10)
 
         form = tk.Frame(self.content, bg="#0f1625")
         form.pack(pady=10)
@@ -324,8 +465,8 @@ class StudentManagerApp:
         entries = []
 
         for i, lab in enumerate(labels):
-            tk.Label(form, text=lab, fg="#ccd5e0", bg="#0f1625", font=("Segoe UI", 11)).grid(row=i, column=0, pady=6, padx=6, sticky="e")
-            ent = tk.Entry(form, width=30, font=("Segoe UI", 11))
+            tk.Label(form, text=lab, fg="#ccd5e0", bg="#0f1625", font=self._font(("Segoe UI", 11))).grid(row=i, column=0, pady=6, padx=6, sticky="e")
+            ent = tk.Entry(form, width=30, font=self._font(("Segoe UI", 11)))
             ent.grid(row=i, column=1, pady=6, padx=6)
             entries.append(ent)
 
@@ -345,74 +486,63 @@ class StudentManagerApp:
                 c3 = int(entries[4].get().strip())
                 exam = int(entries[5].get().strip())
             except ValueError:
-                messagebox.showerror("Invalid Input", "Please enter valid numeric values for ID, coursework and exam.")
+                self.toast.error("Please enter valid numeric values for ID, coursework and exam.")
                 return
 
             if not name:
-                messagebox.showerror("Invalid Input", "Name cannot be empty.")
+                self.toast.error("Name cannot be empty.")
                 return
 
             # Validate ranges
             if not (0 <= c1 <= 20 and 0 <= c2 <= 20 and 0 <= c3 <= 20 and 0 <= exam <= 100):
-                messagebox.showerror("Invalid Range", "Coursework must be 0-20 each; exam must be 0-100.")
+                self.toast.error("Coursework must be 0-20 each; exam must be 0-100.")
                 return
 
             # Prevent duplicate IDs
             if any(s["id"] == sid for s in self.students):
-                messagebox.showerror("Duplicate ID", f"A student with ID {sid} already exists.")
+                self.toast.error(f"A student with ID {sid} already exists.")
                 return
 
             new_student = {"id": sid, "name": name, "c1": c1, "c2": c2, "c3": c3, "exam": exam}
             recalc_student_fields(new_student)
             self.students.append(new_student)
+            self.index.add(new_student)
             save_students(self.students)
-            messagebox.showinfo("Added", f"Student {name} added.")
+            self.toast.success(f"Student {name} added.")
             self.show_all_students()
 
-        tk.Button(form, text="Add Student", command=do_add, bg="#1f6fb2", fg="white", font=("Segoe UI", 12), relief="flat").grid(row=len(labels), column=0, columnspan=2, pady=12)
+        tk.Button(form, text="Add Student", command=do_add, bg="#1f6fb2", fg="white", font=self._font(("Segoe UI", 12)), relief="flat").grid(row=len(labels), column=0, columnspan=2, pady=12)
 
     # ---------------------------
     # 7. Delete a student record
     # ---------------------------
     def delete_student(self):
         self.clear_content()
-        tk.Label(self.content, text="Delete Student", fg="white", bg="#0f1625", font=("Segoe UI", 18, "bold")).pack(pady=10)
+        tk.Label(self.content, text="Delete Student", fg="white", bg="#0f1625", font=self._font(("Segoe UI", 18, "bold"))).pack(pady=10)
 
         frame = tk.Frame(self.content, bg="#0f1625")
         frame.pack(pady=16)
 
-        tk.Label(frame, text="Enter Student ID or Full Name:", fg="#ccd5e0", bg="#0f1625", font=("Segoe UI", 12)).grid(row=0, column=0, padx=8)
-        entry = tk.Entry(frame, width=30, font=("Segoe UI", 12))
+        tk.Label(frame, text="Enter Student ID or Full Name:", fg="#ccd5e0", bg="#0f1625", font=self._font(("Segoe UI", 12))).grid(row=0, column=0, padx=8)
+        entry = tk.Entry(frame, width=30, font=self._font(("Segoe UI", 12)))
         entry.grid(row=0, column=1, padx=8)
 
         def do_delete():
             key = entry.get().strip()
             if not key:
-                messagebox.showerror("Input Needed", "Please enter an ID or full name.")
+                self.toast.error("Please enter an ID or full name.")
+                return
+            # ID first, then name substring, then closest names (typos)
+            matches, fuzzy = self.index.lookup(key)
+            to_remove = matches[0] if len(matches) == 1 else None
+            if len(matches) > 1:
+                # Multiple matches: ask user to choose by ID
+                heading = "Did you mean" if fuzzy else "Multiple students match"
+                self.toast.info(f"{heading}:\n{match_list(matches)}\nPlease enter the ID to delete.", duration=6000)
                 return
-            # Try ID first
-            to_remove = None
-            try:
-                kid = int(key)
-                for s in self.students:
-                    if s["id"] == kid:
-                        to_remove = s
-                        break
-            except:
-                # search by name (case-insensitive substring)
-                matches = [s for s in self.students if key.lower() in s["name"].lower()]
-                if len(matches) == 0:
-                    to_remove = None
-                elif len(matches) == 1:
-                    to_remove = matches[0]
-                else:
-                    # Multiple matches: ask user to choose by ID
-                    ids = ", ".join(f"{m['id']}:{m['name']}" for m in matches)
-                    messagebox.showinfo("Multiple Matches", f"Multiple students match:\n{ids}\nPlease enter the ID to delete.")
-                    return
 
             if not to_remove:
-                messagebox.showinfo("Not Found", "No matching student found.")
+                self.toast.info("No matching student found.")
                 return
 
             confirm = messagebox.askyesno("Confirm Delete", f"Delete {to_remove['name']} ({to_remove['id']})?")
@@ -420,63 +550,53 @@ class StudentManagerApp:
                 return
 
             self.students = [s for s in self.students if s["id"] != to_remove["id"]]
+            self.index.remove(to_remove)
             save_students(self.students)
-            messagebox.showinfo("Deleted", f"Student {to_remove['name']} removed.")
+            self.toast.success(f"Student {to_remove['name']} removed.")
             self.show_all_students()
 
-        tk.Button(frame, text="Delete", command=do_delete, bg="#c62828", fg="white", font=("Segoe UI", 12), relief="flat").grid(row=1, column=0, columnspan=2, pady=12)
+        tk.Button(frame, text="Delete", command=do_delete, bg="#c62828", fg="white", font=self._font(("Segoe UI", 12)), relief="flat").grid(row=1, column=0, columnspan=2, pady=12)
 
     # ---------------------------
     # 8. Update a student's record
     # ---------------------------
     def update_student(self):
         self.clear_content()
-        tk.Label(self.content, text="Update Student Record", fg="white", bg="#0f1625", font=("Segoe UI", 18, "bold")).pack(pady=10)
+        tk.Label(self.content, text="Update Student Record", fg="white", bg="#0f1625", font=self._font(("Segoe UI", 18, "bold"))).pack(pady=10)
 
         top = tk.Frame(self.content, bg="#0f1625")
         top.pack(pady=8)
-        tk.Label(top, text="Enter ID or Full Name to find:", fg="#ccd5e0", bg="#0f1625", font=("Segoe UI", 12)).grid(row=0, column=0, padx=6)
-        entry = tk.Entry(top, width=30, font=("Segoe UI", 12))
+        tk.Label(top, text="Enter ID or Full Name to find:", fg="#ccd5e0", bg="#0f1625", font=self._font(("Segoe UI", 12))).grid(row=0, column=0, padx=6)
+        entry = tk.Entry(top, width=30, font=self._font(("Segoe UI", 12)))
         entry.grid(row=0, column=1, padx=6)
 
         def find_and_edit():
             key = entry.get().strip()
             if not key:
-                messagebox.showerror("Input Needed", "Please enter a name or an ID to search.")
+                self.toast.error("Please enter a name or an ID to search.")
+                return
+            # ID first, then name substring, then closest names (typos)
+            matches, fuzzy = self.index.lookup(key)
+            found = matches[0] if len(matches) == 1 else None
+            if len(matches) > 1:
+                # multiple matches -> ask for ID
+                heading = "Did you mean" if fuzzy else "Multiple students match"
+                self.toast.info(f"{heading}:\n{match_list(matches)}\nPlease enter the ID to update.", duration=6000)
                 return
-            found = None
-            try:
-                kid = int(key)
-                for s in self.students:
-                    if s["id"] == kid:
-                        found = s
-                        break
-            except:
-                # name match (case-insensitive substring)
-                matches = [s for s in self.students if key.lower() in s["name"].lower()]
-                if len(matches) == 0:
-                    found = None
-                elif len(matches) == 1:
-                    found = matches[0]
-                else:
-                    # multiple matches -> ask for ID
-                    ids = ", ".join(f"{m['id']}:{m['name']}" for m in matches)
-                    messagebox.showinfo("Multiple Matches", f"Multiple students match:\n{ids}\nPlease enter the ID to update.")
-                    return
 
             if not found:
-                messagebox.showinfo("Not Found", "No matching student found.")
+                self.toast.info("No matching student found.")
                 return
 
             # Show edit form for the found student
             self._show_update_form(found)
 
-        tk.Button(top, text="Find", command=find_and_edit, bg="#1f3c6b", fg="white", font=("Segoe UI", 12), relief="flat").grid(row=0, column=2, padx=8)
+        tk.Button(top, text="Find", command=find_and_edit, bg="#1f3c6b", fg="white", font=self._font(("Segoe UI", 12)), relief="flat").grid(row=0, column=2, padx=8)
 
     def _show_update_form(self, student):
         self.clear_content()
         tk.Label(self.content, text=f"Updating: {student['name']} ({student['id']})",
-                 fg="white", bg="#0f1625", font=("Segoe UI", 16, "bold")).pack(pady=10)
+                 fg="white", bg="#0f1625", font=self._font(("Segoe UI", 16, "bold"))).pack(pady=10)
 
         form = tk.Frame(self.content, bg="#0f1625")
         form.pack(pady=6)
@@ -489,8 +609,8 @@ class StudentManagerApp:
         initial = [student.get("name", ""), student.get("c1", 0), student.get("c2", 0), student.get("c3", 0), student.get("exam", 0)]
 
         for i, lab in enumerate(labels):
-            tk.Label(form, text=lab, fg="#ccd5e0", bg="#0f1625", font=("Segoe UI", 11)).grid(row=i, column=0, pady=6, padx=6, sticky="e")
-            ent = tk.Entry(form, width=30, font=("Segoe UI", 11))
+            tk.Label(form, text=lab, fg="#ccd5e0", bg="#0f1625", font=self._font(("Segoe UI", 11))).grid(row=i, column=0, pady=6, padx=6, sticky="e")
+            ent = tk.Entry(form, width=30, font=self._font(("Segoe UI", 11)))
             ent.grid(row=i, column=1, pady=6, padx=6)
             ent.insert(0, str(initial[i]))
             entries.append(ent)
@@ -503,28 +623,30 @@ class StudentManagerApp:
                 c3 = int(entries[3].get().strip())
                 exam = int(entries[4].get().strip())
             except ValueError:
-                messagebox.showerror("Invalid Input", "For the coursework and exam, please enter valid numeric values.")
+                self.toast.error("For the coursework and exam, please enter valid numeric values.")
                 return
 
             if not name:
-                messagebox.showerror("Invalid Input", "Name feild cannot be empty.")
+                self.toast.error("Name feild cannot be empty.")
                 return
             if not (0 <= c1 <= 20 and 0 <= c2 <= 20 and 0 <= c3 <= 20 and 0 <= exam <= 100):
-                messagebox.showerror("Invalid Range", "Coursework must be from 0-20 each and exam must be from 0-100.")
+                self.toast.error("Coursework must be from 0-20 each and exam must be from 0-100.")
                 return
 
-            # Apply changes
+            # Apply changes (re-index with the new marks)
+            self.index.remove(student)
             student["name"] = name
             student["c1"] = c1
             student["c2"] = c2
             student["c3"] = c3
             student["exam"] = exam
             recalc_student_fields(student)
+            self.index.add(student)
             save_students(self.students)
-            messagebox.showinfo("Updated", f"Student {student['name']} updated.")
+            self.toast.success(f"Student {student['name']} updated.")
             self.show_all_students()
 
-        tk.Button(form, text="Save Changes", command=do_update, bg="#1f6fb2", fg="white", font=("Segoe UI", 12), relief="flat").grid(row=len(labels), column=0, columnspan=2, pady=12)
+        tk.Button(form, text="Save Changes", command=do_update, bg="#1f6fb2", fg="white", font=self._font(("Segoe UI", 12)), relief="flat").grid(row=len(labels), column=0, columnspan=2, pady=12)
 
 # ---------------------------
 # Start application
@@ -0,0 +1,207 @@
+import bisect
+import re
+
+from gradescheme import COURSE_MAX, DEFAULT_SCHEME, EXAM_MAX, GRADES
+from namesearch import NameIndex
+
+# ---------------------------
+# Student filter queries
+# ---------------------------
+# StudentIndex keeps one sorted column per mark field, so a range predicate
+# such as "exam < 40" is two bisects instead of a scan of every student.
+# Columns are updated in place when students are added, edited or deleted.
+# A Fenwick tree over overall marks gives each student's rank and percentile,
+# and a NameIndex (namesearch.py) answers typo-tolerant name lookups.
+#
+# Query text is a list of conditions joined by "and":
+#   exam < 40 and course > 45
+#   c1 grade B and c2 grade B            (grade of a single module)
+#   grade A                              (overall grade)
+#   overall >= 60 and overall <= 70
+
+FIELDS = ("overall", "exam", "course", "c1", "c2", "c3")
+# maximum mark per field, used to turn a grade into a mark range
+FIELD_MAX = {"overall": 100, "exam": 100, "course": 60, "c1": 20, "c2": 20, "c3": 20}
+# grade -> [low, high) percentage, matching calculate_grade
+GRADE_BANDS = DEFAULT_SCHEME.bands()
+OPS = ("<=", ">=", "!=", "<", ">", "=")
+
+CONDITION_RE = re.compile(
+    r"^\s*(?:(?P<field>[a-z0-9]+)\s+)?grade\s*=?\s*(?P<grade>[a-z])\s*$"
+    r"|^\s*(?P<rfield>[a-z0-9]+)\s*(?P<op><=|>=|!=|<|>|==?)\s*(?P<value>-?\d+(?:\.\d+)?)\s*$",
+    re.IGNORECASE)
+
+
+# overall is (course + exam) / 160 * 100, so the integer total 0..160 orders students exactly
+MAX_TOTAL = COURSE_MAX + EXAM_MAX
+
+
+class QueryError(ValueError):
+    pass
+
+
+def parse_query(text):
+    """Turn query text into a list of (field, low, high, low_inclusive, high_inclusive, negate)."""
+    conditions = []
+    for part in re.split(r"\s+and\s+", text.strip(), flags=re.IGNORECASE):
+        if not part.strip():
+            continue
+        m = CONDITION_RE.match(part)
+        if not m:
+            raise QueryError(f"Can't understand '{part.strip()}'")
+        if m.group("grade"):
+            field = (m.group("field") or "overall").lower()
+            if field not in FIELDS:
+                raise QueryError(f"Unknown field '{field}'")
+            grade = m.group("grade").upper()
+            if grade not in GRADE_BANDS:
+                raise QueryError(f"Unknown grade '{grade}' (use {', '.join(GRADES)})")
+            lo, hi = GRADE_BANDS[grade]
+            scale = FIELD_MAX[field] / 100
+            conditions.append((field, lo * scale, hi * scale, True, False, False))
+            continue
+        field, op, value = m.group("rfield").lower(), m.group("op"), float(m.group("value"))
+        if field not in FIELDS:
+            raise QueryError(f"Unknown field '{field}'")
+        inf = float("inf")
+        conditions.append({
+            "<": (field, -inf, value, True, False, False),
+            "<=": (field, -inf, value, True, True, False),
+            ">": (field, value, inf, False, True, False),
+            ">=": (field, value, inf, True, True, False),
+            "=": (field, value, value, True, True, False),
+            "==": (field, value, value, True, True, False),
+            "!=": (field, value, value, True, True, True),
+        }[op])
+    if not conditions:
+        raise QueryError("Enter at least one condition")
+    return conditions
+
+
+class RankTree:
+    """Fenwick tree counting students per total mark: O(log n) update and rank."""
+
+    def __init__(self, size=MAX_TOTAL + 1):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+
+    def bucket(self, s):
+        return min(max(int(s["course"] + s["exam"]), 0), self.size - 1)
+
+    def update(self, s, delta):
+        i = self.bucket(s) + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+        self.total += delta
+
+    def count_upto(self, bucket):
+        """Students with a total at or below `bucket`."""
+        i, n = bucket + 1, 0
+        while i > 0:
+            n += self.tree[i]
+            i -= i & -i
+        return n
+
+    def rank(self, s):
+        """Return (rank, cohort size, percentile); equal marks share a rank."""
+        at_or_below = self.count_upto(self.bucket(s))
+        above = self.total - at_or_below
+        percentile = 100 * at_or_below / self.total if self.total else 0
+        return above + 1, self.total, percentile
+
+
+class StudentIndex:
+    def __init__(self, students=()):
+        self.by_id = {}
+        self.values = {f: [] for f in FIELDS}   # sorted (value, id) pairs per field
+        self.ranks = RankTree()
+        self._names = None      # built on the first fuzzy lookup
+        for s in students:
+            self.by_id[s["id"]] = s
+        for f in FIELDS:
+            self.values[f] = sorted((s[f], s["id"]) for s in self.by_id.values())
+        for s in self.by_id.values():
+            self.ranks.update(s, 1)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def add(self, s):
+        self.by_id[s["id"]] = s
+        for f in FIELDS:
+            bisect.insort(self.values[f], (s[f], s["id"]))
+        self.ranks.update(s, 1)
+        if self._names is not None:
+            self._names.add(s)
+
+    def remove(self, s):
+        """Remove a student; call before changing its marks so the old values are found."""
+        if self.by_id.pop(s["id"], None) is not None:
+            self.ranks.update(s, -1)
+            if self._names is not None:
+                self._names.remove(s)
+        for f in FIELDS:
+            column = self.values[f]
+            i = bisect.bisect_left(column, (s[f], s["id"]))
+            if i < len(column) and column[i] == (s[f], s["id"]):
+                del column[i]
+
+    @property
+    def names(self):
+        if self._names is None:
+            self._names = NameIndex(self.by_id.values())
+        return self._names
+
+    def rank(self, s):
+        return self.ranks.rank(s)
+
+    def lookup(self, key):
+        """Find students by ID (exact), name substring, or failing that a fuzzy name match.
+
+        Returns (students, fuzzy) where fuzzy says the typo-tolerant search was used.
+        """
+        key = key.strip()
+        if key.isdigit():
+            s = self.by_id.get(int(key))
+            return ([s] if s else []), False
+        lowered = key.lower()
+        matches = [s for s in self.by_id.values() if lowered in s["name"].lower()]
+        if matches:
+            return matches, False
+        return self.names.search(key), True
+
+    def top(self, n):
+        """The n highest overall marks, best first, read off the sorted column in O(n)."""
+        column = self.values["overall"]
+        return [self.by_id[sid] for _, sid in reversed(column[max(len(column) - n, 0):])]
+
+    def bottom(self, n):
+        """The n lowest overall marks, lowest first."""
+        return [self.by_id[sid] for _, sid in self.values["overall"][:max(n, 0)]]
+
+    def _range(self, field, lo, hi, lo_inc, hi_inc):
+        column = self.values[field]
+        inf = float("inf")
+        # (value, -inf) sorts before every id with that value, (value, inf) after
+        start = bisect.bisect_left(column, (lo, -inf) if lo_inc else (lo, inf))
+        end = bisect.bisect_right(column, (hi, inf) if hi_inc else (hi, -inf))
+        return column[start:end]
+
+    def query(self, conditions):
+        """Students matching every condition, ordered by the most selective condition's field."""
+        ranges = []
+        excluded = set()
+        for field, lo, hi, lo_inc, hi_inc, negate in conditions:
+            if negate:
+                excluded.update(sid for _, sid in self._range(field, lo, hi, lo_inc, hi_inc))
+            else:
+                ranges.append(self._range(field, lo, hi, lo_inc, hi_inc))
+        if not ranges:
+            ranges.append(self.values["overall"])
+        ranges.sort(key=len)
+        # intersect with sets built from the other (larger) ranges only when needed
+        keep = [set(sid for _, sid in r) for r in ranges[1:]]
+        return [self.by_id[sid] for _, sid in ranges[0]
+                if sid not in excluded and all(sid in k for k in keep)]
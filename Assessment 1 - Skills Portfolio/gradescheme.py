@@ -0,0 +1,55 @@
+# ---------------------------
+# Shared grading rule
+# ---------------------------
+# The one place the overall percentage and grade boundaries are defined; both
+# student managers and the what-if simulator (gradesim.py) use it.
+#
+# overall = (course * course_weight + exam * exam_weight)
+#           / (60 * course_weight + 100 * exam_weight) * 100
+#
+# With both weights 1 this is the course's (course + exam) / 160 * 100.
+
+COURSE_MAX = 60
+EXAM_MAX = 100
+GRADES = ("A", "B", "C", "D", "F")
+BOUNDARIES = (("A", 70), ("B", 60), ("C", 50), ("D", 40))   # lowest percentage for each grade
+
+
+class GradingScheme:
+    def __init__(self, name="current", course_weight=1, exam_weight=1, boundaries=BOUNDARIES):
+        self.name = name
+        self.course_weight = course_weight
+        self.exam_weight = exam_weight
+        self.boundaries = tuple(sorted(boundaries, key=lambda b: -b[1]))
+        self.total = COURSE_MAX * course_weight + EXAM_MAX * exam_weight
+
+    @classmethod
+    def from_share(cls, coursework_share, boundaries=BOUNDARIES, name=None):
+        """A scheme where coursework is worth coursework_share percent of the overall mark."""
+        name = name or f"cw{coursework_share:g}%"
+        return cls(name, coursework_share / COURSE_MAX, (100 - coursework_share) / EXAM_MAX, boundaries)
+
+    def __repr__(self):
+        return f"GradingScheme({self.name!r})"
+
+    def overall(self, course, exam):
+        return (course * self.course_weight + exam * self.exam_weight) / self.total * 100
+
+    def grade(self, percent):
+        for grade, low in self.boundaries:
+            if percent >= low:
+                return grade
+        return "F"
+
+    def bands(self):
+        """grade -> (low, high) percentage range, low inclusive."""
+        bands = {}
+        high = float("inf")
+        for grade, low in self.boundaries:
+            bands[grade] = (low, high)
+            high = low
+        bands["F"] = (float("-inf"), high)
+        return bands
+
+
+DEFAULT_SCHEME = GradingScheme()
@@ -0,0 +1,158 @@
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import tkinter as tk
+
+from portfolioui import ensure_theme, get_font
+
+# ---------------------------
+# Portfolio Launcher
+# ---------------------------
+# Hosts the Math Quiz, the Joke Assistant and the Student Manager in one Tk
+# process. Each app opens in its own Toplevel window and its module is only
+# imported the first time it is opened. All three use portfolioui's font cache,
+# so they share one set of Font objects, and the ttk theme is chosen once here
+# because it applies to every window in the process.
+#
+#   python launcher.py            (open the launcher)
+#   python launcher.py --report   (compare startup time and memory with separate processes)
+
+PORTFOLIO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# key -> (window title, folder, module file, app class)
+APPS = {
+    "quiz": ("Math Quiz", "Exercise 1 - Math Quiz", "mathquiz.py", "MathQuizApp"),
+    "jokes": ("Alexa Tell Me A Joke", "Exercise 2 - Alexa tell me a Joke", "alexatellmeajoke.py", "JokeApp"),
+    "students": ("Student Manager", "Student Manager - Extension Problem", "studentmanagerextension.py", "StudentManagerApp"),
+}
+
+BG = "#0f1724"
+CARD = "#172443"
+
+
+def load_app_class(key):
+    """Import an app's module on first use and return its app class."""
+    _, folder, filename, class_name = APPS[key]
+    module_name = os.path.splitext(filename)[0]
+    module = sys.modules.get(module_name)
+    if module is None:
+        folder_path = os.path.join(PORTFOLIO_DIR, folder)
+        # the apps import their helper modules (quizrules, jokestore, ...) from their own folder
+        if folder_path not in sys.path:
+            sys.path.insert(0, folder_path)
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(folder_path, filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
+def current_rss_kb():
+    """Resident memory of this process in KB, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except ImportError:
+        return None
+
+
+class Launcher:
+    def __init__(self, root):
+        self.root = root
+        self.windows = {}
+        root.title("Skills Portfolio")
+        root.geometry("380x300")
+        root.configure(bg=BG)
+        root.resizable(False, False)
+        ensure_theme(root)
+
+        tk.Label(root, text="Skills Portfolio", fg="white", bg=BG,
+                 font=get_font(root, ("Segoe UI Semibold", 18))).pack(pady=(24, 14))
+        for key, (title, *_rest) in APPS.items():
+            tk.Button(root, text=title, width=24, height=2, bg=CARD, fg="white", relief="flat",
+                      activebackground="#20335c", activeforeground="white",
+                      font=get_font(root, ("Segoe UI", 11)),
+                      command=lambda k=key: self.open_app(k)).pack(pady=5)
+
+    def open_app(self, key):
+        window = self.windows.get(key)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return window
+        app_class = load_app_class(key)
+        window = tk.Toplevel(self.root)
+        window.app = app_class(window)
+        self.windows[key] = window
+        return window
+
+
+# ---------------------------
+# Startup / memory report
+# ---------------------------
+def child(keys):
+    """Start the given apps in this process and print 'seconds rss_kb' once they are drawn."""
+    start = time.perf_counter()
+    root = tk.Tk()
+    launcher = Launcher(root)
+    for key in keys:
+        launcher.open_app(key)
+    root.update()
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.6f} {current_rss_kb() or 0}", flush=True)
+    root.destroy()
+
+
+def spawn(keys):
+    """Run child() in a fresh interpreter; returns (wall seconds incl. interpreter start, in-process seconds, rss KB)."""
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", *keys],
+                         cwd=PORTFOLIO_DIR, capture_output=True, text=True, check=True).stdout
+    wall = time.perf_counter() - start
+    seconds, rss = out.split()
+    return wall, float(seconds), int(rss)
+
+
+def report():
+    print("Startup and memory: three separate processes vs one launcher process")
+    print(f"  {'':<28}{'wall ms':>10}{'in-app ms':>12}{'RSS MB':>10}")
+    totals = [0.0, 0.0, 0]
+    for key, (title, *_rest) in APPS.items():
+        wall, seconds, rss = spawn([key])
+        totals = [totals[0] + wall, totals[1] + seconds, totals[2] + rss]
+        print(f"  {title:<28}{wall * 1000:>10.1f}{seconds * 1000:>12.1f}{rss / 1024:>10.1f}")
+    print(f"  {'separate (sum)':<28}{totals[0] * 1000:>10.1f}{totals[1] * 1000:>12.1f}{totals[2] / 1024:>10.1f}")
+    wall, seconds, rss = spawn(list(APPS))
+    print(f"  {'launcher (all three)':<28}{wall * 1000:>10.1f}{seconds * 1000:>12.1f}{rss / 1024:>10.1f}")
+    if totals[2] and rss:
+        print(f"  memory saved: {(totals[2] - rss) / 1024:.1f} MB, "
+              f"startup saved: {(totals[0] - wall) * 1000:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open the portfolio apps from one window.")
+    parser.add_argument("--report", action="store_true", help="compare against running the apps separately")
+    parser.add_argument("--child", nargs="+", choices=list(APPS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+    elif args.report:
+        report()
+    else:
+        root = tk.Tk()
+        Launcher(root)
+        root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+import argparse
+import fnmatch
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from launcher import PORTFOLIO_DIR, current_rss_kb, load_app_class
+from perfharness import ensure_display, pump_until
+
+# ---------------------------
+# Memory Profiling Mode
+# ---------------------------
+# Opt-in profiler for the portfolio apps. Each subsystem's load, render and
+# edit operations run between tracemalloc snapshots:
+#   retained  Python memory still held after the operation (and a gc pass)
+#   peak      highest traced memory reached while it ran
+#   top       the source lines that retained the most
+# Screens are then rebuilt repeatedly (show_all_students / clear_content,
+# the quiz's _build_menu / _clear_root, load_joke); memory that keeps growing
+# with every rebuild is reported as a possible leak.
+#
+# tracemalloc only sees Python allocations; widgets live mostly in Tk's own
+# memory, so the process RSS change is recorded next to each measurement.
+#
+#   python memprofile.py                                 (report to memprofile.json next to this script)
+#   python memprofile.py --students 50000 --jokes 500000 --rebuilds 20
+#   python memprofile.py --json new.json --compare memprofile.json
+#   python memprofile.py --no-gui                        (data structures only)
+
+TOP_LINES = 6
+FRAMES = 4
+LEAK_BYTES_PER_REBUILD = 2048
+REPORT_FILE = os.path.join(PORTFOLIO_DIR, "memprofile.json")
+IGNORED = (tracemalloc.__file__, fnmatch.__file__)     # the profiler's own snapshot bookkeeping
+
+
+# ---------------------------
+# Measurement
+# ---------------------------
+def where(frame):
+    path = os.path.relpath(frame.filename, PORTFOLIO_DIR)
+    return f"{frame.filename if path.startswith('..') else path}:{frame.lineno}"
+
+
+def snapshot():
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, f, all_frames=True) for f in IGNORED])
+
+
+class Profiler:
+    def __init__(self):
+        self.sections = []
+        self.rebuilds = []
+        self.peak = 0       # whole run; measure() resets tracemalloc's own peak
+
+    def measure(self, subsystem, name, action):
+        """Run action() between snapshots, record what it retained and its peak; returns its result."""
+        before = snapshot()
+        rss_before = current_rss_kb() or 0
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        result = action()
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peak = max(self.peak, peak)
+        peak -= base
+        stats = snapshot().compare_to(before, "lineno")
+        self.sections.append({
+            "subsystem": subsystem,
+            "name": name,
+            "retained_kb": round(sum(s.size_diff for s in stats) / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "rss_kb": (current_rss_kb() or 0) - rss_before,
+            "top": [{"where": where(s.traceback[0]), "kb": round(s.size_diff / 1024, 1), "blocks": s.count_diff}
+                    for s in stats[:TOP_LINES] if s.size_diff > 0],
+        })
+        return result
+
+    def rebuild(self, subsystem, name, action, times):
+        """Repeat a screen rebuild and record how much memory each repetition keeps."""
+        action()        # first build creates caches (fonts, styles) that are meant to stay
+        before = snapshot()
+        for _ in range(times):
+            action()
+        stats = snapshot().compare_to(before, "traceback")
+        growth = sum(s.size_diff for s in stats)
+        self.rebuilds.append({
+            "subsystem": subsystem,
+            "name": name,
+            "rebuilds": times,
+            "growth_kb": round(growth / 1024, 1),
+            "per_rebuild_bytes": growth // max(times, 1),
+            "possible_leak": growth / max(times, 1) > LEAK_BYTES_PER_REBUILD,
+            "top": [{"where": " <- ".join(where(f) for f in s.traceback[:FRAMES]),
+                     "kb": round(s.size_diff / 1024, 1)}
+                    for s in stats[:TOP_LINES] if s.size_diff > 0],
+        })
+
+
+# ---------------------------
+# Test data
+# ---------------------------
+def write_students(folder, n, rng):
+    path = os.path.join(folder, "studentMarks.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"{n}\n")
+        for i in range(n):
+            f.write(f"{1000 + i},Student {i} {rng.choice('ABCDEFGH')}son,{rng.randint(0, 20)},"
+                    f"{rng.randint(0, 20)},{rng.randint(0, 20)},{rng.randint(0, 100)}\n")
+    return path
+
+
+def write_jokes(folder, n):
+    path = os.path.join(folder, "jokes.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(f"Why did joke number {i} cross the road?Because it was number {i}.\n")
+    return path
+
+
+# ---------------------------
+# Subsystems
+# ---------------------------
+def profile_students(prof, tk, path, rebuilds):
+    app_class = prof.measure("students", "import modules", lambda: load_app_class("students"))
+    module = sys.modules[app_class.__module__]
+    from studentquery import StudentIndex
+
+    students = prof.measure("students", "parse student records", lambda: module.parse_students(path))
+    index = prof.measure("students", "build filter/rank indexes", lambda: StudentIndex(students))
+    prof.measure("students", "build fuzzy name index", lambda: index.names)
+
+    def edits():
+        for i in range(1000):
+            s = {"id": 10_000_000 + i, "name": f"New Student {i}", "c1": 10, "c2": 10, "c3": 10, "exam": 50}
+            module.recalc_student_fields(s)
+            index.add(s)
+        for i in range(0, 1000, 2):
+            s = index.by_id[10_000_000 + i]
+            index.remove(s)
+            s["exam"] = 80
+            module.recalc_student_fields(s)
+            index.add(s)
+        for i in range(1, 1000, 2):
+            index.remove(index.by_id[10_000_000 + i])
+    prof.measure("students", "1000 adds, 500 updates, 500 deletes", edits)
+    if tk is None:
+        return
+
+    root = tk.Tk()
+    app = prof.measure("students", "create window", lambda: app_class(root))
+    app.students, app.index = students, index
+
+    def show_all():
+        app.show_all_students()
+        root.update()
+    prof.measure("students", "render student list page", show_all)
+    prof.measure("students", "render student card", lambda: (app.display_student_card(students[-1]), root.update()))
+    prof.rebuild("students", "show_all_students (clear_content)", show_all, rebuilds)
+    prof.rebuild("students", "top-N view", lambda: (app.show_top_students(), root.update()), rebuilds)
+    root.destroy()
+
+
+def profile_quiz(prof, tk, rebuilds):
+    app_class = prof.measure("quiz", "import modules", lambda: load_app_class("quiz"))
+    if tk is None:
+        return
+    root = tk.Tk()
+    app = prof.measure("quiz", "create window and menu canvas", lambda: (app_class(root), root.update())[0])
+
+    def quiz_screen():
+        app._start_quiz("moderate")
+        pump_until(root, lambda: app.session.current_q == 1)
+    prof.measure("quiz", "build quiz screen", quiz_screen)
+
+    def menu_and_quiz():
+        app._build_menu()
+        root.update()
+        quiz_screen()
+    prof.rebuild("quiz", "menu -> quiz screen (_clear_root)", menu_and_quiz, rebuilds)
+    root.destroy()
+
+
+def profile_jokes(prof, tk, path, rebuilds):
+    app_class = prof.measure("jokes", "import modules", lambda: load_app_class("jokes"))
+    from jokepicker import JokePicker, RatingsStore
+    from jokeprefetch import CorpusSource
+    from jokesearch import JokeSearchIndex
+    from jokestore import open_corpus
+
+    corpus = open_corpus(path)
+    prof.measure("jokes", "load joke corpus", corpus.refresh)
+    picker = JokePicker(corpus, RatingsStore(os.path.join(os.path.dirname(path), "ratings.json")))
+    prof.measure("jokes", "first joke (shuffle queue)", picker.next_joke)
+    picker.set_mode("weighted")
+    prof.measure("jokes", "first joke (weighted table)", picker.next_joke)
+    picker.set_mode("shuffle")
+    search = JokeSearchIndex(path)
+    prof.measure("jokes", "build search index", search.refresh)
+    prof.measure("jokes", "100 searches", lambda: [search.search(f"number {i}") for i in range(100)])
+    if tk is None:
+        return
+
+    root = tk.Tk()
+    app = prof.measure("jokes", "create window", lambda: (app_class(root, CorpusSource(picker)), root.update())[0])
+
+    def load_joke():
+        pump_until(root, lambda: len(app.prefetch.ready) > 0)
+        app.load_joke()
+        root.update()
+    prof.rebuild("jokes", "load_joke", load_joke, rebuilds * 5)
+    root.destroy()
+
+
+# ---------------------------
+# Report
+# ---------------------------
+def print_report(report):
+    print(f"{'subsystem':<10}{'operation':<40}{'retained KB':>13}{'peak KB':>11}{'RSS KB':>10}")
+    for s in report["sections"]:
+        print(f"{s['subsystem']:<10}{s['name']:<40}{s['retained_kb']:>13,.1f}{s['peak_kb']:>11,.1f}{s['rss_kb']:>10,}")
+    print()
+    totals = {}
+    for s in report["sections"]:
+        totals[s["subsystem"]] = totals.get(s["subsystem"], 0) + s["retained_kb"]
+    print("Retained by subsystem: " + ", ".join(f"{k} {v / 1024:,.1f} MB" for k, v in totals.items()))
+    print(f"Peak traced memory for the whole run: {report['peak_kb'] / 1024:,.1f} MB")
+    if report["rebuilds"]:
+        print()
+        print(f"{'subsystem':<10}{'repeated rebuild':<40}{'growth KB':>11}{'B/rebuild':>11}")
+        for r in report["rebuilds"]:
+            flag = "  possible leak" if r["possible_leak"] else ""
+            print(f"{r['subsystem']:<10}{r['name']:<40}{r['growth_kb']:>11,.1f}{r['per_rebuild_bytes']:>11,}{flag}")
+            if r["possible_leak"]:
+                for t in r["top"][:3]:
+                    print(f"{'':<12}{t['kb']:>8,.1f} KB  {t['where']}")
+
+
+def compare(report, old):
+    """Print the change in retained/peak memory against an earlier report."""
+    previous = {(s["subsystem"], s["name"]): s for s in old.get("sections", [])}
+    print(f"\nCompared with {old.get('created', 'previous report')} "
+          f"(students {old['sizes']['students']}, jokes {old['sizes']['jokes']}):")
+    for s in report["sections"]:
+        p = previous.get((s["subsystem"], s["name"]))
+        if p:
+            print(f"  {s['subsystem']:<10}{s['name']:<40}retained {s['retained_kb'] - p['retained_kb']:>+10,.1f} KB"
+                  f"   peak {s['peak_kb'] - p['peak_kb']:>+10,.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the memory used by each part of the portfolio apps.")
+    parser.add_argument("--students", type=int, default=20_000, help="students in the generated cohort")
+    parser.add_argument("--jokes", type=int, default=100_000, help="jokes in the generated corpus")
+    parser.add_argument("--rebuilds", type=int, default=10, help="repeated screen rebuilds for the leak check")
+    parser.add_argument("--only", choices=["students", "quiz", "jokes"], action="append", help="profile only these apps")
+    parser.add_argument("--no-gui", action="store_true", help="skip the window/rendering measurements")
+    parser.add_argument("--json", default=REPORT_FILE, help="report file to write (default: memprofile.json here)")
+    parser.add_argument("--compare", help="earlier report to compare against")
+    args = parser.parse_args()
+
+    tk, xvfb = None, None
+    if not args.no_gui:
+        try:
+            xvfb = ensure_display()
+            import tkinter as tk
+            tk.Tk().destroy()
+        except (SystemExit, Exception) as e:
+            print(f"GUI measurements skipped: {e}", file=sys.stderr)
+            tk = None
+
+    rng = random.Random(1)
+    prof = Profiler()
+    tracemalloc.start(FRAMES)
+    try:
+        # generated data files (and the search index written beside them) are removed afterwards
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as folder:
+            apps = args.only or ["students", "quiz", "jokes"]
+            if "students" in apps:
+                profile_students(prof, tk, write_students(folder, args.students, rng), args.rebuilds)
+            if "quiz" in apps:
+                profile_quiz(prof, tk, args.rebuilds)
+            if "jokes" in apps:
+                profile_jokes(prof, tk, write_jokes(folder, args.jokes), args.rebuilds)
+            peak = max(prof.peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+        if xvfb:
+            xvfb.terminate()
+
+    report = {"created": time.strftime("%Y-%m-%d %H:%M:%S"),
+              "sizes": {"students": args.students, "jokes": args.jokes, "rebuilds": args.rebuilds},
+              "gui": tk is not None,
+              "python": sys.version.split()[0],
+              "peak_kb": round(peak / 1024, 1),
+              "sections": prof.sections,
+              "rebuilds": prof.rebuilds}
+    print_report(report)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(report, json.load(f))
+    with open(args.json, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from launcher import load_app_class
+
+# ---------------------------
+# Headless GUI Performance Harness
+# ---------------------------
+# Starts each app (under Xvfb when there is no display), scripts the same
+# actions a user would take and measures event-to-render latency (the action
+# plus the Tk update that draws it) and widget counts. Any measurement over its
+# budget fails the run with exit code 1.
+#
+#   python perfharness.py                                  (default sizes and budgets)
+#   python perfharness.py --students 5000 --jokes 200000
+#   python perfharness.py --budgets mybudgets.json --json results.json
+
+# p95 latency budgets in ms, and widget count budgets, at the default data sizes
+DEFAULT_BUDGETS = {
+    "students.show_all_ms": 1500,
+    "students.show_all_widgets": 20000,
+    "students.find_ms": 100,
+    "students.card_ms": 50,
+    "quiz.build_screen_ms": 150,
+    "quiz.submit_ms": 60,
+    "quiz.widgets": 60,
+    "jokes.load_joke_ms": 30,
+    "jokes.widgets": 40,
+}
+REPEATS = 5
+
+
+# ---------------------------
+# Display / measurement helpers
+# ---------------------------
+def ensure_display():
+    """Use the current display, or start Xvfb; returns the Xvfb process (or None)."""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        sys.exit("No display available and Xvfb is not installed (e.g. apt install xvfb).")
+    display = f":{random.randint(100, 900)}"
+    proc = subprocess.Popen([xvfb, display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+    return proc
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def timed(root, action):
+    """Run an action and the redraw it triggers; returns milliseconds."""
+    start = time.perf_counter()
+    action()
+    root.update()
+    return (time.perf_counter() - start) * 1000
+
+
+def p95(samples):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+
+
+def pump_until(root, condition, timeout=3.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.005)
+
+
+# ---------------------------
+# Scenarios
+# ---------------------------
+def students_scenario(tk, size, results):
+    module_class = load_app_class("students")
+    module = sys.modules[module_class.__module__]
+    from studentquery import StudentIndex
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "studentMarks.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"{size}\n")
+            for i in range(size):
+                f.write(f"{1000 + i},Student {i},{rng.randint(0, 20)},{rng.randint(0, 20)},"
+                        f"{rng.randint(0, 20)},{rng.randint(0, 100)}\n")
+        students = module.parse_students(path)
+
+    root = tk.Tk()
+    app = module_class(root)
+    app.students = students
+    app.index = StudentIndex(app.students)
+    buttons = {b.cget("text"): b for b in app.sidebar.winfo_children() if isinstance(b, tk.Button)}
+
+    results["students.show_all_ms"] = p95([timed(root, buttons["Show All Students"].invoke) for _ in range(REPEATS)])
+    results["students.show_all_widgets"] = count_widgets(app.content)
+
+    def find():
+        buttons["Find Student"].invoke()
+        entry = next(w for w in app.content.winfo_children()[1].winfo_children() if isinstance(w, tk.Entry))
+        entry.insert(0, f"Student {size - 1}")
+        next(w for w in app.content.winfo_children()[1].winfo_children() if isinstance(w, tk.Button)).invoke()
+    results["students.find_ms"] = p95([timed(root, find) for _ in range(REPEATS)])
+    results["students.card_ms"] = p95([timed(root, lambda: app.display_student_card(app.students[-1]))
+                                       for _ in range(REPEATS)])
+    root.destroy()
+
+
+def quiz_scenario(tk, size, results):
+    root = tk.Tk()
+    app = load_app_class("quiz")(root)
+    build = []
+    submit = []
+    for _ in range(REPEATS):
+        build.append(timed(root, lambda: app._start_quiz("moderate")))
+        pump_until(root, lambda: app.session.current_q == 1)
+        results["quiz.widgets"] = count_widgets(root)
+        for q in range(1, 4):
+            app.answer_var.set(str(app.session.answer))
+            submit.append(timed(root, app._submit_answer))
+            pump_until(root, lambda: app.session.current_q > q)
+    results["quiz.build_screen_ms"] = p95(build)
+    results["quiz.submit_ms"] = p95(submit)
+    root.destroy()
+
+
+def jokes_scenario(tk, size, results):
+    app_class = load_app_class("jokes")
+    from jokepicker import JokePicker, RatingsStore
+    from jokeprefetch import CorpusSource
+    from jokestore import open_corpus
+
+    # the joke file stays open (or memory-mapped) while the app runs, hence ignore_cleanup_errors
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+        path = os.path.join(tmp, "jokes.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(size):
+                f.write(f"Why did joke number {i} cross the road?Because it was number {i}.\n")
+        picker = JokePicker(open_corpus(path), RatingsStore(os.path.join(tmp, "ratings.json")))
+
+        root = tk.Tk()
+        app = app_class(root, CorpusSource(picker))
+        samples = []
+        for _ in range(REPEATS * 4):
+            pump_until(root, lambda: len(app.prefetch.ready) > 0)
+            samples.append(timed(root, app.load_joke))
+        results["jokes.load_joke_ms"] = p95(samples)
+        results["jokes.widgets"] = count_widgets(root)
+        root.destroy()
+
+
+SCENARIOS = {"students": students_scenario, "quiz": quiz_scenario, "jokes": jokes_scenario}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless performance checks for the portfolio apps.")
+    parser.add_argument("--students", type=int, default=1000, help="students in the generated cohort")
+    parser.add_argument("--jokes", type=int, default=100_000, help="jokes in the generated corpus")
+    parser.add_argument("--only", choices=list(SCENARIOS), action="append", help="run only these apps")
+    parser.add_argument("--budgets", help="JSON file overriding DEFAULT_BUDGETS")
+    parser.add_argument("--json", help="also write the measurements to this file")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    if args.budgets:
+        with open(args.budgets, "r", encoding="utf-8") as f:
+            budgets.update(json.load(f))
+
+    xvfb = ensure_display()
+    try:
+        import tkinter as tk
+        sizes = {"students": args.students, "quiz": 0, "jokes": args.jokes}
+        results = {}
+        for name in args.only or SCENARIOS:
+            SCENARIOS[name](tk, sizes[name], results)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+    failed = 0
+    print(f"{'measurement':<30}{'value':>12}{'budget':>12}")
+    for key, value in results.items():
+        budget = budgets.get(key)
+        over = budget is not None and value > budget
+        failed += over
+        print(f"{key:<30}{value:>12.1f}{budget if budget is not None else '-':>12}  {'FAIL' if over else 'ok'}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"sizes": vars(args), "results": results, "budgets": budgets}, f, indent=2)
+    print(f"{failed} budget(s) exceeded" if failed else "All budgets met")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
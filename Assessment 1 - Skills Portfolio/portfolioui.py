@@ -0,0 +1,155 @@
+# ---------------------------
+# Shared UI helpers
+# ---------------------------
+# Used by the apps and by launcher.py, which hosts all of them in one Tk
+# process: anything cached here is created once per Tk interpreter and then
+# shared between every app window in it.
+
+from collections import deque
+
+_FONT_CACHE = {}
+_THEMED = set()
+THEME = "clam"
+
+def get_font(root, spec):
+    """Return a Font for a (family, size, *styles) tuple, created once per Tk interpreter."""
+    key = (id(root.tk), spec)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        from tkinter import font as tkfont
+        family, size, *styles = spec
+        font = tkfont.Font(root=root, family=family, size=size,
+                           weight="bold" if "bold" in styles else "normal",
+                           slant="italic" if "italic" in styles else "roman")
+        _FONT_CACHE[key] = font
+    return font
+
+
+def ensure_theme(root):
+    """Select the portfolio's ttk theme, once per Tk interpreter.
+
+    The theme applies to every window in the interpreter, so apps call this
+    instead of theme_use() and the launcher calls it before opening any of them.
+    """
+    if id(root.tk) in _THEMED:
+        return
+    from tkinter import ttk
+    ttk.Style(root).theme_use(THEME)
+    _THEMED.add(id(root.tk))
+
+
+# ---------------------------
+# Toast messages
+# ---------------------------
+# Non-modal replacement for messagebox.showinfo/showwarning on busy paths:
+# the message appears in a strip at the bottom of the window, disappears on
+# its own and never blocks the event loop. Messages that arrive while one is
+# showing wait in a short queue; repeats of the same text are merged into
+# one message with a count instead of queueing again.
+# Keep messagebox.askyesno for confirmations that destroy data.
+
+TOAST_COLOURS = {"info": "#1f3c6b", "success": "#1d7a55", "warning": "#9a6a12", "error": "#a23232"}
+
+
+class Toast:
+    def __init__(self, parent, duration=2500, max_queued=5, font=("Segoe UI", 11)):
+        self.parent = parent
+        self.duration = duration
+        self.font = font
+        self.queue = deque(maxlen=max_queued)      # [text, kind, duration, count]
+        self.current = None
+        self.label = None
+        self.timer = None
+
+    def show(self, text, kind="info", duration=None):
+        duration = duration or self.duration
+        if self.current is not None and self.current[:2] == [text, kind]:
+            self.current[3] += 1
+            self._draw()
+            self._restart_timer(self.current[2])
+            return
+        for queued in self.queue:
+            if queued[:2] == [text, kind]:
+                queued[3] += 1
+                return
+        self.queue.append([text, kind, duration, 1])
+        if self.current is None:
+            self._next()
+
+    # aliases matching the messagebox calls they replace
+    def info(self, text, duration=None):
+        self.show(text, "info", duration)
+
+    def success(self, text, duration=None):
+        self.show(text, "success", duration)
+
+    def warning(self, text, duration=None):
+        self.show(text, "warning", duration)
+
+    def error(self, text, duration=None):
+        # errors stay up twice as long by default
+        self.show(text, "error", duration or self.duration * 2)
+
+    def redraw(self):
+        """Show the current message again after a screen rebuild destroyed its label."""
+        if self.current is not None and self._alive(self.parent):
+            self._draw()
+
+    def clear(self):
+        self.queue.clear()
+        self.current = None
+        self._cancel_timer()
+        if self._alive(self.label):
+            self.label.place_forget()
+
+    def _next(self):
+        if not self._alive(self.parent):
+            self.queue.clear()
+            self.current = None
+            return
+        self.current = self.queue.popleft() if self.queue else None
+        if self.current is None:
+            if self._alive(self.label):
+                self.label.place_forget()
+            return
+        self._draw()
+        self._restart_timer(self.current[2])
+
+    def _draw(self):
+        import tkinter as tk
+        text, kind, _, count = self.current
+        if not self._alive(self.label):
+            # screens that clear every child of the window take the old label with them
+            self.label = tk.Label(self.parent, fg="white", padx=16, pady=8, justify="left",
+                                  font=get_font(self.parent, self.font), wraplength=520)
+            self.label.bind("<Button-1>", lambda e: self._dismiss())
+        self.label.config(text=text if count == 1 else f"{text}   ×{count}", bg=TOAST_COLOURS.get(kind, TOAST_COLOURS["info"]))
+        self.label.place(relx=0.5, rely=1.0, y=-16, anchor="s")
+        self.label.lift()
+
+    def _dismiss(self):
+        self._cancel_timer()
+        self._next()
+
+    def _restart_timer(self, duration):
+        self._cancel_timer()
+        try:
+            self.timer = self.parent.after(duration, self._dismiss)
+        except Exception:
+            # the window has been destroyed
+            self.timer = None
+
+    def _cancel_timer(self):
+        if self.timer is not None:
+            try:
+                self.parent.after_cancel(self.timer)
+            except Exception:
+                pass
+            self.timer = None
+
+    @staticmethod
+    def _alive(widget):
+        try:
+            return widget is not None and bool(widget.winfo_exists())
+        except Exception:
+            return False
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import time
+
+# ---------------------------
+# Shared resource loading
+# ---------------------------
+# Used by every app in the portfolio to find its data files and to cache parsed
+# results on disk.
+#
+# Data files live once in "A1 - Resources". An app may keep its own copy next
+# to its script (e.g. after the student manager saves edits); that local copy
+# then takes priority over the shared one.
+#
+# load_parsed() stores the parser's result under .cache/, keyed by the file's
+# path, size and mtime (or a content hash), so later launches skip parsing.
+# The least recently used entries are removed once the cache passes
+# CACHE_MAX_BYTES.
+
+PORTFOLIO_DIR = os.path.dirname(os.path.abspath(__file__))
+RESOURCES_DIR = os.path.join(PORTFOLIO_DIR, "A1 - Resources")
+CACHE_DIR = os.path.join(PORTFOLIO_DIR, ".cache")
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def resource_path(filename, app_file=None):
+    """Path to read a data file from: the app's own copy if it has one, else the shared one."""
+    if app_file:
+        local = local_path(filename, app_file)
+        if os.path.exists(local):
+            return local
+    return os.path.join(RESOURCES_DIR, filename)
+
+
+def local_path(filename, app_file):
+    """Path of the app's own (writable) copy of a data file, next to the app script."""
+    return os.path.join(os.path.dirname(os.path.abspath(app_file)), filename)
+
+
+def file_signature(path, content_hash=False):
+    st = os.stat(path)
+    if content_hash:
+        with open(path, "rb") as f:
+            return st.st_size, hashlib.sha1(f.read()).hexdigest()
+    return st.st_size, st.st_mtime_ns
+
+
+def _cache_file(path, parser, version):
+    # keyed on the file defining the parser: apps run as __main__ share a module name
+    source = os.path.abspath(parser.__code__.co_filename)
+    key = f"{os.path.abspath(path)}|{source}:{parser.__qualname__}|{version}"
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pickle")
+
+
+def prune_cache(max_bytes=CACHE_MAX_BYTES, keep=None):
+    """Delete the least recently used cache entries (never `keep`) until the cache fits in max_bytes."""
+    files, total = [], 0
+    try:
+        for e in os.scandir(CACHE_DIR):
+            st = e.stat()
+            if e.name.endswith(".tmp"):
+                if st.st_mtime < time.time() - 3600:     # left behind by a process that died mid-write
+                    os.remove(e.path)
+                continue
+            total += st.st_size
+            if e.path != keep:
+                files.append((st.st_mtime, st.st_size, e.path))
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            os.remove(path)
+            total -= size
+    except OSError:
+        pass
+
+
+def load_parsed(path, parser, version=1, content_hash=False):
+    """Return parser(path), reusing the on-disk cache while the file is unchanged.
+
+    Bump `version` when the parser's output format changes. Errors raised by the
+    parser propagate unchanged; a broken or unreadable cache is simply rebuilt.
+    """
+    signature = file_signature(path, content_hash)
+    cache_file = _cache_file(path, parser, version)
+    try:
+        with open(cache_file, "rb") as f:
+            cached_signature, result = pickle.load(f)
+        if cached_signature == signature:
+            try:
+                os.utime(cache_file)        # recently used, so prune_cache() keeps it
+            except OSError:
+                pass
+            return result
+    except Exception:
+        pass
+
+    result = parser(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump((signature, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        prune_cache(keep=cache_file)
+    except OSError:
+        # a read-only install still works, just without the cache
+        pass
+    return result